@@ -0,0 +1,89 @@
+import json
+import os
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from .logging_functions import get_logger
+
+logger = get_logger(__name__)
+
+# Kayıt formatı değiştiğinde artırılır; farklı sürümler yüklenmez
+ARTIFACT_VERSION = 2
+
+STATE_FILE = 'pipeline_state.joblib'
+SCHEMA_FILE = 'schema.json'
+
+# full_preprocessing_pipeline sonucundan saklanan öğrenilmiş durum
+# (transform_with_pipeline_state temizleme ve eksik değer aşamalarını da bu durumla yeniden üretir)
+PIPELINE_STATE_KEYS = ['feature_columns', 'scaler', 'encoding_info', 'outlier_info', 'missing_value_state',
+                       'fill_values', 'clean_medians']
+
+def save_pipeline_artifacts(state, folder='results/artifacts'):
+    """
+    Öğrenilmiş pipeline durumunu sürümlü bir artifact olarak kaydeder
+
+    state: full_preprocessing_pipeline'ın döndürdüğü sözlük veya fit edilmiş
+    PreprocessingTransformer. Durum joblib ile, şema (sürüm, özellik sütunları,
+    kütüphane sürümleri) JSON olarak yazılır.
+    """
+    os.makedirs(folder, exist_ok=True)
+
+    if isinstance(state, dict):
+        kind = 'pipeline_state'
+        payload = {key: state[key] for key in PIPELINE_STATE_KEYS}
+        feature_columns = list(state['feature_columns'])
+        if payload['clean_medians'] is None:
+            logger.warning("Temizleme medianları yok; artifact yalnızca temizlenmiş kayıtları dönüştürebilir")
+    else:
+        kind = 'transformer'
+        payload = state
+        feature_columns = list(state.feature_columns_)
+
+    # Sıkıştırmasız kayıt, yüklemeyi hızlı tutar
+    joblib.dump(payload, os.path.join(folder, STATE_FILE))
+
+    schema = {
+        'artifact_version': ARTIFACT_VERSION,
+        'kind': kind,
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'feature_columns': feature_columns,
+        'library_versions': {
+            'numpy': np.__version__,
+            'pandas': pd.__version__,
+            'scikit-learn': sklearn.__version__
+        }
+    }
+    with open(os.path.join(folder, SCHEMA_FILE), 'w', encoding='utf-8') as f:
+        json.dump(schema, f, ensure_ascii=False, indent=2)
+
+    logger.info(f"Pipeline artifact'ı {folder} klasörüne kaydedildi ({kind}, sürüm {ARTIFACT_VERSION})")
+    return folder
+
+def load_pipeline_artifacts(folder='results/artifacts'):
+    """
+    save_pipeline_artifacts ile kaydedilen durumu yükler
+
+    Eğitim verisine ihtiyaç duymaz. Şema sürümü veya özellik sütunları
+    uyuşmazsa ValueError verir.
+    """
+    with open(os.path.join(folder, SCHEMA_FILE), encoding='utf-8') as f:
+        schema = json.load(f)
+
+    if schema.get('artifact_version') != ARTIFACT_VERSION:
+        raise ValueError(f"Desteklenmeyen artifact sürümü: {schema.get('artifact_version')} (beklenen {ARTIFACT_VERSION})")
+
+    payload = joblib.load(os.path.join(folder, STATE_FILE))
+
+    if schema['kind'] == 'pipeline_state':
+        feature_columns = list(payload['feature_columns'])
+    else:
+        feature_columns = list(payload.feature_columns_)
+
+    if feature_columns != schema['feature_columns']:
+        raise ValueError("Artifact şeması ile kayıtlı özellik sütunları uyuşmuyor")
+
+    return payload
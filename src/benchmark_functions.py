@@ -0,0 +1,485 @@
+import pandas as pd
+import numpy as np
+import time
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+
+import matplotlib.pyplot as plt
+
+from .artifact_functions import load_pipeline_artifacts
+from .data_loader import (
+    extract_numbers_from_text,
+    compute_clean_medians,
+    clean_all_numeric_columns_advanced,
+    clean_categorical_columns,
+    clean_text_columns,
+    full_data_cleaning_pipeline,
+    full_data_cleaning_pipeline_chunked,
+    load_data,
+    optimize_dtypes,
+    basic_info,
+    save_dataframe
+)
+from .eda_functions import (
+    missing_data_analysis,
+    target_analysis,
+    categorical_analysis,
+    numerical_analysis,
+    text_analysis,
+    complete_eda
+)
+from .incremental_functions import incremental_update
+from .logging_functions import get_logger, quiet, verbosity
+from .preprocessing_functions import (
+    advanced_missing_value_handler,
+    outlier_detection_and_treatment,
+    advanced_feature_engineering,
+    smart_encoding,
+    feature_scaling,
+    multi_hot_encoding,
+    create_model_ready_dataset,
+    full_preprocessing_pipeline,
+    partitioned_preprocessing,
+    transform_with_pipeline_state,
+    PARTITION_SCALE_TOLERANCE
+)
+from .preprocessing_transformer import PreprocessingTransformer
+from .profiling_functions import StageProfiler
+from .sketch_functions import build_category_sketches, build_quantile_sketches
+from .synthetic_functions import generate_synthetic_dataset
+
+logger = get_logger(__name__)
+
+def _time_call(func, *args, repeat=3, **kwargs):
+    """
+    Fonksiyonu birkaç kez çalıştırıp en iyi süreyi ve sonucu döndürür
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def _same_output(left, right):
+    """
+    İki fonksiyon çıktısının (DataFrame, Series, dizi, sözlük, liste) aynı olup olmadığı
+    """
+    if isinstance(left, (pd.DataFrame, pd.Series)):
+        return type(left) is type(right) and left.equals(right)
+    if isinstance(left, np.ndarray):
+        return isinstance(right, np.ndarray) and np.array_equal(left, right)
+    if isinstance(left, dict):
+        return (isinstance(right, dict) and list(left) == list(right)
+                and all(_same_output(left[key], right[key]) for key in left))
+    if isinstance(left, (list, tuple)):
+        return (type(left) is type(right) and len(left) == len(right)
+                and all(_same_output(a, b) for a, b in zip(left, right)))
+    if isinstance(left, float) and isinstance(right, float) and np.isnan(left) and np.isnan(right):
+        return True
+    return bool(left == right)
+
+@contextlib.contextmanager
+def _plot_timer():
+    """
+    Benchmark süresince Agg (ekrana çizmeyen) backend'ini kullanır ve
+    plt.savefig çağrılarının (PNG çizimi) toplam süresini ölçer
+
+    Dönen sözlüğün 'seconds' değeri çağıran tarafından sıfırlanabilir.
+    """
+    timer = {'seconds': 0.0}
+    previous_backend = plt.get_backend()
+    savefig = plt.savefig
+
+    def timed_savefig(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return savefig(*args, **kwargs)
+        finally:
+            timer['seconds'] += time.perf_counter() - start
+
+    plt.switch_backend('Agg')
+    plt.savefig = timed_savefig
+    try:
+        yield timer
+    finally:
+        plt.savefig = savefig
+        plt.close('all')
+        plt.switch_backend(previous_backend)
+
+@contextlib.contextmanager
+def _working_directory(path):
+    """
+    Geçici çalışma klasörü (pipeline'lar results/ klasörüne göreli yazar)
+    """
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+def benchmark_number_extraction(n_rows=1_000_000, repeat=3, random_state=42):
+    """
+    extract_numbers_from_text için eski (apply) ve vektörel yöntemi karşılaştırır
+    """
+    logger.info(f"SAYI ÇIKARMA BENCHMARK ({n_rows:,} satır)")
+    logger.info("=" * 50)
+
+    # TedaviSuresi / UygulamaSuresi benzeri değerler
+    rng = np.random.default_rng(random_state)
+    templates = np.array([f"{n} Seans" for n in range(1, 38)] + [f"{n} Dakika" for n in (3, 5, 8, 10, 15, 20, 25, 30, 45)])
+    values = pd.Series(templates[rng.integers(0, len(templates), n_rows)], dtype=object)
+    values[rng.random(n_rows) < 0.05] = np.nan
+
+    results = {}
+    outputs = {}
+    for method in ['apply', 'vectorized']:
+        elapsed, outputs[method] = _time_call(extract_numbers_from_text, values, method=method, repeat=repeat)
+        results[method] = {'seconds': elapsed, 'rows_per_sec': n_rows / elapsed}
+        logger.info(f"{method}: {elapsed:.3f} sn, {n_rows / elapsed:,.0f} satır/sn")
+
+    identical = outputs['apply'].equals(outputs['vectorized'])
+    speedup = results['apply']['seconds'] / results['vectorized']['seconds']
+    logger.info(f"Sonuçlar aynı mı: {identical}")
+    logger.info(f"Hızlanma: {speedup:.1f}x")
+
+    results['identical'] = identical
+    results['speedup'] = speedup
+    return results
+
+def benchmark_imputation(df, columns=None, missing_rate=0.1, methods=('knn', 'tree', 'group_median'), random_state=42):
+    """
+    Sayısal imputation yöntemlerini süre ve doğruluk (RMSE) açısından karşılaştırır
+
+    Bilinen değerlerin missing_rate kadarı rastgele silinir, her yöntemle
+    doldurulur ve gerçek değerlerle karşılaştırılır.
+    """
+    logger.info(f"IMPUTATION BENCHMARK ({len(df):,} satır, %{missing_rate * 100:.0f} eksik)")
+    logger.info("=" * 50)
+
+    if columns is None:
+        columns = [col for col in df.select_dtypes(include=[np.number]).columns
+                   if col not in ('TedaviSuresi', 'HastaNo')]
+
+    rng = np.random.default_rng(random_state)
+    masked = df.copy()
+    truth = df[columns].to_numpy(dtype=float)
+    mask = (rng.random(truth.shape) < missing_rate) & ~np.isnan(truth)
+    masked[columns] = np.where(mask, np.nan, truth)
+
+    results = {}
+    for method in methods:
+        with quiet():
+            elapsed, imputed = _time_call(advanced_missing_value_handler, masked, imputation=method, repeat=1)
+        predicted = imputed[columns].to_numpy(dtype=float)
+        rmse = np.sqrt(np.mean((predicted[mask] - truth[mask]) ** 2))
+        results[method] = {'seconds': elapsed, 'rmse': rmse}
+        logger.info(f"{method}: {elapsed:.3f} sn, RMSE: {rmse:.3f}")
+
+    return results
+
+def benchmark_parallel_columns(df, n_jobs_list=(1, 8, 16, 32), repeat=1):
+    """
+    Sütun bazlı paralel aşamaların işçi sayısına göre ölçeklenmesini ölçer
+
+    Her aşama farklı n_jobs değerleriyle çalıştırılır; süre, n_jobs=1'e göre
+    hızlanma ve döndürülen değerin (DataFrame veya sütun özetleri) seri
+    sonuçla aynı olup olmadığı raporlanır. Aşamalar INFO düzeyinde çalışır
+    (özetler yalnızca bu düzeyde hesaplanır), çıktıları yazılmaz; grafikler
+    Agg backend'iyle çizilir. Etkin işçi sayısı sütun sayısıyla sınırlıdır.
+    """
+    logger.info(f"PARALEL SÜTUN BENCHMARK ({len(df):,} satır, {os.cpu_count()} çekirdek)")
+    logger.info("=" * 50)
+
+    stages = {
+        'clean_categorical_columns': lambda n_jobs: clean_categorical_columns(df, n_jobs=n_jobs, backend='thread'),
+        'clean_text_columns': lambda n_jobs: clean_text_columns(df, n_jobs=n_jobs, backend='process'),
+        'categorical_analysis': lambda n_jobs: categorical_analysis(df, n_jobs=n_jobs, backend='thread'),
+        'text_analysis': lambda n_jobs: text_analysis(df, n_jobs=n_jobs, backend='process')
+    }
+
+    results = {}
+    for stage, run in stages.items():
+        results[stage] = {}
+        baseline_time = None
+        baseline_output = None
+        for n_jobs in n_jobs_list:
+            # Özetler hesaplansın ama yazılmasın; grafikler ekrana çizilmesin
+            with verbosity('INFO'), contextlib.redirect_stdout(io.StringIO()), _plot_timer():
+                elapsed, output = _time_call(run, n_jobs, repeat=repeat)
+            if baseline_time is None:
+                baseline_time, baseline_output = elapsed, output
+            identical = _same_output(output, baseline_output)
+            results[stage][n_jobs] = {
+                'seconds': elapsed,
+                'speedup': baseline_time / elapsed,
+                'identical': identical
+            }
+            logger.info(f"{stage} n_jobs={n_jobs}: {elapsed:.3f} sn, hızlanma {baseline_time / elapsed:.2f}x, "
+                  f"aynı çıktı: {results[stage][n_jobs]['identical']}")
+
+    return results
+
+def _single_process_preprocessing(df, target_col='TedaviSuresi', imputation='knn'):
+    """
+    full_preprocessing_pipeline'ın 1-5. aşamaları (tek süreç, dosya kaydetmeden)
+    """
+    df_step1 = advanced_missing_value_handler(df, target_col, imputation=imputation)
+    df_step2, outlier_info = outlier_detection_and_treatment(df_step1, target_col)
+    df_step3 = advanced_feature_engineering(df_step2, target_col=target_col)
+    df_step4, encoding_info = smart_encoding(df_step3, target_col)
+    df_step5, scaler = feature_scaling(df_step4, target_col, scaling_method='standard')
+    return df_step5, outlier_info, encoding_info, scaler
+
+def benchmark_partitioned_preprocessing(df, partition_by='Bolum', n_partitions=8, n_jobs_list=(1, 8, 16, 32),
+                                        imputation='tree', target_col='TedaviSuresi'):
+    """
+    Bölümlenmiş ön işlemeyi tek süreçli sonuçla karşılaştırır
+
+    Her n_jobs için süre ve hızlanma, ayrıca çıktının eşdeğer olup olmadığı
+    raporlanır: ölçeklenmeyen sütunlar, outlier_info ve encoding_info birebir
+    ('exact'), ölçeklenen sütunlar PARTITION_SCALE_TOLERANCE toleransıyla
+    karşılaştırılır ('equivalent'); en büyük mutlak fark da verilir.
+    """
+    logger.info(f"BÖLÜMLENMİŞ ÖN İŞLEME BENCHMARK ({len(df):,} satır, {partition_by}, {os.cpu_count()} çekirdek)")
+    logger.info("=" * 50)
+
+    with quiet():
+        baseline_time, baseline = _time_call(_single_process_preprocessing, df, target_col, imputation, repeat=1)
+    expected, expected_outliers, expected_encoding, expected_scaler = baseline
+    scaled_cols = list(expected_scaler.feature_names_in_) if expected_scaler is not None else []
+    logger.info(f"tek süreç: {baseline_time:.3f} sn")
+
+    results = {'single_process': {'seconds': baseline_time}}
+    for n_jobs in n_jobs_list:
+        with quiet():
+            elapsed, output = _time_call(partitioned_preprocessing, df, target_col, imputation=imputation,
+                                         partition_by=partition_by, n_partitions=n_partitions,
+                                         n_jobs=n_jobs, repeat=1)
+        actual, outlier_info, encoding_info, _, _ = output
+
+        same_columns = list(actual.columns) == list(expected.columns) and actual.index.equals(expected.index)
+        exact = same_columns and all(actual[col].equals(expected[col])
+                                     for col in expected.columns if col not in scaled_cols)
+        exact = exact and outlier_info == expected_outliers and repr(encoding_info) == repr(expected_encoding)
+        max_diff = float(np.abs(actual[scaled_cols].to_numpy(dtype=float) -
+                                expected[scaled_cols].to_numpy(dtype=float)).max()) if same_columns and scaled_cols else np.nan
+        equivalent = exact and (not scaled_cols or np.allclose(actual[scaled_cols].to_numpy(dtype=float),
+                                                               expected[scaled_cols].to_numpy(dtype=float),
+                                                               rtol=PARTITION_SCALE_TOLERANCE,
+                                                               atol=PARTITION_SCALE_TOLERANCE))
+
+        results[n_jobs] = {
+            'seconds': elapsed,
+            'speedup': baseline_time / elapsed,
+            'exact': exact,
+            'equivalent': bool(equivalent),
+            'scaled_max_abs_diff': max_diff
+        }
+        logger.info(f"n_jobs={n_jobs}: {elapsed:.3f} sn, hızlanma {baseline_time / elapsed:.2f}x, "
+              f"ölçeklenmeyenler birebir: {exact}, eşdeğer (tolerans {PARTITION_SCALE_TOLERANCE:g}): {equivalent}, "
+              f"ölçekli sütun farkı: {max_diff:.2e}")
+
+    return results
+
+# Ölçek benchmark'ında ölçülen fonksiyonlar: ad -> (modül, girdi aşaması, çağrı)
+# Girdi aşamaları: raw (load_data çıktısı gibi), raw_csv (ham verinin CSV yolu),
+# clean, imputed, engineered, encoded, scaled, fitted_transformer
+# (PreprocessingTransformer, clean), pipeline_state (clean, artifact durumu),
+# incremental (yeni yığın, bu çalıştırmaya ait durum klasörü).
+# Dosya yazan fonksiyonlar geçici çalışma klasörüne yazar.
+SCALE_BENCHMARK_CASES = {
+    'load_data': ('data_loader', 'raw_csv', load_data),
+    'save_dataframe': ('data_loader', 'clean', lambda df: save_dataframe(df, 'benchmark_clean.csv')),
+    'extract_numbers_from_text': ('data_loader', 'raw', lambda df: extract_numbers_from_text(df['TedaviSuresi'])),
+    'clean_all_numeric_columns_advanced': ('data_loader', 'raw', clean_all_numeric_columns_advanced),
+    'clean_categorical_columns': ('data_loader', 'raw', clean_categorical_columns),
+    'clean_text_columns': ('data_loader', 'raw', clean_text_columns),
+    'full_data_cleaning_pipeline': ('data_loader', 'raw', full_data_cleaning_pipeline),
+    'full_data_cleaning_pipeline_chunked': ('data_loader', 'raw_csv',
+                                            lambda path: full_data_cleaning_pipeline_chunked(
+                                                path, output_file='benchmark_chunked.csv')),
+    'optimize_dtypes': ('data_loader', 'scaled', optimize_dtypes),
+    'basic_info': ('data_loader', 'raw', basic_info),
+    'missing_data_analysis': ('eda_functions', 'clean', missing_data_analysis),
+    'target_analysis': ('eda_functions', 'clean', target_analysis),
+    'categorical_analysis': ('eda_functions', 'clean', categorical_analysis),
+    'numerical_analysis': ('eda_functions', 'clean', numerical_analysis),
+    'text_analysis': ('eda_functions', 'clean', text_analysis),
+    'complete_eda': ('eda_functions', 'clean', complete_eda),
+    'advanced_missing_value_handler': ('preprocessing_functions', 'clean',
+                                       lambda df: advanced_missing_value_handler(df, imputation='tree')),
+    'outlier_detection_and_treatment': ('preprocessing_functions', 'imputed', outlier_detection_and_treatment),
+    'advanced_feature_engineering': ('preprocessing_functions', 'imputed', advanced_feature_engineering),
+    'smart_encoding': ('preprocessing_functions', 'engineered', smart_encoding),
+    'feature_scaling': ('preprocessing_functions', 'encoded', feature_scaling),
+    'multi_hot_encoding': ('preprocessing_functions', 'clean', multi_hot_encoding),
+    'create_model_ready_dataset': ('preprocessing_functions', 'scaled', create_model_ready_dataset),
+    'full_preprocessing_pipeline': ('preprocessing_functions', 'clean',
+                                    lambda df: full_preprocessing_pipeline(df, imputation='tree')),
+    'transform_with_pipeline_state': ('preprocessing_functions', 'pipeline_state',
+                                      lambda inputs: transform_with_pipeline_state(*inputs)),
+    'PreprocessingTransformer.transform': ('preprocessing_transformer', 'fitted_transformer',
+                                           lambda inputs: inputs[0].transform(inputs[1])),
+    'incremental_update': ('incremental_functions', 'incremental',
+                           lambda inputs: incremental_update(inputs[0], state_folder=inputs[1])),
+    'build_quantile_sketches': ('sketch_functions', 'clean', build_quantile_sketches),
+    'build_category_sketches': ('sketch_functions', 'clean', build_category_sketches)
+}
+
+# incremental_update benchmark'ında yeni yığının toplam veriye oranı
+INCREMENTAL_BATCH_FRACTION = 0.1
+
+def _build_pipeline_state(inputs):
+    full_preprocessing_pipeline(inputs['clean'], imputation='tree', artifacts_folder='benchmark_artifacts',
+                                clean_medians=compute_clean_medians(inputs['raw']))
+    return inputs['clean'], load_pipeline_artifacts('benchmark_artifacts')
+
+def _build_incremental(inputs):
+    raw = inputs['raw']
+    n_history = len(raw) - max(1, int(len(raw) * INCREMENTAL_BATCH_FRACTION))
+    incremental_update(raw.iloc[:n_history], state_folder='benchmark_incremental')
+    return raw.iloc[n_history:], 'benchmark_incremental'
+
+# Girdi aşaması -> (gerekli aşama, hazırlama); aşamalar ilk gerektiğinde bir kez hazırlanır
+_INPUT_BUILDERS = {
+    'raw_csv': ('raw', lambda inputs: save_dataframe(inputs['raw'], 'benchmark_raw.csv', folder='.')),
+    'clean': ('raw', lambda inputs: clean_text_columns(clean_categorical_columns(
+        clean_all_numeric_columns_advanced(inputs['raw'])))),
+    'imputed': ('clean', lambda inputs: advanced_missing_value_handler(inputs['clean'], imputation='tree')),
+    'engineered': ('imputed', lambda inputs: advanced_feature_engineering(
+        outlier_detection_and_treatment(inputs['imputed'])[0])),
+    'encoded': ('engineered', lambda inputs: smart_encoding(inputs['engineered'])[0]),
+    'scaled': ('encoded', lambda inputs: feature_scaling(inputs['encoded'])[0]),
+    'fitted_transformer': ('clean', lambda inputs: (PreprocessingTransformer(imputation='tree').fit(inputs['clean']),
+                                                    inputs['clean'])),
+    'pipeline_state': ('clean', _build_pipeline_state),
+    'incremental': ('raw', _build_incremental)
+}
+
+def _benchmark_input(inputs, stage):
+    """
+    Aşama girdisini (sessiz modda, gerekirse önceki aşamalarla birlikte) bir kez hazırlar
+    """
+    if stage not in inputs:
+        required, build = _INPUT_BUILDERS[stage]
+        _benchmark_input(inputs, required)
+        with quiet():
+            inputs[stage] = build(inputs)
+    return inputs[stage]
+
+def _run_input(stage, prepared):
+    """
+    Çalıştırma girdisi; durum değiştiren aşamalar her çalıştırmada temiz bir kopyadan başlar
+    """
+    if stage != 'incremental':
+        return prepared
+    batch, base_folder = prepared
+    run_folder = base_folder + '_run'
+    shutil.rmtree(run_folder, ignore_errors=True)
+    shutil.copytree(base_folder, run_folder)
+    return batch, run_folder
+
+def benchmark_at_scale(scales=(10_000, 100_000, 1_000_000), functions=None, repeat=1, trace_memory=True,
+                       verbose=False, template=None, random_state=42, json_path=None, work_dir=None):
+    """
+    Public fonksiyonları ve pipeline giriş noktalarını sentetik veri üzerinde
+    farklı ölçeklerde ölçer
+
+    Her ölçek için generate_synthetic_dataset ile veri üretilir (aynı
+    random_state ile tekrarlanabilir), aşama girdileri ilk gerektiğinde bir
+    kez hazırlanır ve SCALE_BENCHMARK_CASES'teki her fonksiyon StageProfiler
+    ile çalıştırılır. Kaydedilenler: duvar saati ve CPU süresi, grafik
+    çizimi (plt.savefig) süresi ve onsuz süre, satır/sn, tracemalloc tepe
+    belleği (trace_memory=True), süreç peak RSS'i ve fonksiyonun bu tepeyi
+    ne kadar yükselttiği. repeat > 1 ise en hızlı çalıştırma tutulur.
+    Grafikler Agg backend'iyle (ekrana çizmeden) üretilir. incremental_update
+    yalnızca yeni yığını (satırların INCREMENTAL_BATCH_FRACTION kadarı)
+    işler; satır/sn bu yığına göre hesaplanır.
+
+    functions: ölçülecek fonksiyon adları (varsayılan: hepsi).
+    verbose=False ise fonksiyonlar sessiz modda çalışır (yalnızca gösterim
+    için yapılan hesaplamalar atlanır); True ise INFO çıktısı üretilir ama
+    ekrana yazılmaz.
+    work_dir: fonksiyonların dosya yazdığı klasör (varsayılan: sonda silinen
+    geçici klasör).
+    json_path verilirse sonuçlar JSON olarak da kaydedilir.
+    Döndürür: her satırı bir (fonksiyon, ölçek) ölçümü olan DataFrame.
+    """
+    names = list(SCALE_BENCHMARK_CASES) if functions is None else list(functions)
+    unknown = [name for name in names if name not in SCALE_BENCHMARK_CASES]
+    if unknown:
+        raise ValueError(f"Bilinmeyen fonksiyon(lar): {unknown}")
+
+    logger.info(f"ÖLÇEK BENCHMARK ({len(names)} fonksiyon, ölçekler: {[f'{n:,}' for n in scales]})")
+    logger.info("=" * 50)
+
+    if json_path is not None:
+        json_path = os.path.abspath(json_path)
+    with contextlib.ExitStack() as stack:
+        if work_dir is None:
+            work_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='benchmark_'))
+        os.makedirs(work_dir, exist_ok=True)
+        stack.enter_context(_working_directory(work_dir))
+        plots = stack.enter_context(_plot_timer())
+        records = _benchmark_scales(scales, names, repeat, trace_memory, verbose, template, random_state, plots)
+
+    results = pd.DataFrame(records)
+    if json_path is not None:
+        folder = os.path.dirname(json_path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump({'scales': list(scales), 'trace_memory': trace_memory, 'verbose': verbose,
+                       'random_state': random_state, 'results': records}, f, ensure_ascii=False, indent=2)
+    return results
+
+def _benchmark_scales(scales, names, repeat, trace_memory, verbose, template, random_state, plots):
+    """
+    benchmark_at_scale ölçüm döngüsü (çalışma klasörü ve Agg backend'i hazırken)
+    """
+    records = []
+    for n_rows in scales:
+        inputs = {'raw': generate_synthetic_dataset(n_rows, template=template, random_state=random_state)}
+        for name in names:
+            module, stage, func = SCALE_BENCHMARK_CASES[name]
+            prepared = _benchmark_input(inputs, stage)
+            best = None
+            for _ in range(repeat):
+                run_input = _run_input(stage, prepared)
+                profiler = StageProfiler(trace_memory=trace_memory)
+                output_context = quiet() if not verbose else contextlib.redirect_stdout(io.StringIO())
+                plots['seconds'] = 0.0
+                with output_context, profiler.stage(name, run_input):
+                    func(run_input)
+                plt.close('all')
+                record = dict(profiler.stages[0], plot_seconds=plots['seconds'])
+                if best is None or record['wall_seconds'] < best['wall_seconds']:
+                    best = record
+
+            rows = best['rows_in'] if best['rows_in'] is not None else n_rows
+            records.append({
+                'function': name,
+                'module': module,
+                'rows': n_rows,
+                'rows_processed': rows,
+                'wall_seconds': best['wall_seconds'],
+                'cpu_seconds': best['cpu_seconds'],
+                'plot_seconds': best['plot_seconds'],
+                'compute_seconds': best['wall_seconds'] - best['plot_seconds'],
+                'rows_per_sec': rows / best['wall_seconds'] if best['wall_seconds'] > 0 else np.inf,
+                'traced_peak_mb': best['traced_peak_mb'],
+                'process_peak_rss_mb': best['process_peak_rss_mb'],
+                'peak_rss_increase_mb': best['peak_rss_increase_mb']
+            })
+            memory = f", bellek tepe {best['traced_peak_mb']:.1f} MB" if trace_memory else ""
+            plot = f", grafik {best['plot_seconds']:.3f} sn" if best['plot_seconds'] > 0 else ""
+            logger.info(f"{name} ({n_rows:,} satır): {best['wall_seconds']:.3f} sn{plot}, "
+                        f"{records[-1]['rows_per_sec']:,.0f} satır/sn{memory}")
+    return records
@@ -0,0 +1,169 @@
+import hashlib
+import importlib
+import inspect
+import json
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from .logging_functions import get_logger
+
+logger = get_logger(__name__)
+
+# Önbellek formatı değiştiğinde veya aşama çıktısını etkileyen ama anahtara
+# girmeyen bir değişiklikte (CACHE_CODE_MODULES dışındaki bir modül, okunan
+# sabit dosyalar ...) elle artırılmalıdır; eski kayıtlar kullanılmaz
+CACHE_VERSION = 2
+
+# Aşama fonksiyonları ve çağırdıkları yardımcılar bu modüllerdedir; kaynak
+# kodlarından herhangi biri değişirse tüm aşama anahtarları değişir
+CACHE_CODE_MODULES = ('preprocessing_functions', 'data_loader')
+
+# Aşama çıktılarını etkileyen kütüphanelerin sürümleri de anahtara girer
+LIBRARY_VERSIONS = {
+    'pandas': pd.__version__,
+    'numpy': np.__version__,
+    'sklearn': sklearn.__version__,
+    'joblib': joblib.__version__
+}
+
+DEFAULT_CACHE_FOLDER = 'results/.stage_cache'
+
+def data_fingerprint(df):
+    """
+    DataFrame içeriğinin (değerler, index, sütun adları ve tipleri) özeti
+
+    pd.util.hash_pandas_object ile satır hash'leri vektörel hesaplanır; veri
+    üzerinde tek bir geçiş yapılır.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode('utf-8'))
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest.update(np.ascontiguousarray(row_hashes).tobytes())
+    return digest.hexdigest()
+
+def _source(obj, fallback):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        return fallback
+
+def _function_fingerprint(func):
+    """
+    Aşama fonksiyonunun, ait olduğu modülün ve CACHE_CODE_MODULES'in kaynak kodu özeti
+
+    Yalnızca fonksiyonun kendi kaynağı yetmez: çağırdığı yardımcılar veya
+    modül sabitleri değişince de önbellek geçersiz olmalıdır.
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(_source(func, f"{func.__module__}.{func.__qualname__}").encode('utf-8'))
+    module_names = [func.__module__] + [f"{__package__}.{name}" for name in CACHE_CODE_MODULES]
+    for name in dict.fromkeys(module_names):
+        module = importlib.import_module(name)
+        digest.update(_source(module, name).encode('utf-8'))
+    return digest.hexdigest()
+
+class StageCache:
+    """
+    Pipeline aşama çıktıları için disk önbelleği
+
+    Her aşamanın anahtarı; aşama adı, parametreleri, aşama fonksiyonunun ve
+    CACHE_CODE_MODULES'in kaynak kodu, LIBRARY_VERSIONS ve girdi anahtarından
+    türetilir. İlk aşamanın girdi anahtarı verinin kendisinin hash'idir
+    (data_fingerprint); sonraki aşamalar bir önceki aşamanın anahtarını girdi
+    olarak alır. Böylece bir parametre değiştiğinde yalnızca o aşama ve ondan
+    sonrakiler yeniden çalışır, veri her aşamada yeniden hash'lenmez.
+
+    Anahtara girmeyen bir değişiklik (örn. başka bir modüldeki yardımcı)
+    çıktıyı etkiliyorsa CACHE_VERSION elle artırılmalıdır.
+
+    Çıktılar joblib ile (sıkıştırmasız) folder altına yazılır; farklı
+    parametrelerle üretilen kayıtlar birlikte tutulur, clear() ile silinir.
+    """
+
+    def __init__(self, folder=DEFAULT_CACHE_FOLDER):
+        self.folder = folder
+        self.hits = []
+        self.misses = []
+
+    def key(self, stage, input_key, params=None, func=None):
+        """
+        Aşama anahtarı (girdi anahtarı + parametreler + kod + kütüphane sürümleri)
+        """
+        payload = {
+            'version': CACHE_VERSION,
+            'libraries': LIBRARY_VERSIONS,
+            'stage': stage,
+            'input': input_key,
+            'params': params or {},
+            'code': _function_fingerprint(func) if func is not None else None
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=repr).encode('utf-8')
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _path(self, stage, key):
+        return os.path.join(self.folder, f"{stage}-{key}.joblib")
+
+    def load(self, stage, key):
+        """
+        Döndürür: (bulundu mu, çıktı)
+        """
+        path = self._path(stage, key)
+        if not os.path.exists(path):
+            return False, None
+        try:
+            return True, joblib.load(path)
+        except Exception as e:
+            logger.warning(f"Önbellek okunamadı ({stage}): {e}")
+            return False, None
+
+    def save(self, stage, key, output):
+        os.makedirs(self.folder, exist_ok=True)
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılır
+        path = self._path(stage, key)
+        temp_path = f"{path}.tmp"
+        joblib.dump(output, temp_path)
+        os.replace(temp_path, path)
+
+    def run(self, stage, input_key, func, *args, params=None, **kwargs):
+        """
+        Aşamayı önbellekten getirir ya da çalıştırıp kaydeder
+
+        params anahtara girer; func'a args/kwargs ile verilir (params'ta
+        olmayan argümanlar, örn. inplace, sonucu değiştirmemelidir).
+        Döndürür: (çıktı, aşama anahtarı)
+        """
+        key = self.key(stage, input_key, params, func)
+        found, output = self.load(stage, key)
+        if found:
+            self.hits.append(stage)
+            logger.info(f"Önbellekten yüklendi: {stage}")
+            return output, key
+
+        self.misses.append(stage)
+        output = func(*args, **kwargs)
+        self.save(stage, key, output)
+        return output, key
+
+    def clear(self):
+        """
+        Tüm önbellek kayıtlarını siler
+        """
+        if not os.path.isdir(self.folder):
+            return
+        for name in os.listdir(self.folder):
+            if name.endswith('.joblib') or name.endswith('.tmp'):
+                os.remove(os.path.join(self.folder, name))
+
+def run_cached(cache, stage, input_key, func, *args, params=None, **kwargs):
+    """
+    cache verilmişse StageCache.run, yoksa func'ı doğrudan çalıştırır
+
+    Döndürür: (çıktı, aşama anahtarı veya None)
+    """
+    if cache is None:
+        return func(*args, **kwargs), None
+    return cache.run(stage, input_key, func, *args, params=params, **kwargs)
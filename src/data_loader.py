@@ -2,241 +2,602 @@ import pandas as pd
 import numpy as np
 import re
 import os
+import json
 
-def extract_numbers_from_text(series):
+from .logging_functions import get_logger, is_verbose
+from .parallel_functions import parallel_map, print_messages
+from .partition_functions import median_from_counts
+from .profiling_functions import profile_stage, report_peak_rss_increase
+from .sketch_functions import CategorySketch, HyperLogLog, build_quantile_sketches, sketch_medians
+from .text_functions import tokenize_multi_value_column
+
+logger = get_logger(__name__)
+
+# Sayısal olması gereken sütunlar
+NUMERIC_COLUMNS = {
+    'TedaviSuresi': 'Tedavi Süresi',
+    'UygulamaSuresi': 'Uygulama Süresi'
+}
+
+# clean_categorical_columns'ın temizlediği sütunlar ve boş değer karşılığı
+CATEGORICAL_COLUMNS = {
+    'Cinsiyet': 'Cinsiyet',
+    'KanGrubu': 'Kan Grubu',
+    'Uyruk': 'Uyruk',
+    'Bolum': 'Bölüm',
+    'TedaviAdi': 'Tedavi Adı'
+}
+UNKNOWN_CATEGORY = 'Bilinmiyor'
+
+# clean_text_columns'ın temizlediği liste sütunları ve boş değer karşılığı
+TEXT_COLUMNS = {
+    'KronikHastalik': 'Kronik Hastalıklar',
+    'Alerji': 'Alerjiler',
+    'Tanilar': 'Tanılar',
+    'UygulamaYerleri': 'Uygulama Yerleri'
+}
+EMPTY_LIST_VALUE = 'Yok'
+
+# Metin içindeki ilk sayıyı yakalayan önceden derlenmiş regex
+NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+
+def _extract_number(text):
     """
-    Metin içinden sayıları çıkarır
+    Tek bir hücreden ilk sayıyı çıkarır
     """
-    def extract_number(text):
-        if pd.isna(text):
-            return np.nan
-        if isinstance(text, (int, float)):
-            return text
-        if isinstance(text, str):
-            # Sayı arama regex'i
-            numbers = re.findall(r'\d+\.?\d*', text.strip())
-            if numbers:
-                return float(numbers[0])
-            else:
-                return np.nan
+    if pd.isna(text):
         return np.nan
+    if isinstance(text, (int, float)):
+        return text
+    if isinstance(text, str):
+        # Sayı arama regex'i
+        match = NUMBER_PATTERN.search(text.strip())
+        if match:
+            return float(match.group())
+        else:
+            return np.nan
+    return np.nan
+
+def extract_numbers_from_text(series, method='vectorized'):
+    """
+    Metin içinden sayıları çıkarır
+
+    method='vectorized' her benzersiz değeri ("15 Seans" gibi) yalnızca bir kez
+    ayrıştırır ve sonucu kodlar üzerinden tüm satırlara dağıtır.
+    method='apply' eski hücre hücre yöntemidir (karşılaştırma için).
+    """
+    if method == 'apply':
+        return series.apply(_extract_number)
+    if method != 'vectorized':
+        raise ValueError("method 'vectorized' veya 'apply' olmalı")
     
-    return series.apply(extract_number)
+    # Benzersiz değerleri kodla (NaN -> -1)
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == 0:
+        return pd.Series(np.nan, index=series.index, name=series.name, dtype=float)
+    parsed = pd.Series([_extract_number(value) for value in uniques], dtype=object).infer_objects()
+    
+    # -1 kodları reindex ile NaN olur
+    values = parsed.reindex(codes).to_numpy()
+    return pd.Series(values, index=series.index, name=series.name)
+
+def compute_clean_medians(df):
+    """
+    clean_all_numeric_columns_advanced'ın eksik değerleri doldurduğu medianlar
+
+    Ham veriden hesaplanır; full_preprocessing_pipeline(clean_medians=...) ile
+    artifact'a yazılır.
+    """
+    return {col: extract_numbers_from_text(df[col]).median() for col in NUMERIC_COLUMNS if col in df.columns}
 
-def clean_all_numeric_columns_advanced(df):
+def clean_all_numeric_columns_advanced(df, medians=None, inplace=False):
     """
     sayısal sütun temizleme - metin içinden sayı çıkarma ile
+
+    medians verilirse (sütun -> median) NaN değerler bu global değerlerle
+    doldurulur; parça parça (chunk) temizlemede kullanılır.
+    inplace=True ise kopya alınmaz, verilen DataFrame değiştirilir.
     """
-    print("SAYISAL SÜTUN TEMİZLEME BAŞLIYOR...")
-    print("=" * 50)
+    logger.info("SAYISAL SÜTUN TEMİZLEME BAŞLIYOR...")
+    logger.info("=" * 50)
     
-    df_cleaned = df.copy()
-    
-    # Sayısal olması gereken sütunlar
-    numeric_columns = {
-        'TedaviSuresi': 'Tedavi Süresi',
-        'UygulamaSuresi': 'Uygulama Süresi'
-    }
+    df_cleaned = df if inplace else df.copy()
+    verbose = is_verbose(logger)
     
-    for col, description in numeric_columns.items():
+    for col, description in NUMERIC_COLUMNS.items():
         if col in df_cleaned.columns:
-            print(f"\n {description} ({col}) temizleniyor...")
+            logger.info(f"\n {description} ({col}) temizleniyor...")
             
             # Mevcut örnekleri göster
-            print(f"Örnek değerler: {df_cleaned[col].head().tolist()}")
-            print(f"Mevcut tip: {df_cleaned[col].dtype}")
+            if verbose:
+                logger.info(f"Örnek değerler: {df_cleaned[col].head().tolist()}")
+                logger.info(f"Mevcut tip: {df_cleaned[col].dtype}")
             
             # Sayıları çıkar
             cleaned_values = extract_numbers_from_text(df_cleaned[col])
             
             # NaN sayısı
             nan_count = cleaned_values.isna().sum()
-            print(f"Çıkarılan sayısal değerler: {cleaned_values.dropna().head().tolist()}")
+            if verbose:
+                logger.info(f"Çıkarılan sayısal değerler: {cleaned_values.dropna().head().tolist()}")
             
             if nan_count > 0:
-                print(f"{nan_count} değer dönüştürülemedi")
+                logger.info(f"{nan_count} değer dönüştürülemedi")
                 
                 # Median ile doldur
-                median_val = cleaned_values.median()
+                if medians is not None and col in medians:
+                    median_val = medians[col]
+                else:
+                    median_val = cleaned_values.median()
                 if not pd.isna(median_val):
                     cleaned_values.fillna(median_val, inplace=True)
-                    print(f"NaN değerler median ile dolduruldu: {median_val}")
+                    logger.info(f"NaN değerler median ile dolduruldu: {median_val}")
                 else:
         
                     cleaned_values.fillna(0, inplace=True)
-                    print(f"Diğer değerler 0 ile dolduruldu")
+                    logger.info(f"Diğer değerler 0 ile dolduruldu")
             
             df_cleaned[col] = cleaned_values
-            print(f"{description} başarıyla temizlendi! Yeni tip: {df_cleaned[col].dtype}")
+            logger.info(f"{description} başarıyla temizlendi! Yeni tip: {df_cleaned[col].dtype}")
         else:
-            print(f"{col} sütunu bulunamadı")
+            logger.warning(f"{col} sütunu bulunamadı")
     
     return df_cleaned
 
-def clean_categorical_columns(df):
+def _clean_categorical_column(task):
     """
-    Kategorik sütunları temizler
+    Tek bir kategorik sütunu temizler (parallel_map işçisi)
+
+    task: (sütun, açıklama, seri, verbose, approximate). Döndürür: (temiz seri, mesajlar)
+    verbose=False ise yalnızca gösterim için yapılan hesaplamalar atlanır;
+    approximate=True ise benzersiz sayısı ve en sık değerler sketch'ten gelir.
     """
-    print("\n KATEGORİK SÜTUNLAR TEMİZLENİYOR...")
-    print("=" * 40)
+    col, description, series, verbose, approximate = task
+    messages = [f"\n {description} ({col}):"]
     
-    df_cleaned = df.copy()
+    # Boş değerleri 'Bilinmiyor' ile doldur
+    null_count = series.isna().sum()
+    if null_count > 0:
+        series = series.fillna(UNKNOWN_CATEGORY)
+        messages.append(f"{null_count} boş değer '{UNKNOWN_CATEGORY}' ile dolduruldu")
     
-    # Kategorik sütunlar
-    categorical_columns = {
-        'Cinsiyet': 'Cinsiyet',
-        'KanGrubu': 'Kan Grubu', 
-        'Uyruk': 'Uyruk',
-        'Bolum': 'Bölüm',
-        'TedaviAdi': 'Tedavi Adı'
-    }
+    # String tipine çevir
+    series = series.astype(str)
     
-    for col, description in categorical_columns.items():
-        if col in df_cleaned.columns:
-            print(f"\n {description} ({col}):")
-            
-            # Boş değerleri 'Bilinmiyor' ile doldur
-            null_count = df_cleaned[col].isna().sum()
-            if null_count > 0:
-                df_cleaned[col] = df_cleaned[col].fillna('Bilinmiyor')
-                print(f"{null_count} boş değer 'Bilinmiyor' ile dolduruldu")
-            
-            # String tipine çevir
-            df_cleaned[col] = df_cleaned[col].astype(str)
-            
-            # Benzersiz değer sayısını göster
-            unique_count = df_cleaned[col].nunique()
-            print(f"Benzersiz değer sayısı: {unique_count}")
-            
-            if unique_count <= 10:
-                print(f"En sık değerler: {df_cleaned[col].value_counts().head().to_dict()}")
+    # Benzersiz değer sayısını göster
+    if verbose and approximate:
+        sketch = CategorySketch().update(series)
+        unique_count = sketch.distinct_count()
+        messages.append(f"Benzersiz değer sayısı: ~{unique_count}")
+        
+        if unique_count <= 10:
+            messages.append(f"En sık değerler (yaklaşık): {sketch.top(5).to_dict()}")
+    elif verbose:
+        unique_count = series.nunique()
+        messages.append(f"Benzersiz değer sayısı: {unique_count}")
+        
+        if unique_count <= 10:
+            messages.append(f"En sık değerler: {series.value_counts().head().to_dict()}")
+    
+    return series, messages
+
+def clean_categorical_columns(df, inplace=False, n_jobs=1, backend='thread', approximate=False):
+    """
+    Kategorik sütunları temizler (inplace=True ise kopya alınmaz)
+
+    n_jobs > 1 ise sütunlar parallel_map ile paralel işlenir; sonuçlar ve
+    mesajlar sütun sırasıyla birleştirilir. approximate=True ise raporlanan
+    benzersiz sayıları ve en sık değerler CategorySketch ile sabit bellekte
+    hesaplanır.
+    """
+    logger.info("\n KATEGORİK SÜTUNLAR TEMİZLENİYOR...")
+    logger.info("=" * 40)
+    
+    df_cleaned = df if inplace else df.copy()
+    
+    # İşçi süreçlerin logger düzeyi ana süreçten bağımsızdır; düzey task ile taşınır
+    verbose = is_verbose(logger)
+    tasks = [(col, description, df_cleaned[col], verbose, approximate)
+             for col, description in CATEGORICAL_COLUMNS.items() if col in df_cleaned.columns]
+    results = parallel_map(_clean_categorical_column, tasks, n_jobs=n_jobs, backend=backend)
+    
+    for (col, _, _, _, _), (series, messages) in zip(tasks, results):
+        df_cleaned[col] = series
+        print_messages(messages)
     
     return df_cleaned
 
-def clean_text_columns(df):
+def _clean_text_column(task):
     """
-    Metin sütunlarını (virgülle ayrılmış listeler) temizler
+    Tek bir liste sütununu temizler ve parça sayısını hesaplar (parallel_map işçisi)
+
+    task: (sütun, açıklama, seri, verbose). Döndürür: (temiz seri, Count serisi, mesajlar)
     """
-    print("\n METİN SÜTUNLARI TEMİZLENİYOR...")
-    print("=" * 35)
+    col, description, series, verbose = task
+    messages = [f"\n {description} ({col}):"]
     
-    df_cleaned = df.copy()
+    # Boş değerleri 'Yok' ile doldur
+    null_count = series.isna().sum()
+    if null_count > 0:
+        series = series.fillna(EMPTY_LIST_VALUE)
+        messages.append(f" {null_count} boş değer '{EMPTY_LIST_VALUE}' ile dolduruldu")
     
-    # Metin/liste sütunları
-    text_columns = {
-        'KronikHastalik': 'Kronik Hastalıklar',
-        'Alerji': 'Alerjiler',
-        'Tanilar': 'Tanılar',
-        'UygulamaYerleri': 'Uygulama Yerleri'
-    }
+    # String tipine çevir ve temizle
+    series = series.astype(str).str.strip()
     
-    for col, description in text_columns.items():
-        if col in df_cleaned.columns:
-            print(f"\n {description} ({col}):")
-            
-            # Boş değerleri 'Yok' ile doldur
-            null_count = df_cleaned[col].isna().sum()
-            if null_count > 0:
-                df_cleaned[col] = df_cleaned[col].fillna('Yok')
-                print(f" {null_count} boş değer 'Yok' ile dolduruldu")
-            
-            # String tipine çevir ve temizle
-            df_cleaned[col] = df_cleaned[col].astype(str).str.strip()
-            
-            # Virgülle ayrılmış değerlerin sayısını hesapla
-            df_cleaned[f'{col}_Count'] = df_cleaned[col].apply(
-                lambda x: len([item.strip() for item in x.split(',') if item.strip()]) if x and x != 'Yok' else 0
-            )
-            
-            print(f" {description} temizlendi ve sayısal versiyonu ({col}_Count) oluşturuldu")
-            print(f"Ortalama {description.lower()} sayısı: {df_cleaned[f'{col}_Count'].mean():.2f}")
+    # Virgülle ayrılmış değerlerin sayısını hesapla
+    counts = tokenize_multi_value_column(series)['features']['Count']
+    
+    messages.append(f" {description} temizlendi ve sayısal versiyonu ({col}_Count) oluşturuldu")
+    if verbose:
+        messages.append(f"Ortalama {description.lower()} sayısı: {counts.mean():.2f}")
+    return series, counts, messages
+
+def clean_text_columns(df, inplace=False, n_jobs=1, backend='thread'):
+    """
+    Metin sütunlarını (virgülle ayrılmış listeler) temizler (inplace=True ise kopya alınmaz)
+
+    n_jobs > 1 ise sütunlar paralel ayrıştırılır; ayrıştırma Python ağırlıklı
+    olduğundan backend='process' genellikle daha iyi ölçeklenir.
+    """
+    logger.info("\n METİN SÜTUNLARI TEMİZLENİYOR...")
+    logger.info("=" * 35)
+    
+    df_cleaned = df if inplace else df.copy()
+    
+    verbose = is_verbose(logger)
+    tasks = [(col, description, df_cleaned[col], verbose)
+             for col, description in TEXT_COLUMNS.items() if col in df_cleaned.columns]
+    results = parallel_map(_clean_text_column, tasks, n_jobs=n_jobs, backend=backend)
+    
+    for (col, _, _, _), (series, counts, messages) in zip(tasks, results):
+        df_cleaned[col] = series
+        df_cleaned[f'{col}_Count'] = counts
+        print_messages(messages)
     
     return df_cleaned
 
-def full_data_cleaning_pipeline(df):
+def full_data_cleaning_pipeline(df, inplace=False, optimize_memory=False, n_jobs=1, profiler=None):
     """
     Tam veri temizleme pipeline'ı
+
+    inplace=True ise tüm aşamalar aynı DataFrame üzerinde çalışır (sahiplik
+    pipeline'a devredilir, verilen df değişir). optimize_memory=True ise
+    temizlenmiş verinin tipleri optimize_dtypes ile küçültülür. n_jobs > 1 ise
+    kategorik sütunlar thread, metin sütunları process havuzunda işlenir.
+    profiler (StageProfiler) verilirse her aşamanın süre, bellek ve
+    satır/sütun ölçümleri ona kaydedilir.
     """
-    print("TAM VERİ TEMİZLEME PIPELINE'I BAŞLIYOR...")
-    print("=" * 60)
+    logger.info("TAM VERİ TEMİZLEME PIPELINE'I BAŞLIYOR...")
+    logger.info("=" * 60)
+    
+    initial_shape = df.shape
     
     # 1. Sayısal sütunları temizle
-    df_step1 = clean_all_numeric_columns_advanced(df)
+    with profile_stage(profiler, 'numeric_cleaning', df) as stage:
+        df_step1 = stage.output(clean_all_numeric_columns_advanced(df, inplace=inplace))
+    report_peak_rss_increase(stage, 'sayısal temizleme')
     
     # 2. Kategorik sütunları temizle
-    df_step2 = clean_categorical_columns(df_step1)
+    with profile_stage(profiler, 'categorical_cleaning', df_step1) as stage:
+        df_step2 = stage.output(clean_categorical_columns(df_step1, inplace=inplace, n_jobs=n_jobs, backend='thread'))
+    report_peak_rss_increase(stage, 'kategorik temizleme')
     
     # 3. Metin sütunlarını temizle
-    df_final = clean_text_columns(df_step2)
+    with profile_stage(profiler, 'text_cleaning', df_step2) as stage:
+        df_final = stage.output(clean_text_columns(df_step2, inplace=inplace, n_jobs=n_jobs, backend='process'))
+    report_peak_rss_increase(stage, 'metin temizleme')
     
-    print(f"\n  VERİ TEMİZLEME TAMAMLANDI!")
-    print(f"Başlangıç boyutu: {df.shape}")
-    print(f" Final boyutu: {df_final.shape}")
+    # 4. Veri tiplerini küçült
+    if optimize_memory:
+        with profile_stage(profiler, 'optimize_dtypes', df_final) as stage:
+            df_final = stage.output(optimize_dtypes(df_final, inplace=True))
+    
+    logger.info(f"\n  VERİ TEMİZLEME TAMAMLANDI!")
+    logger.info(f"Başlangıç boyutu: {initial_shape}")
+    logger.info(f" Final boyutu: {df_final.shape}")
     
     # Temizlenmiş veriyi kaydet
-    save_dataframe(df_final, 'cleaned_dataset.csv')
+    with profile_stage(profiler, 'save', df_final) as stage:
+        save_dataframe(df_final, 'cleaned_dataset.csv')
     
     return df_final
 
-def load_data(file_path):
+def compute_numeric_medians(file_path, chunksize=100_000, method='exact', epsilon=0.01):
+    """
+    CSV dosyası üzerinden parça parça geçerek sayısal sütunların global medianını hesaplar
+
+    method='exact': her parçada değer frekansları toplanır; bellek kullanımı
+    satır sayısına değil benzersiz değer sayısına bağlıdır.
+    method='sketch': her parça QuantileSketch'e eklenir; bellek benzersiz değer
+    sayısından da bağımsızdır, sonuç epsilon sıra hatasıyla yaklaşıktır.
+    """
+    if method not in ('exact', 'sketch'):
+        raise ValueError("method 'exact' veya 'sketch' olmalı")
+    
+    header = pd.read_csv(file_path, nrows=0, encoding='utf-8').columns
+    columns = [col for col in NUMERIC_COLUMNS if col in header]
+    
+    counts = {col: pd.Series(dtype=float) for col in columns}
+    if not columns:
+        return {}
+    
+    if method == 'sketch':
+        chunks = (chunk.apply(extract_numbers_from_text)
+                  for chunk in pd.read_csv(file_path, usecols=columns, chunksize=chunksize, encoding='utf-8'))
+        return sketch_medians(build_quantile_sketches(chunks, columns, epsilon=epsilon))
+    
+    for chunk in pd.read_csv(file_path, usecols=columns, chunksize=chunksize, encoding='utf-8'):
+        for col in columns:
+            chunk_counts = extract_numbers_from_text(chunk[col]).value_counts()
+            counts[col] = counts[col].add(chunk_counts, fill_value=0)
+    
+    return {col: median_from_counts(counts[col]) for col in columns}
+
+def full_data_cleaning_pipeline_chunked(file_path, output_file='cleaned_dataset.csv', folder='results', chunksize=100_000,
+                                        median_method='exact', epsilon=0.01):
+    """
+    Büyük CSV dosyaları için parça parça (streaming) veri temizleme pipeline'ı
+
+    1. geçiş: sayısal sütunların global medianları hesaplanır
+       (median_method: 'exact' veya 'sketch', bkz. compute_numeric_medians)
+    2. geçiş: her parça temizlenir ve çıktı dosyasına eklenir
+    """
+    logger.info("PARÇALI VERİ TEMİZLEME PIPELINE'I BAŞLIYOR...")
+    logger.info("=" * 60)
+    
+    # 1. Global median değerleri
+    medians = compute_numeric_medians(file_path, chunksize=chunksize, method=median_method, epsilon=epsilon)
+    logger.info(f"Global median değerleri: {medians}")
+    
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+    output_path = os.path.join(folder, output_file)
+    
+    # 2. Parçaları temizle ve dosyaya ekle
+    total_rows = 0
+    n_chunks = 0
+    for chunk in pd.read_csv(file_path, chunksize=chunksize, encoding='utf-8'):
+        logger.info(f"\n PARÇA {n_chunks + 1} ({len(chunk)} satır)")
+        chunk = clean_all_numeric_columns_advanced(chunk, medians=medians, inplace=True)
+        chunk = clean_categorical_columns(chunk, inplace=True)
+        chunk = clean_text_columns(chunk, inplace=True)
+        
+        chunk.to_csv(output_path, mode='w' if n_chunks == 0 else 'a',
+                     header=n_chunks == 0, index=False, encoding='utf-8')
+        total_rows += len(chunk)
+        n_chunks += 1
+    
+    logger.info(f"\n  PARÇALI VERİ TEMİZLEME TAMAMLANDI!")
+    logger.info(f"Toplam satır: {total_rows}, parça sayısı: {n_chunks}")
+    logger.info(f"Veri {output_path} olarak kaydedildi!")
+    
+    return {
+        'output_path': output_path,
+        'rows': total_rows,
+        'chunks': n_chunks,
+        'medians': medians
+    }
+
+def _excel_cache_path(file_path, cache_dir=None):
+    """
+    Excel dosyası için dosya boyutu ve değişiklik zamanına göre anahtarlanmış Parquet önbellek yolu
+    """
+    stat = os.stat(file_path)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(file_path), '.cache')
+    base_name = os.path.basename(file_path)
+    return os.path.join(cache_dir, f"{base_name}.{stat.st_size}_{stat.st_mtime_ns}.parquet")
+
+def _read_excel_cached(file_path, usecols=None, cache_dir=None):
+    """
+    Excel dosyasını Parquet önbelleği üzerinden okur; önbellek yoksa bir kez oluşturur
+    """
+    cache_path = _excel_cache_path(file_path, cache_dir)
+    
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path, columns=usecols)
+            logger.info(f"Önbellekten yüklendi: {cache_path}")
+            return df
+        except Exception as e:
+            logger.warning(f"Önbellek okunamadı, Excel'den okunuyor: {e}")
+    
+    df = pd.read_excel(file_path)
+    
+    try:
+        cache_folder = os.path.dirname(cache_path)
+        os.makedirs(cache_folder, exist_ok=True)
+        
+        # Aynı dosyanın eski önbelleklerini sil
+        prefix = os.path.basename(file_path) + '.'
+        for name in os.listdir(cache_folder):
+            if name.startswith(prefix) and name.endswith('.parquet'):
+                os.remove(os.path.join(cache_folder, name))
+        
+        df.to_parquet(cache_path, index=False)
+        logger.info(f"Parquet önbelleği oluşturuldu: {cache_path}")
+    except ImportError:
+        logger.warning("pyarrow bulunamadı, önbellek oluşturulmadı")
+    except Exception as e:
+        logger.warning(f"Önbellek oluşturulamadı: {e}")
+    
+    if usecols is not None:
+        df = df[list(usecols)]
+    return df
+
+def load_data(file_path, usecols=None, use_cache=True, cache_dir=None):
     """
     Excel veya CSV formatında veri setini yükler
+
+    Excel dosyaları ilk okumada Parquet önbelleğine (varsayılan: dosyanın yanındaki
+    .cache klasörü) dönüştürülür; sonraki okumalar dosya değişmediği sürece
+    önbellekten, yalnızca usecols sütunları ve veri tipleri korunarak yapılır.
     """
     try:
         # Dosya uzantısına göre okuma
         if file_path.endswith('.xlsx') or file_path.endswith('.xls'):
-            df = pd.read_excel(file_path)
+            if use_cache:
+                df = _read_excel_cached(file_path, usecols=usecols, cache_dir=cache_dir)
+            else:
+                df = pd.read_excel(file_path)
+                if usecols is not None:
+                    df = df[list(usecols)]
         else:
-            df = pd.read_csv(file_path, encoding='utf-8')
+            df = pd.read_csv(file_path, encoding='utf-8', usecols=usecols)
             
-        print(f"Veri seti başarıyla yüklendi!")
-        print(f" Veri seti boyutu: {df.shape}")
+        logger.info(f"Veri seti başarıyla yüklendi!")
+        logger.info(f" Veri seti boyutu: {df.shape}")
         
         # Sütun adlarını göster
-        print(f"\n Sütun adları: {list(df.columns)}")
+        logger.info(f"\n Sütun adları: {list(df.columns)}")
         
         return df
     except FileNotFoundError:
-        print("Dosya bulunamadı! Lütfen dosya yolunu kontrol edin.")
+        logger.warning("Dosya bulunamadı! Lütfen dosya yolunu kontrol edin.")
         return None
     except Exception as e:
-        print(f" Veri yükleme hatası: {e}")
+        logger.error(f" Veri yükleme hatası: {e}")
         return None
 
-def basic_info(df):
+def basic_info(df, approximate=False):
     """
     Veri seti hakkında temel bilgileri gösterir
+
+    Yalnızca gösterim amaçlıdır; INFO kapalıysa hiçbir hesaplama yapılmaz.
+    approximate=True ise benzersiz değer sayıları HyperLogLog ile (sabit
+    bellek, ~%1.6 hata) tahmin edilir.
     """
-    print("=" * 60)
-    print("VERİ SETİ TEMEL BİLGİLERİ")
-    print("=" * 60)
+    if not is_verbose(logger):
+        return
     
-    print(f" Satır sayısı: {df.shape[0]}")
-    print(f" Sütun sayısı: {df.shape[1]}")
-    print(f" Bellek kullanımı: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    logger.info("=" * 60)
+    logger.info("VERİ SETİ TEMEL BİLGİLERİ")
+    logger.info("=" * 60)
     
-    print("\n Sütun Bilgileri:")
-    print("-" * 40)
+    logger.info(f" Satır sayısı: {df.shape[0]}")
+    logger.info(f" Sütun sayısı: {df.shape[1]}")
+    logger.info(f" Bellek kullanımı: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    
+    logger.info("\n Sütun Bilgileri:")
+    logger.info("-" * 40)
     for col in df.columns:
         non_null_count = df[col].count()
         null_count = df[col].isna().sum()
-        unique_count = df[col].nunique()
-        print(f"• {col}:")
-        print(f"Tip: {df[col].dtype}")
-        print(f"  Dolu: {non_null_count}, Boş: {null_count}, Benzersiz: {unique_count}")
+        unique_count = f"~{HyperLogLog().update(df[col]).count()}" if approximate else df[col].nunique()
+        logger.info(f"• {col}:")
+        logger.info(f"Tip: {df[col].dtype}")
+        logger.info(f"  Dolu: {non_null_count}, Boş: {null_count}, Benzersiz: {unique_count}")
         
         # İlk birkaç değeri göster
         sample_values = df[col].dropna().head(3).tolist()
-        print(f"Örnekler: {sample_values}")
-        print()
+        logger.info(f"Örnekler: {sample_values}")
+        logger.info("")
+
+def optimize_dtypes(df, category_threshold=0.5, downcast_floats=True, inplace=False):
+    """
+    Veri tiplerini küçülterek bellek kullanımını azaltır
+
+    - Az benzersiz değerli metin sütunları -> category
+    - Yalnızca 0/1 içeren tam sayı bayrakları (Yasli_Mi, *_Var ...) -> uint8
+    - Diğer tam sayılar -> en küçük uygun tam sayı tipi
+    - Ondalıklı sayılar -> float32 (yalnızca değer kaybı yoksa)
+    """
+    logger.info("\n VERİ TİPİ OPTİMİZASYONU...")
+    logger.info("=" * 40)
+    
+    df_optimized = df if inplace else df.copy()
+    # deep=True bellek ölçümü metin sütunlarında pahalıdır; yalnızca rapor için
+    verbose = is_verbose(logger)
+    if verbose:
+        memory_before = df_optimized.memory_usage(deep=True).sum() / 1024**2
+    
+    for col in df_optimized.columns:
+        series = df_optimized[col]
+        
+        if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        
+        if pd.api.types.is_integer_dtype(series):
+            if series.isin([0, 1]).all():
+                df_optimized[col] = series.astype(np.uint8)
+            else:
+                df_optimized[col] = pd.to_numeric(series, downcast='integer')
+        
+        elif pd.api.types.is_float_dtype(series):
+            if downcast_floats:
+                values = series.to_numpy()
+                downcast = values.astype(np.float32)
+                # Sadece kayıpsız dönüşümlere izin ver
+                if np.array_equal(downcast, values, equal_nan=True):
+                    df_optimized[col] = downcast
+        
+        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+            if len(series) > 0 and series.nunique() / len(series) <= category_threshold:
+                df_optimized[col] = series.astype('category')
+    
+    if verbose:
+        memory_after = df_optimized.memory_usage(deep=True).sum() / 1024**2
+        reduction = (1 - memory_after / memory_before) * 100 if memory_before > 0 else 0
+        logger.info(f"Bellek kullanımı: {memory_before:.2f} MB → {memory_after:.2f} MB (%{reduction:.1f} azalma)")
+    
+    return df_optimized
+
+# Desteklenen kayıt formatları ve dosya uzantıları
+OUTPUT_FORMATS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather',
+    'npy': '.npy'
+}
 
-def save_dataframe(df, filename, folder='results'):
+def save_dataframe(df, filename, folder='results', format='csv', compression='snappy'):
     """
-    DataFrame'i CSV olarak kaydeder
+    DataFrame'i seçilen formatta kaydeder
+
+    format: 'csv', 'parquet' (compression ile), 'feather' veya 'npy'.
+    'npy' yalnızca sayısal veriler içindir; değerler tek bir dizi olarak, sütun
+    adları ise yanındaki _columns.json dosyasına yazılır ve load_feature_matrix
+    ile bellek eşlemeli (memory-mapped) olarak okunabilir.
     """
+    if format not in OUTPUT_FORMATS:
+        raise ValueError(f"format {list(OUTPUT_FORMATS)} değerlerinden biri olmalı")
+    
     if not os.path.exists(folder):
         os.makedirs(folder)
     
+    # Dosya uzantısını formata göre ayarla
+    filename = os.path.splitext(filename)[0] + OUTPUT_FORMATS[format]
     filepath = os.path.join(folder, filename)
-    df.to_csv(filepath, index=False, encoding='utf-8')
-    print(f"Veri {filepath} olarak kaydedildi!")
+    
+    if format == 'csv':
+        df.to_csv(filepath, index=False, encoding='utf-8')
+    elif format == 'parquet':
+        df.to_parquet(filepath, index=False, compression=compression)
+    elif format == 'feather':
+        df.reset_index(drop=True).to_feather(filepath)
+    else:
+        values = df.to_numpy()
+        if not np.issubdtype(values.dtype, np.number):
+            raise ValueError("npy formatı yalnızca sayısal sütunlar için kullanılabilir")
+        np.save(filepath, values)
+        with open(filepath[:-len('.npy')] + '_columns.json', 'w', encoding='utf-8') as f:
+            json.dump(list(map(str, df.columns)), f, ensure_ascii=False)
+    
+    logger.info(f"Veri {filepath} olarak kaydedildi!")
+    return filepath
+
+def load_feature_matrix(filepath, mmap_mode='r'):
+    """
+    save_dataframe(format='npy') ile kaydedilmiş matrisi ayrıştırma yapmadan
+    bellek eşlemeli olarak açar; (dizi, sütun adları) döndürür
+    """
+    values = np.load(filepath, mmap_mode=mmap_mode)
+    
+    columns_path = filepath[:-len('.npy')] + '_columns.json'
+    columns = None
+    if os.path.exists(columns_path):
+        with open(columns_path, encoding='utf-8') as f:
+            columns = json.load(f)
+    
+    return values, columns
@@ -3,21 +3,211 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
+from scipy.cluster import hierarchy
+import math
 import os
 import warnings
 warnings.filterwarnings('ignore')
 
-def missing_data_analysis(df):
+from .logging_functions import get_logger, is_verbose
+from .parallel_functions import parallel_map, print_messages
+from .sketch_functions import build_category_sketches
+from .text_functions import LIST_COLUMNS, tokenize_multi_value_column
+
+logger = get_logger(__name__)
+
+# Eksik veri haritasındaki satır kovası sayısı (grafik boyutu satır sayısından bağımsızdır)
+MISSING_MAP_BINS = 200
+
+# target_analysis: bu satır sayısından büyük veride grafikler özet verilerden çizilir
+LARGE_DATA_ROWS = 100_000
+# Violin plot KDE'si için örneklem boyutu ve Q-Q plot kantil sayısı
+PLOT_SAMPLE_SIZE = 10_000
+QQ_QUANTILES = 500
+
+# numerical_analysis: bu sayıdan fazla sütunda korelasyon blok blok float32 ile hesaplanır
+WIDE_CORRELATION_COLUMNS = 50
+# Korelasyon haritasında gösterilen en fazla sütun ve değer yazılan en fazla sütun
+HEATMAP_MAX_COLUMNS = 30
+HEATMAP_ANNOT_COLUMNS = 15
+
+# Örneklemli EDA: güven düzeyi ve katmanlı örnekleme için önerilen sütunlar
+CONFIDENCE_LEVEL = 0.95
+STRATIFY_COLUMNS = ['Bolum', 'Cinsiyet']
+
+def draw_sample(df, sample, stratify=None, random_state=42):
+    """
+    Tekrarlanabilir örneklem çeker (sample: satır sayısı veya 0-1 arası oran)
+
+    stratify verilirse (örn. STRATIFY_COLUMNS) her katmandan payı oranında
+    satır çekilir (orantılı katmanlı örnekleme); aksi halde basit rastgele
+    örneklem. Satırlar orijinal sırasını korur. Örneklem veriden büyükse df
+    olduğu gibi döner. Örneklem üzerinde çalışan analizlere popülasyonun
+    satır sayısı population ile ayrıca verilir.
+    """
+    n_rows = len(df)
+    fraction = sample if isinstance(sample, float) else sample / max(n_rows, 1)
+    if fraction >= 1:
+        return df
+    
+    if stratify:
+        strata = df.groupby(list(stratify), dropna=False, observed=True, sort=False).ngroup()
+        positions = (pd.Series(np.arange(n_rows), index=strata.to_numpy())
+                     .groupby(level=0).sample(frac=fraction, random_state=random_state).to_numpy())
+    else:
+        rng = np.random.default_rng(random_state)
+        positions = rng.choice(n_rows, size=int(round(n_rows * fraction)), replace=False)
+    
+    sampled = df.iloc[np.sort(positions)]
+    logger.info(f"Örneklem: {len(sampled)} / {n_rows} satır "
+                f"({'katmanlı: ' + ', '.join(stratify) if stratify else 'basit rastgele'}, random_state={random_state})")
+    return sampled
+
+def _sampled(df, sample, stratify, random_state, population=None):
+    """
+    sample verilmişse örneklemi çeker; döndürür: (veri, popülasyon satır sayısı veya None)
+
+    Örneklem zaten çekilmişse (örn. complete_eda'da) popülasyon çağıran
+    tarafından population ile verilir; veri çerçevesinden çıkarılmaz.
+    """
+    if sample is not None:
+        sampled = draw_sample(df, sample, stratify, random_state)
+        if len(sampled) < len(df):
+            population = len(df)
+        df = sampled
+    return df, population
+
+def _z_value(confidence):
+    return stats.norm.ppf(0.5 + confidence / 2)
+
+def _finite_population_correction(n, population):
+    if population is None or population <= 1:
+        return 1.0
+    return math.sqrt(max(population - n, 0) / (population - 1))
+
+def proportion_confidence_interval(proportion, n, population=None, confidence=CONFIDENCE_LEVEL):
+    """
+    Oran için normal yaklaşımlı güven aralığı (sonlu popülasyon düzeltmeli)
+
+    Döndürür: (alt, üst), [0, 1] aralığına kırpılmış
+    """
+    if n == 0:
+        return np.nan, np.nan
+    margin = _z_value(confidence) * math.sqrt(proportion * (1 - proportion) / n) \
+        * _finite_population_correction(n, population)
+    return max(0.0, proportion - margin), min(1.0, proportion + margin)
+
+def mean_confidence_interval(values, population=None, confidence=CONFIDENCE_LEVEL):
+    """
+    Ortalama için t dağılımlı güven aralığı (sonlu popülasyon düzeltmeli)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n < 2:
+        return np.nan, np.nan
+    margin = stats.t.ppf(0.5 + confidence / 2, n - 1) * values.std(ddof=1) / math.sqrt(n) \
+        * _finite_population_correction(n, population)
+    return values.mean() - margin, values.mean() + margin
+
+def median_confidence_interval(values, confidence=CONFIDENCE_LEVEL):
+    """
+    Median için dağılımdan bağımsız (sıra istatistiği) güven aralığı
+    """
+    values = np.sort(np.asarray(values, dtype=float))
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n == 0:
+        return np.nan, np.nan
+    half_width = _z_value(confidence) * math.sqrt(n) / 2
+    lower = int(np.clip(np.floor(n / 2 - half_width), 0, n - 1))
+    upper = int(np.clip(np.ceil(n / 2 + half_width), 0, n - 1))
+    return values[lower], values[upper]
+
+def correlation_confidence_interval(r, n, confidence=CONFIDENCE_LEVEL):
+    """
+    Pearson korelasyonu için Fisher z dönüşümlü güven aralığı
+    """
+    if n <= 3 or not np.isfinite(r) or abs(r) >= 1:
+        return r, r
+    margin = _z_value(confidence) / math.sqrt(n - 3)
+    return math.tanh(math.atanh(r) - margin), math.tanh(math.atanh(r) + margin)
+
+def missing_bin_fractions(df, n_bins=MISSING_MAP_BINS):
+    """
+    Satırları sırayla n_bins ardışık kovaya böler; her kova ve sütun için eksik oranı
+
+    Sütunlar tek tek işlenir (aynı anda yalnızca bir sütunun boolean maskesi
+    bellekte tutulur); sonuç (kova × sütun) boyutundadır.
+    """
+    n_rows = len(df)
+    n_bins = max(1, min(n_bins, n_rows))
+    starts = (np.arange(n_bins) * n_rows) // n_bins
+    sizes = np.diff(np.append(starts, n_rows))
+    
+    fractions = {col: np.add.reduceat(df[col].isna().to_numpy(), starts, dtype=np.int64) / sizes
+                 for col in df.columns}
+    return pd.DataFrame(fractions, index=pd.Index(starts, name='İlk satır'))
+
+def null_pattern_counts(df, top=10):
+    """
+    Satırların eksiklik desenleri (hangi sütunların birlikte eksik olduğu) ve sıklıkları
+
+    Eksik sütunların maskeleri satır başına bit olarak paketlenir, desenler
+    sıralanıp sayılır (run-length). Döndürür: desen, satır sayısı ve yüzde
+    içeren, sıklığa göre azalan ilk top desen.
+    """
+    missing_cols = [col for col in df.columns if df[col].hasnans]
+    if not missing_cols:
+        return pd.DataFrame({'Eksik Sütunlar': ['Yok'], 'Satır Sayısı': [len(df)], 'Yüzde (%)': [100.0]})
+    
+    masks = np.column_stack([df[col].isna().to_numpy() for col in missing_cols])
+    patterns, counts = np.unique(np.packbits(masks, axis=1), axis=0, return_counts=True)
+    patterns = np.unpackbits(patterns, axis=1, count=len(missing_cols)).astype(bool)
+    
+    result = pd.DataFrame({
+        'Eksik Sütunlar': [', '.join(np.array(missing_cols)[pattern]) or 'Yok' for pattern in patterns],
+        'Satır Sayısı': counts,
+        'Yüzde (%)': counts / len(df) * 100
+    })
+    return result.sort_values('Satır Sayısı', ascending=False, kind='stable').head(top).reset_index(drop=True)
+
+def null_cooccurrence(df):
+    """
+    Eksik sütun çiftleri için birlikte eksik satır sayıları (köşegen: sütunun eksik sayısı)
+    """
+    missing_cols = [col for col in df.columns if df[col].hasnans]
+    masks = {col: df[col].isna().to_numpy() for col in missing_cols}
+    counts = np.zeros((len(missing_cols), len(missing_cols)), dtype=np.int64)
+    for i, col_i in enumerate(missing_cols):
+        for j in range(i, len(missing_cols)):
+            counts[i, j] = counts[j, i] = np.count_nonzero(masks[col_i] & masks[missing_cols[j]])
+    return pd.DataFrame(counts, index=missing_cols, columns=missing_cols)
+
+def missing_data_analysis(df, n_bins=MISSING_MAP_BINS, sample=None, stratify=None, random_state=42,
+                          population=None):
     """
     Eksik veri analizi yapar ve görselleştirir
+
+    Eksik veri haritası hücre başına değil, satırların n_bins kovası
+    başına eksik oranıyla çizilir (missing_bin_fractions); çizim maliyeti ve
+    görüntü boyutu satır sayısından bağımsızdır. Eksiklik desenleri ve
+    birlikte eksik sütun çiftleri de raporlanır.
+
+    sample verilirse (bkz. draw_sample) analiz örneklem üzerinde yapılır ve
+    eksik yüzdelerine güven aralığı sütunları eklenir.
+    population: df zaten bir örneklemse popülasyonun satır sayısı (örn.
+    complete_eda verir); güven aralıkları buna göre hesaplanır.
     """
-    print("=" * 60)
-    print("EKSİK VERİ ANALİZİ")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("EKSİK VERİ ANALİZİ")
+    logger.info("=" * 60)
+    
+    df, population = _sampled(df, sample, stratify, random_state, population)
     
     # Eksik veri sayısı ve yüzdesi
     missing_count = df.isnull().sum()
-    missing_percent = (df.isnull().sum() / len(df)) * 100
+    missing_percent = (missing_count / len(df)) * 100
     
     missing_df = pd.DataFrame({
         'Sütun': missing_count.index,
@@ -27,18 +217,45 @@ def missing_data_analysis(df):
     
     missing_df = missing_df[missing_df['Eksik Sayısı'] > 0].sort_values('Eksik Sayısı', ascending=False)
     
+    if population is not None and len(missing_df) > 0:
+        # Örneklem tahmini: popülasyondaki eksik yüzdesinin güven aralığı
+        bounds = np.array([proportion_confidence_interval(count / len(df), len(df), population)
+                           for count in missing_df['Eksik Sayısı']])
+        missing_df['GA Alt (%)'] = bounds[:, 0] * 100
+        missing_df['GA Üst (%)'] = bounds[:, 1] * 100
+        logger.info(f"Örneklem tahmini ({len(df)} / {population} satır, %{CONFIDENCE_LEVEL * 100:.0f} güven aralığı)")
+    
     if len(missing_df) > 0:
-        print("Eksik veriler:")
-        print(missing_df.to_string(index=False))
+        logger.info("Eksik veriler:")
+        logger.info("%s", missing_df.to_string(index=False))
+        
+        # Eksiklik desenleri ve birlikte eksik sütunlar yalnızca gösterim içindir
+        if is_verbose(logger):
+            logger.info("\nEksiklik desenleri:")
+            logger.info("%s", null_pattern_counts(df).to_string(index=False, float_format='%.2f'))
+            
+            cooccurrence = null_cooccurrence(df)
+            pairs = [(col_i, col_j, cooccurrence.loc[col_i, col_j])
+                     for i, col_i in enumerate(cooccurrence.index)
+                     for col_j in cooccurrence.columns[i + 1:]
+                     if cooccurrence.loc[col_i, col_j] > 0]
+            if pairs:
+                logger.info("\nBirlikte eksik sütunlar:")
+                for col_i, col_j, count in sorted(pairs, key=lambda pair: -pair[2]):
+                    logger.info(f"{col_i} - {col_j}: {count} satır "
+                                f"({col_i} eksikken %{count / cooccurrence.loc[col_i, col_i] * 100:.1f}, "
+                                f"{col_j} eksikken %{count / cooccurrence.loc[col_j, col_j] * 100:.1f})")
         
         # Görselleştirme sadece eksik veri varsa
         try:
             plt.figure(figsize=(14, 6))
             
-            # Eksik veri heatmap
+            # Eksik veri haritası (satır kovası başına eksik oranı)
             plt.subplot(1, 2, 1)
-            sns.heatmap(df.isnull(), cbar=True, yticklabels=False, cmap='viridis')
+            sns.heatmap(missing_bin_fractions(df, n_bins), cbar=True, yticklabels=False, cmap='viridis',
+                        vmin=0, vmax=1)
             plt.title('Eksik Veri Haritası')
+            plt.ylabel(f'Satır kovaları ({min(n_bins, len(df))})')
             
             # Eksik veri bar grafiği
             plt.subplot(1, 2, 2)
@@ -55,110 +272,191 @@ def missing_data_analysis(df):
             plt.show()
             
         except Exception as e:
-            print(f"Görselleştirme hatası: {e}")
+            logger.warning(f"Görselleştirme hatası: {e}")
             
     else:
-        print("Hiç eksik veri yok!")
+        logger.info("Hiç eksik veri yok!")
     
     return missing_df
 
-def target_analysis(df, target_col='TedaviSuresi'):
+def _box_stats(values, quartiles=None):
+    """
+    Matplotlib bxp için kutu grafiği istatistikleri (boxplot ile aynı: 1.5 IQR bıyıkları)
+
+    Aykırı değerlerin yalnızca benzersiz değerleri çizilir; üst üste binen
+    noktalar grafikte zaten tek nokta olarak görünür.
+    """
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75])
+    if quartiles is not None:
+        q1, q3 = quartiles
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    outside = values[(values < q1 - 1.5 * iqr) | (values > q3 + 1.5 * iqr)]
+    return {
+        'med': median, 'q1': q1, 'q3': q3,
+        'whislo': inside.min() if len(inside) else q1,
+        'whishi': inside.max() if len(inside) else q3,
+        'fliers': np.unique(outside)
+    }
+
+def _qq_points(values, n_quantiles=QQ_QUANTILES):
+    """
+    Q-Q plot noktaları: n_quantiles eşit aralıklı olasılıkta normal ve örneklem kantilleri
+    """
+    probabilities = (np.arange(1, n_quantiles + 1) - 0.5) / n_quantiles
+    return stats.norm.ppf(probabilities), np.quantile(values, probabilities)
+
+def target_analysis(df, target_col='TedaviSuresi', quartiles=None, large_data=None, random_state=42,
+                    sample=None, stratify=None, population=None):
     """
     Hedef değişkeni detaylı analiz eder 
+
+    quartiles: önceden hesaplanmış (Q1, Q3) (örn. QuantileSketch ile); verilirse
+    aykırı değer sınırları için kantiller yeniden hesaplanmaz.
+
+    large_data=True ise (None: LARGE_DATA_ROWS satırdan fazlaysa) grafikler
+    tüm noktalardan değil özet verilerden çizilir: histogram np.histogram
+    ile bir kez hesaplanan kutulardan, kutu grafiği kantillerden, violin plot
+    PLOT_SAMPLE_SIZE boyutlu (random_state ile tekrarlanabilir) örneklem
+    üzerindeki KDE'den, Q-Q plot QQ_QUANTILES kantilden. Çizim süresi veri
+    boyutuyla artmaz.
+
+    sample verilirse (bkz. draw_sample) analiz örneklem üzerinde yapılır;
+    ortalama ve median güven aralıklarıyla raporlanır.
+    population: df zaten bir örneklemse popülasyonun satır sayısı (örn.
+    complete_eda verir); güven aralıkları buna göre hesaplanır.
     """
-    print("=" * 60)
-    print(f"HEDEF DEĞİŞKEN ANALİZİ: {target_col}")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info(f"HEDEF DEĞİŞKEN ANALİZİ: {target_col}")
+    logger.info("=" * 60)
+    
+    df, population = _sampled(df, sample, stratify, random_state, population)
     
     # Sütun varlık kontrolü
     if target_col not in df.columns:
-        print(f"{target_col} sütunu bulunamadı!")
-        print(f"Mevcut sütunlar: {list(df.columns)}")
+        logger.warning(f"{target_col} sütunu bulunamadı!")
+        logger.info(f"Mevcut sütunlar: {list(df.columns)}")
         return None
     
     # Veri tipini kontrol et
-    print(f"Sütun tipi: {df[target_col].dtype}")
-    print(f"Sayısal mı: {pd.api.types.is_numeric_dtype(df[target_col])}")
-    print(f"Toplam değer sayısı: {len(df[target_col])}")
-    print(f"Boş olmayan değer sayısı: {df[target_col].count()}")
+    logger.info(f"Sütun tipi: {df[target_col].dtype}")
+    logger.info(f"Sayısal mı: {pd.api.types.is_numeric_dtype(df[target_col])}")
+    logger.info(f"Toplam değer sayısı: {len(df[target_col])}")
+    logger.info(f"Boş olmayan değer sayısı: {df[target_col].count()}")
     
     # Hedef seri oluştur
     target_series = df[target_col].copy()
     
     # Eğer sayısal değilse hata ver 
     if not pd.api.types.is_numeric_dtype(target_series):
-        print(f"{target_col} hala sayısal değil! Veri temizleme aşamasını kontrol edin.")
-        print(f"Örnek değerler: {target_series.head().tolist()}")
+        logger.info(f"{target_col} hala sayısal değil! Veri temizleme aşamasını kontrol edin.")
+        logger.info(f"Örnek değerler: {target_series.head().tolist()}")
         return None
     
     # NaN değerleri temizle
     clean_target = target_series.dropna()
     
     if len(clean_target) == 0:
-        print("Analiz edilecek veri yok!")
+        logger.info("Analiz edilecek veri yok!")
         return None
     
     # Temel istatistikler
-    print("\n Temel İstatistikler:")
-    print("-" * 30)
+    logger.info("\n Temel İstatistikler:")
+    logger.info("-" * 30)
     stats_summary = clean_target.describe()
-    print(stats_summary)
-    
-    # Ek istatistikler
-    print(f"\n Ek İstatistikler:")
-    print(f"Mod: {clean_target.mode().iloc[0] if len(clean_target.mode()) > 0 else 'N/A'}")
-    print(f"Çarpıklık (Skewness): {clean_target.skew():.3f}")
-    print(f"Basıklık (Kurtosis): {clean_target.kurtosis():.3f}")
-    
-    # Aykırı değer tespiti
-    try:
-        Q1 = clean_target.quantile(0.25)
-        Q3 = clean_target.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
+    logger.info("%s", stats_summary)
+    
+    if population is not None:
+        # Boş olmayan değerlerin popülasyondaki sayısı örneklem oranıyla tahmin edilir
+        target_population = population * len(clean_target) / len(df)
+        mean_low, mean_high = mean_confidence_interval(clean_target, target_population)
+        median_low, median_high = median_confidence_interval(clean_target)
+        logger.info(f"\n Güven Aralıkları (%{CONFIDENCE_LEVEL * 100:.0f}, örneklem {len(df)} / {population} satır):")
+        logger.info(f"Ortalama: {clean_target.mean():.3f} [{mean_low:.3f}, {mean_high:.3f}]")
+        logger.info(f"Median: {clean_target.median():.3f} [{median_low:.3f}, {median_high:.3f}]")
+    
+    # Ek istatistikler ve aykırı değer özeti yalnızca gösterim içindir
+    if is_verbose(logger):
+        logger.info(f"\n Ek İstatistikler:")
+        logger.info(f"Mod: {clean_target.mode().iloc[0] if len(clean_target.mode()) > 0 else 'N/A'}")
+        logger.info(f"Çarpıklık (Skewness): {clean_target.skew():.3f}")
+        logger.info(f"Basıklık (Kurtosis): {clean_target.kurtosis():.3f}")
+    
+        # Aykırı değer tespiti
+        try:
+            if quartiles is not None:
+                Q1, Q3 = quartiles
+            else:
+                Q1 = clean_target.quantile(0.25)
+                Q3 = clean_target.quantile(0.75)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - 1.5 * IQR
+            upper_bound = Q3 + 1.5 * IQR
         
-        outliers_mask = (clean_target < lower_bound) | (clean_target > upper_bound)
-        outliers_count = outliers_mask.sum()
+            outliers_mask = (clean_target < lower_bound) | (clean_target > upper_bound)
+            outliers_count = outliers_mask.sum()
         
-        print(f"\n Aykırı Değer Analizi:")
-        print(f"Aykırı değer sayısı: {outliers_count} (%{outliers_count/len(clean_target)*100:.2f})")
-        print(f"Alt sınır: {lower_bound:.2f}")
-        print(f"Üst sınır: {upper_bound:.2f}")
+            logger.info(f"\n Aykırı Değer Analizi:")
+            logger.info(f"Aykırı değer sayısı: {outliers_count} (%{outliers_count/len(clean_target)*100:.2f})")
+            logger.info(f"Alt sınır: {lower_bound:.2f}")
+            logger.info(f"Üst sınır: {upper_bound:.2f}")
         
-        if outliers_count > 0:
-            print(f"En büyük aykırı değer: {clean_target[clean_target > upper_bound].max() if (clean_target > upper_bound).any() else 'N/A'}")
-            print(f"En küçük aykırı değer: {clean_target[clean_target < lower_bound].min() if (clean_target < lower_bound).any() else 'N/A'}")
+            if outliers_count > 0:
+                logger.info(f"En büyük aykırı değer: {clean_target[clean_target > upper_bound].max() if (clean_target > upper_bound).any() else 'N/A'}")
+                logger.info(f"En küçük aykırı değer: {clean_target[clean_target < lower_bound].min() if (clean_target < lower_bound).any() else 'N/A'}")
         
-    except Exception as e:
-        print(f"Aykırı değer hesaplamasında hata: {e}")
+        except Exception as e:
+            logger.error(f"Aykırı değer hesaplamasında hata: {e}")
     
     # Görselleştirmeler
+    if large_data is None:
+        large_data = len(clean_target) > LARGE_DATA_ROWS
     try:
         fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        values = clean_target.to_numpy(dtype=float)
         
         # Histogram
-        axes[0, 0].hist(clean_target, bins=min(50, len(clean_target.unique())), 
-                       alpha=0.7, color='skyblue', edgecolor='black')
+        n_bins = min(50, len(clean_target.unique()))
+        if large_data:
+            counts, edges = np.histogram(values, bins=n_bins)
+            axes[0, 0].bar(edges[:-1], counts, width=np.diff(edges), align='edge',
+                           alpha=0.7, color='skyblue', edgecolor='black')
+        else:
+            axes[0, 0].hist(clean_target, bins=n_bins, alpha=0.7, color='skyblue', edgecolor='black')
         axes[0, 0].set_title(f'{target_col} Dağılımı')
         axes[0, 0].set_xlabel('Tedavi Süresi')
         axes[0, 0].set_ylabel('Frekans')
         axes[0, 0].grid(True, alpha=0.3)
         
         # Box plot
-        box_data = axes[0, 1].boxplot(clean_target, patch_artist=True)
+        if large_data:
+            box_data = axes[0, 1].bxp([_box_stats(values, quartiles)], showfliers=True, patch_artist=True)
+        else:
+            box_data = axes[0, 1].boxplot(clean_target, patch_artist=True)
         box_data['boxes'][0].set_facecolor('lightblue')
         axes[0, 1].set_title(f'{target_col} Box Plot')
         axes[0, 1].set_ylabel('Tedavi Süresi')
         axes[0, 1].grid(True, alpha=0.3)
         
         # QQ plot
-        stats.probplot(clean_target, dist="norm", plot=axes[1, 0])
+        if large_data:
+            theoretical, ordered = _qq_points(values)
+            slope, intercept = np.polyfit(theoretical, ordered, 1)
+            axes[1, 0].plot(theoretical, ordered, 'bo')
+            axes[1, 0].plot(theoretical, slope * theoretical + intercept, 'r-')
+            axes[1, 0].set_xlabel('Theoretical quantiles')
+            axes[1, 0].set_ylabel('Ordered Values')
+        else:
+            stats.probplot(clean_target, dist="norm", plot=axes[1, 0])
         axes[1, 0].set_title('Q-Q Plot (Normal Dağılım Testi)')
         axes[1, 0].grid(True, alpha=0.3)
         
         # Violin plot
-        axes[1, 1].violinplot(clean_target)
+        if large_data and len(values) > PLOT_SAMPLE_SIZE:
+            rng = np.random.default_rng(random_state)
+            axes[1, 1].violinplot(rng.choice(values, PLOT_SAMPLE_SIZE, replace=False))
+        else:
+            axes[1, 1].violinplot(clean_target)
         axes[1, 1].set_title(f'{target_col} Violin Plot')
         axes[1, 1].set_ylabel('Tedavi Süresi')
         axes[1, 1].grid(True, alpha=0.3)
@@ -171,17 +469,78 @@ def target_analysis(df, target_col='TedaviSuresi'):
         plt.show()
         
     except Exception as e:
-        print(f"Görselleştirme hatası: {e}")
+        logger.warning(f"Görselleştirme hatası: {e}")
     
     return stats_summary
 
-def categorical_analysis(df):
+def _categorical_column_summary(task):
+    """
+    Tek bir kategorik sütunun özet mesajlarını üretir (parallel_map işçisi)
+
+    task: (sütun, seri, sketch, popülasyon). sketch (CategorySketch) verilirse
+    benzersiz sayısı ve en sık değerler ondan okunur (yaklaşık, '~' ile
+    gösterilir). popülasyon (satır sayısı) verilirse seri bir örneklemdir;
+    en sık değerlerin yüzdeleri güven aralıklarıyla gösterilir.
+    """
+    col, series, sketch, population = task
+    messages = [f"\n {col} Analizi:", "-" * 40]
+    
+    # Temel istatistikler
+    total_count = len(series)
+    non_null_count = series.count()
+    null_count = series.isnull().sum()
+    unique_count = series.nunique() if sketch is None else f"~{sketch.distinct_count()}"
+    
+    messages.append(f"Toplam değer: {total_count}")
+    messages.append(f"Geçerli değer: {non_null_count}")
+    messages.append(f"Boş değer: {null_count}")
+    messages.append(f"Benzersiz değer: {unique_count}")
+    
+    # Value counts
+    value_counts = series.value_counts() if sketch is None else sketch.top(10)
+    messages.append(f"\n En sık görülen {min(10, len(value_counts))} değer:")
+    if population is None:
+        messages.append(str(value_counts.head(10)))
+    else:
+        top_values = value_counts.head(10)
+        bounds = np.array([proportion_confidence_interval(count / non_null_count, non_null_count, population)
+                           for count in top_values])
+        messages.append(pd.DataFrame({
+            'Adet': top_values.to_numpy(),
+            'Yüzde (%)': top_values.to_numpy() / non_null_count * 100,
+            'GA Alt (%)': bounds[:, 0] * 100,
+            'GA Üst (%)': bounds[:, 1] * 100
+        }, index=top_values.index).to_string(float_format='%.1f'))
+    
+    # Mode
+    if not value_counts.empty:
+        messages.append(f"\n Mod (en sık): {value_counts.index[0]} ({value_counts.iloc[0]} kez, %{value_counts.iloc[0]/non_null_count*100:.1f})")
+    
+    return messages
+
+def categorical_analysis(df, n_jobs=1, backend='thread', approximate=False, sketches=None, sample=None,
+                         stratify=None, random_state=42, population=None):
     """
     Kategorik değişkenleri analiz eder 
+
+    n_jobs > 1 ise sütun özetleri parallel_map ile paralel hesaplanır.
+    approximate=True ise benzersiz sayıları ve en sık 10 değer (özet ve
+    grafik) sütun başına CategorySketch'ten okunur. sketches verilirse (örn.
+    build_category_sketches ile parçalar üzerinde oluşturulan) yeniden
+    hesaplanmaz.
+    sample verilirse (bkz. draw_sample) analiz örneklem üzerinde yapılır;
+    en sık değerlerin yüzdeleri güven aralıklarıyla raporlanır.
+    population: df zaten bir örneklemse popülasyonun satır sayısı (örn.
+    complete_eda verir); güven aralıkları buna göre hesaplanır.
+
+    Döndürür: sütun -> özet mesajları (INFO kapalıysa özetler hesaplanmaz,
+    boş sözlük); kategorik sütun yoksa None.
     """
-    print("=" * 60)
-    print("KATEGORİK DEĞİŞKEN ANALİZİ")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("KATEGORİK DEĞİŞKEN ANALİZİ")
+    logger.info("=" * 60)
+    
+    df, population = _sampled(df, sample, stratify, random_state, population)
     
     # Kategorik sütunları otomatik tespit et
     categorical_cols = []
@@ -196,36 +555,24 @@ def categorical_analysis(df):
             categorical_cols.append(col)
     
     if not categorical_cols:
-        print("Kategorik sütun bulunamadı!")
+        logger.warning("Kategorik sütun bulunamadı!")
         return None
     
-    print(f"Bulunan kategorik sütunlar: {categorical_cols}")
+    logger.info(f"Bulunan kategorik sütunlar: {categorical_cols}")
     
-    # Her sütun için analiz
-    for col in categorical_cols:
-        if col in df.columns:
-            print(f"\n {col} Analizi:")
-            print("-" * 40)
-            
-            # Temel istatistikler
-            total_count = len(df[col])
-            non_null_count = df[col].count()
-            null_count = df[col].isnull().sum()
-            unique_count = df[col].nunique()
-            
-            print(f"Toplam değer: {total_count}")
-            print(f"Geçerli değer: {non_null_count}")
-            print(f"Boş değer: {null_count}")
-            print(f"Benzersiz değer: {unique_count}")
-            
-            # Value counts
-            value_counts = df[col].value_counts()
-            print(f"\n En sık görülen {min(10, len(value_counts))} değer:")
-            print(value_counts.head(10))
-            
-            # Mode
-            if not value_counts.empty:
-                print(f"\n Mod (en sık): {value_counts.index[0]} ({value_counts.iloc[0]} kez, %{value_counts.iloc[0]/non_null_count*100:.1f})")
+    if sketches is None and approximate:
+        sketches = build_category_sketches(df, [col for col in categorical_cols if col in df.columns])
+    
+    # Her sütun için analiz (n_jobs > 1 ise paralel, çıktı sütun sırasıyla)
+    # Özetler yalnızca yazdırılır; INFO kapalıysa hesaplanmaz
+    summaries = {}
+    if is_verbose(logger):
+        tasks = [(col, df[col], sketches[col] if sketches is not None else None, population)
+                 for col in categorical_cols if col in df.columns]
+        for (col, *_), messages in zip(tasks, parallel_map(_categorical_column_summary, tasks,
+                                                           n_jobs=n_jobs, backend=backend)):
+            print_messages(messages)
+            summaries[col] = messages
     
     # Görselleştirme
     available_cols = [col for col in categorical_cols if col in df.columns]
@@ -250,7 +597,7 @@ def categorical_analysis(df):
             for i, col in enumerate(cols_to_plot):
                 if i < len(axes):
                     # En sık görülen 10 değeri göster
-                    top_values = df[col].value_counts().head(10)
+                    top_values = df[col].value_counts().head(10) if sketches is None else sketches[col].top(10)
                     
                     # Bar plot
                     top_values.plot(kind='bar', ax=axes[i], color='skyblue')
@@ -269,47 +616,188 @@ def categorical_analysis(df):
             plt.show()
             
         except Exception as e:
-            print(f"Görselleştirme hatası: {e}")
+            logger.warning(f"Görselleştirme hatası: {e}")
+    
+    return summaries
+
+def blocked_correlation(df, columns=None, block_rows=65_536, dtype=np.float32):
+    """
+    Pearson korelasyon matrisi; satır blokları üzerinde float32 ile hesaplanır
+
+    1. geçişte sütun ortalamaları ve standart sapmaları, 2. geçişte
+    merkezlenmiş blokların çarpımları (Z.T @ Z) toplanır. Bellekte aynı anda
+    yalnızca bir blok (block_rows × sütun) ve sütun × sütun matrisler tutulur.
+    Eksik değer varsa pandas corr gibi her çift için ikisinin de gözlendiği
+    satırlar kullanılır: gözlem maskelerinden ortak gözlem sayıları (M.T @ M)
+    ile çift başına toplamlar ve kareler toplamı da birikir. Sonuç df.corr()'dan
+    float32 yuvarlaması kadar farklıdır. Sabit sütunların (veya ortak gözlemi
+    2'den az çiftlerin) korelasyonu NaN'dır.
+    """
+    columns = list(df.select_dtypes(include=[np.number]).columns) if columns is None else list(columns)
+    n_rows, n_cols = len(df), len(columns)
+    blocks = range(0, n_rows, block_rows)
+    
+    def block(start):
+        return df[columns].iloc[start:start + block_rows].to_numpy(dtype=dtype)
+    
+    # 1. geçiş: ortalama ve standart sapma (NaN'lar hariç)
+    sums = np.zeros(n_cols)
+    squares = np.zeros(n_cols)
+    counts = np.zeros(n_cols)
+    for start in blocks:
+        values = block(start)
+        observed = ~np.isnan(values)
+        values = np.where(observed, values, 0)
+        sums += values.sum(axis=0, dtype=np.float64)
+        squares += np.square(values, dtype=np.float64).sum(axis=0)
+        counts += observed.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+        stds = np.sqrt(np.maximum(squares / counts - means ** 2, 0))
+    
+    if (counts == n_rows).all():
+        # 2. geçiş (eksiksiz): standartlaştırılmış blokların çarpımları
+        scale = np.where(stds > 0, 1 / np.where(stds > 0, stds, 1), 0).astype(dtype)
+        gram = np.zeros((n_cols, n_cols))
+        for start in blocks:
+            z = (block(start) - means.astype(dtype)) * scale
+            gram += z.T @ z
+        correlation = gram / n_rows
+        constant = stds == 0
+        undefined = constant[:, None] | constant[None, :]
+    else:
+        # 2. geçiş (eksik değerli): çift başına ortak gözlem sayısı ve toplamlar
+        pair_counts = np.zeros((n_cols, n_cols))
+        pair_sums = np.zeros((n_cols, n_cols))
+        pair_squares = np.zeros((n_cols, n_cols))
+        products = np.zeros((n_cols, n_cols))
+        for start in blocks:
+            centered = block(start) - means.astype(dtype)
+            observed = ~np.isnan(centered)
+            centered[~observed] = 0
+            observed = observed.astype(dtype)
+            pair_counts += observed.T @ observed
+            # [i, j]: i sütununun j'nin de gözlendiği satırlardaki toplamı
+            pair_sums += centered.T @ observed
+            pair_squares += np.square(centered).T @ observed
+            products += centered.T @ centered
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = products - pair_sums * pair_sums.T / pair_counts
+            variances = pair_squares - np.square(pair_sums) / pair_counts
+            correlation = covariance / np.sqrt(variances * variances.T)
+        # Çift içinde sabit kalan sütun: float32 yuvarlamasıyla sıfıra yakın varyans
+        flat = variances <= np.finfo(dtype).resolution * pair_squares
+        undefined = (pair_counts < 2) | flat | flat.T
+    
+    correlation[undefined] = np.nan
+    np.fill_diagonal(correlation, np.where(np.diag(undefined), np.nan, 1.0))
+    return pd.DataFrame(np.clip(correlation, -1, 1), index=columns, columns=columns)
+
+def high_correlation_pairs(correlation_matrix, threshold=0.5):
+    """
+    |r| > threshold olan sütun çiftleri (üst üçgen maskesiyle, döngüsüz)
+
+    Döndürür: |r|'ye göre azalan sıralı DataFrame (Sütun 1, Sütun 2, Korelasyon)
+    """
+    values = correlation_matrix.to_numpy()
+    rows, cols = np.triu_indices(len(values), k=1)
+    pair_values = values[rows, cols]
+    mask = np.abs(pair_values) > threshold
+    pairs = pd.DataFrame({
+        'Sütun 1': correlation_matrix.index[rows[mask]],
+        'Sütun 2': correlation_matrix.columns[cols[mask]],
+        'Korelasyon': pair_values[mask]
+    })
+    order = np.argsort(-np.abs(pairs['Korelasyon'].to_numpy()), kind='stable')
+    return pairs.iloc[order].reset_index(drop=True)
+
+def correlation_heatmap_view(correlation_matrix, max_columns=HEATMAP_MAX_COLUMNS):
+    """
+    Geniş korelasyon matrisleri için gösterilecek alt matris
 
-def numerical_analysis(df):
+    Sütun sayısı max_columns'tan fazlaysa diğer sütunlarla en yüksek |r|
+    değerine sahip max_columns sütun seçilir; sütunlar 1 - |r| uzaklığıyla
+    hiyerarşik kümelemenin yaprak sırasına dizilir (ilişkili sütunlar yan yana).
+    """
+    if len(correlation_matrix) <= max_columns:
+        return correlation_matrix
+    
+    strength = correlation_matrix.abs().to_numpy(copy=True)
+    np.fill_diagonal(strength, np.nan)
+    strength = np.nan_to_num(strength)
+    top = np.sort(np.argsort(-strength.max(axis=1), kind='stable')[:max_columns])
+    
+    distance = 1 - strength[np.ix_(top, top)]
+    np.fill_diagonal(distance, 0)
+    condensed = distance[np.triu_indices(len(top), k=1)]
+    order = top[hierarchy.leaves_list(hierarchy.linkage(condensed, method='average'))]
+    return correlation_matrix.iloc[order, order]
+
+def numerical_analysis(df, blocked=None, sample=None, stratify=None, random_state=42, population=None):
     """
     Sayısal değişkenleri analiz eder
+
+    blocked=True ise (None: WIDE_CORRELATION_COLUMNS sütundan fazlaysa,
+    örn. smart_encoding sonrası) korelasyon blocked_correlation ile
+    hesaplanır. Yüksek korelasyonlu çiftler high_correlation_pairs ile
+    bulunur; geniş matrislerde harita correlation_heatmap_view ile en ilişkili
+    sütunlara indirgenir.
+    sample verilirse (bkz. draw_sample) analiz örneklem üzerinde yapılır;
+    ortalamalar ve yüksek korelasyonlar güven aralıklarıyla raporlanır.
+    population: df zaten bir örneklemse popülasyonun satır sayısı (örn.
+    complete_eda verir); güven aralıkları buna göre hesaplanır.
     """
-    print("=" * 60)
-    print("SAYISAL DEĞİŞKEN ANALİZİ")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("SAYISAL DEĞİŞKEN ANALİZİ")
+    logger.info("=" * 60)
+    
+    df, population = _sampled(df, sample, stratify, random_state, population)
     
     # Sayısal sütunları otomatik tespit et
     numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     numerical_cols.remove('HastaNo')
     
     if not numerical_cols:
-        print("Sayısal sütun bulunamadı!")
+        logger.warning("Sayısal sütun bulunamadı!")
         return None
     
-    print(f"Bulunan sayısal sütunlar: {numerical_cols}")
+    logger.info(f"Bulunan sayısal sütunlar: {numerical_cols}")
     
     # Temel istatistikler
-    print("\n Temel İstatistikler:")
-    print("-" * 40)
-    stats_df = df[numerical_cols].describe()
-    print(stats_df)
+    if is_verbose(logger):
+        logger.info("\n Temel İstatistikler:")
+        logger.info("-" * 40)
+        stats_df = df[numerical_cols].describe()
+        logger.info("%s", stats_df)
+        
+        if population is not None:
+            logger.info(f"\n Ortalama Güven Aralıkları (%{CONFIDENCE_LEVEL * 100:.0f}, örneklem {len(df)} / {population} satır):")
+            for col in numerical_cols:
+                low, high = mean_confidence_interval(df[col], population * df[col].count() / len(df))
+                logger.info(f"{col}: {df[col].mean():.3f} [{low:.3f}, {high:.3f}]")
     
     # Korelasyon analizi 
     correlation_matrix = None
     if len(numerical_cols) >= 2:
-        print(f"\n Korelasyon Matrisi:")
-        print("-" * 40)
-        correlation_matrix = df[numerical_cols].corr()
-        print(correlation_matrix)
+        logger.info(f"\n Korelasyon Matrisi:")
+        logger.info("-" * 40)
+        if blocked is None:
+            blocked = len(numerical_cols) > WIDE_CORRELATION_COLUMNS
+        if blocked:
+            correlation_matrix = blocked_correlation(df, numerical_cols)
+        else:
+            correlation_matrix = df[numerical_cols].corr()
+        logger.info("%s", correlation_matrix)
         
         # Yüksek korelasyonları tespit et
-        print(f"\n Yüksek Korelasyonlar (|r| > 0.5):")
-        for i in range(len(correlation_matrix.columns)):
-            for j in range(i+1, len(correlation_matrix.columns)):
-                corr_val = correlation_matrix.iloc[i, j]
-                if abs(corr_val) > 0.5:
-                    print(f"{correlation_matrix.columns[i]} - {correlation_matrix.columns[j]}: {corr_val:.3f}")
+        if is_verbose(logger):
+            logger.info(f"\n Yüksek Korelasyonlar (|r| > 0.5):")
+            for col_1, col_2, corr_val in high_correlation_pairs(correlation_matrix).itertuples(index=False):
+                if population is None:
+                    logger.info(f"{col_1} - {col_2}: {corr_val:.3f}")
+                else:
+                    low, high = correlation_confidence_interval(corr_val, len(df))
+                    logger.info(f"{col_1} - {col_2}: {corr_val:.3f} [{low:.3f}, {high:.3f}]")
     
     # Görselleştirmeler
     try:
@@ -322,9 +810,11 @@ def numerical_analysis(df):
         
         # Korelasyon heatmap
         if correlation_matrix is not None and plot_idx < len(axes):
-            sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', 
+            heatmap_matrix = correlation_heatmap_view(correlation_matrix)
+            sns.heatmap(heatmap_matrix, annot=len(heatmap_matrix) <= HEATMAP_ANNOT_COLUMNS, cmap='coolwarm', 
                        center=0, ax=axes[plot_idx], fmt='.2f')
-            axes[plot_idx].set_title('Korelasyon Haritası')
+            axes[plot_idx].set_title('Korelasyon Haritası' if len(heatmap_matrix) == len(correlation_matrix)
+                                     else f'Korelasyon Haritası (en ilişkili {len(heatmap_matrix)} sütun)')
             plot_idx += 1
         
         # Sayısal sütunların histogramları
@@ -347,150 +837,170 @@ def numerical_analysis(df):
         plt.show()
         
     except Exception as e:
-        print(f"Görselleştirme hatası: {e}")
+        logger.warning(f"Görselleştirme hatası: {e}")
     
     return correlation_matrix
 
-def text_analysis(df):
+def _text_column_summary(task):
+    """
+    Tek bir liste sütununu ayrıştırıp özetler (parallel_map işçisi)
+
+    Döndürür: (sonuç sözlüğü veya None, mesajlar)
+    """
+    col, series = task
+    messages = [f"\n {col} Analizi:", "-" * 40]
+    
+    # Temel istatistikler
+    total_count = len(series)
+    non_null_count = int(series.count())
+    null_count = total_count - non_null_count
+    
+    messages.append(f"Toplam değer: {total_count}")
+    messages.append(f"Geçerli değer: {non_null_count}")
+    messages.append(f"Boş değer: {null_count}")
+    
+    if non_null_count == 0:
+        messages.append("Bu sütunda hiç veri yok")
+        return None, messages
+    
+    # Virgülle ayrılmış değerleri tek geçişte parçala
+    parsed = tokenize_multi_value_column(series)
+    item_counts = parsed['item_counts']
+    total_items = parsed['total_items']
+    
+    if total_items == 0:
+        messages.append("Analiz edilecek geçerli veri bulunamadı")
+        return None, messages
+    
+    # İstatistikler
+    unique_items = len(item_counts)
+    avg_length = parsed['avg_item_length']
+    
+    messages.append(f"Toplam benzersiz değer: {unique_items}")
+    messages.append(f"Toplam parça sayısı: {total_items}")
+    messages.append(f"Ortalama değer uzunluğu: {avg_length:.1f} karakter")
+    messages.append(f"Satır başına ortalama değer: {total_items/non_null_count:.1f}")
+    
+    messages.append(f"\nEn sık görülen {min(10, len(item_counts))} değer:")
+    messages.append(str(item_counts.head(10)))
+    
+    return {
+        'item_counts': item_counts,
+        'unique_count': unique_items,
+        'total_items': total_items,
+        'avg_length': avg_length
+    }, messages
+
+def text_analysis(df, n_jobs=1, backend='process', sample=None, stratify=None, random_state=42):
     """
     Metin ve liste türündeki değişkenleri analiz eder
+
+    n_jobs > 1 ise sütunlar paralel ayrıştırılır (varsayılan process havuzu,
+    ayrıştırma Python ağırlıklıdır). sample verilirse (bkz. draw_sample)
+    analiz örneklem üzerinde yapılır.
     """
-    print("=" * 60)
-    print("METİN/LİSTE DEĞİŞKENLERİ ANALİZİ")
-    print("=" * 60)
+    logger.info("=" * 60)
+    logger.info("METİN/LİSTE DEĞİŞKENLERİ ANALİZİ")
+    logger.info("=" * 60)
+    
+    df, _ = _sampled(df, sample, stratify, random_state)
     
     # Text sütunlarını tespit et
     text_cols = []
-    potential_text_cols = ['KronikHastalik', 'Alerji', 'Tanilar', 'UygulamaYerleri']
-    
-    for col in potential_text_cols:
+    for col in LIST_COLUMNS:
         if col in df.columns:
             text_cols.append(col)
     
     if not text_cols:
-        print("Metin sütunu bulunamadı!")
+        logger.warning("Metin sütunu bulunamadı!")
         return {}
     
-    print(f"Bulunan metin sütunları: {text_cols}")
+    logger.info(f"Bulunan metin sütunları: {text_cols}")
     
+    # Sütunlar bağımsız ayrıştırılır (n_jobs > 1 ise paralel), sonuçlar sırayla birleştirilir
+    tasks = [(col, df[col]) for col in text_cols]
     results = {}
-    
-    for col in text_cols:
-        print(f"\n {col} Analizi:")
-        print("-" * 40)
-        
-        # Temel istatistikler
-        total_count = len(df[col])
-        non_null_values = df[col].dropna()
-        non_null_count = len(non_null_values)
-        null_count = total_count - non_null_count
-        
-        print(f"Toplam değer: {total_count}")
-        print(f"Geçerli değer: {non_null_count}")
-        print(f"Boş değer: {null_count}")
-        
-        if len(non_null_values) > 0:
-            # Virgülle ayrılmış değerleri parçala
-            all_items = []
-            for value in non_null_values:
-                if isinstance(value, str):
-                    if ',' in value:
-                        items = [item.strip() for item in value.split(',') if item.strip()]
-                        all_items.extend(items)
-                    elif value.strip():  
-                        all_items.append(value.strip())
-            
-            if all_items:
-                # İstatistikler
-                item_counts = pd.Series(all_items).value_counts()
-                unique_items = len(item_counts)
-                avg_length = pd.Series(all_items).str.len().mean()
-                
-                print(f"Toplam benzersiz değer: {unique_items}")
-                print(f"Toplam parça sayısı: {len(all_items)}")
-                print(f"Ortalama değer uzunluğu: {avg_length:.1f} karakter")
-                print(f"Satır başına ortalama değer: {len(all_items)/non_null_count:.1f}")
-                
-                print(f"\nEn sık görülen {min(10, len(item_counts))} değer:")
-                print(item_counts.head(10))
-                
-                results[col] = {
-                    'item_counts': item_counts,
-                    'unique_count': unique_items,
-                    'total_items': len(all_items),
-                    'avg_length': avg_length
-                }
-            else:
-                print("Analiz edilecek geçerli veri bulunamadı")
-                results[col] = None
-        else:
-            print("Bu sütunda hiç veri yok")
-            results[col] = None
+    for col, (result, messages) in zip(text_cols, parallel_map(_text_column_summary, tasks,
+                                                               n_jobs=n_jobs, backend=backend)):
+        print_messages(messages)
+        results[col] = result
     
     return results
 
-def complete_eda(df):
+def complete_eda(df, sample=None, stratify=None, random_state=42):
     """
     Kapsamlı EDA süreci 
+
+    sample verilirse (satır sayısı veya oran) tüm analizler tek bir
+    tekrarlanabilir örneklem üzerinde çalışır (draw_sample; stratify ile
+    örn. STRATIFY_COLUMNS katmanlarına göre). Raporlanan oran, ortalama,
+    median ve korelasyonlar güven aralıklarıyla verilir; süre veri
+    boyutundan çok örneklem boyutuna bağlıdır.
     """
     # Results klasörünü oluştur
     os.makedirs('results/plots', exist_ok=True)
     
-    print("KAPSAMLI KEŞİFSEL VERİ ANALİZİ BAŞLIYOR...")
-    print("="*80)
+    logger.info("KAPSAMLI KEŞİFSEL VERİ ANALİZİ BAŞLIYOR...")
+    logger.info("="*80)
     
     # Veri seti hakkında temel bilgi
-    print(f"Veri Seti Boyutu: {df.shape}")
-    print(f"Sütunlar: {list(df.columns)}")
-    print(f"Bellek Kullanımı: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    logger.info(f"Veri Seti Boyutu: {df.shape}")
+    logger.info(f"Sütunlar: {list(df.columns)}")
+    if is_verbose(logger):
+        logger.info(f"Bellek Kullanımı: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+    
+    # Örneklem bir kez çekilir; popülasyon boyutu alt analizlere açıkça verilir
+    dataset_info = {
+        'shape': df.shape,
+        'columns': list(df.columns),
+        'dtypes': df.dtypes.to_dict()
+    }
+    df, population = _sampled(df, sample, stratify, random_state)
+    dataset_info['sample_rows'] = len(df) if population is not None else None
     
     # 1. Eksik veri analizi
     try:
-        missing_df = missing_data_analysis(df)
+        missing_df = missing_data_analysis(df, population=population)
     except Exception as e:
-        print(f"Eksik veri analizi hatası: {e}")
+        logger.error(f"Eksik veri analizi hatası: {e}")
         missing_df = None
     
     # 2. Hedef değişken analizi
     try:
-        target_stats = target_analysis(df)
+        target_stats = target_analysis(df, population=population)
     except Exception as e:
-        print(f"Hedef değişken analizi hatası: {e}")
+        logger.error(f"Hedef değişken analizi hatası: {e}")
         target_stats = None
     
     # 3. Kategorik değişken analizi
     try:
-        categorical_analysis(df)
+        categorical_analysis(df, population=population)
     except Exception as e:
-        print(f"Kategorik değişken analizi hatası: {e}")
+        logger.error(f"Kategorik değişken analizi hatası: {e}")
     
     # 4. Sayısal değişken analizi
     try:
-        correlation_matrix = numerical_analysis(df)
+        correlation_matrix = numerical_analysis(df, population=population)
     except Exception as e:
-        print(f"Sayısal değişken analizi hatası: {e}")
+        logger.error(f"Sayısal değişken analizi hatası: {e}")
         correlation_matrix = None
     
     # 5. Metin değişken analizi
     try:
         text_results = text_analysis(df)
     except Exception as e:
-        print(f"Metin değişken analizi hatası: {e}")
+        logger.error(f"Metin değişken analizi hatası: {e}")
         text_results = {}
     
     # Sonuçları özetle
-    print("\n" + "="*80)
-    print("EDA TAMAMLANDI!")
-    print("="*80)
-    print("Tüm grafikler 'results/plots/' klasörüne kaydedildi.")
-    print("Analiz sonuçları aşağıdaki dictionary'de:")
+    logger.info("\n" + "="*80)
+    logger.info("EDA TAMAMLANDI!")
+    logger.info("="*80)
+    logger.info("Tüm grafikler 'results/plots/' klasörüne kaydedildi.")
+    logger.info("Analiz sonuçları aşağıdaki dictionary'de:")
     
     return {
-        'dataset_info': {
-            'shape': df.shape,
-            'columns': list(df.columns),
-            'dtypes': df.dtypes.to_dict()
-        },
+        'dataset_info': dataset_info,
         'missing_data': missing_df,
         'target_stats': target_stats,
         'correlations': correlation_matrix,
@@ -0,0 +1,411 @@
+import os
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from .data_loader import (
+    NUMERIC_COLUMNS,
+    clean_all_numeric_columns_advanced,
+    clean_categorical_columns,
+    clean_text_columns,
+    extract_numbers_from_text
+)
+from .logging_functions import get_logger, quiet
+from .partition_functions import median_from_counts
+from .preprocessing_functions import (
+    _mode_from_counts,
+    _outlier_info_from_counts,
+    _scaling_columns,
+    advanced_feature_engineering,
+    advanced_missing_value_handler,
+    feature_scaling,
+    outlier_detection_and_treatment,
+    smart_encoding
+)
+from .profiling_functions import profile_stage
+from .text_functions import LIST_COLUMNS, tokenize_multi_value_column
+
+logger = get_logger(__name__)
+
+# Durum formatı değiştiğinde artırılır; farklı sürümdeki durumla devam edilmez
+INCREMENTAL_VERSION = 3
+
+DEFAULT_STATE_FOLDER = 'results/incremental'
+# Küçük birikimli durum (frekans tabloları, kodlama, scaler); her güncellemede yeniden yazılır
+STATE_FILE = 'incremental_state.joblib'
+# Görülmüş satır anahtarları: sıralı parçalardan oluşan, sona eklenen uint64 dosyası
+SEEN_KEYS_FILE = 'seen_keys.u64'
+# KD-tree komşu kümesi (en fazla MAX_REFERENCE_ROWS satır)
+REFERENCE_FILE = 'reference_rows.npy'
+CLEANED_FILE = 'cleaned_dataset.csv'
+PROCESSED_FILE = 'full_preprocessed_data.csv'
+
+# KD-tree komşu kümesinin üst sınırı; aşılınca eksiksiz satırlardan rezervuar örneklemi tutulur
+MAX_REFERENCE_ROWS = 100_000
+
+# Tekilleştirme sütunları; None ise satırın tüm içeriği. HastaNo + TedaviAdi
+# bir tedavi bölümünü tanımlar ama bölümün her seansı ayrı bir satırdır, bu
+# yüzden anahtar tek başına tekrar kaydı belirlemez.
+DEDUP_KEYS = None
+
+def _key_hashes(df, dedup_keys):
+    """
+    Satır başına tekilleştirme anahtarı (uint64 hash; süreçten bağımsız)
+
+    dedup_keys None ise tüm sütunlar (ad sırasıyla) hash'lenir.
+    """
+    columns = sorted(df.columns) if dedup_keys is None else list(dedup_keys)
+    return pd.util.hash_pandas_object(df[columns], index=False).to_numpy()
+
+def _add_counts(counts, values):
+    """
+    Değer -> adet tablosuna yeni değerlerin frekanslarını ekler
+    """
+    new_counts = values.value_counts()
+    if counts is None:
+        return new_counts.astype(np.int64)
+    return counts.add(new_counts, fill_value=0).astype(np.int64)
+
+def load_incremental_state(state_folder=DEFAULT_STATE_FOLDER):
+    """
+    Kayıtlı artımlı durumu (ve KD-tree komşu kümesini) yükler; yoksa None döndürür
+
+    Görülmüş satır anahtarları belleğe alınmaz, _seen_mask ile dosya
+    üzerinden sorgulanır.
+    """
+    path = os.path.join(state_folder, STATE_FILE)
+    if not os.path.exists(path):
+        return None
+    state = joblib.load(path)
+    if state.get('version') != INCREMENTAL_VERSION:
+        raise ValueError(f"Desteklenmeyen artımlı durum sürümü: {state.get('version')} (beklenen {INCREMENTAL_VERSION})")
+    reference_path = os.path.join(state_folder, REFERENCE_FILE)
+    state['reference_rows'] = np.load(reference_path) if os.path.exists(reference_path) else None
+    return state
+
+def _replace_file(path, write):
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yazılır
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        write(f)
+    os.replace(temp_path, path)
+
+def _save_state(state, state_folder):
+    """
+    Küçük birikimli durumu ve KD-tree komşu kümesini ayrı dosyalara yazar
+    """
+    small_state = {key: value for key, value in state.items() if key != 'reference_rows'}
+    _replace_file(os.path.join(state_folder, STATE_FILE), lambda f: joblib.dump(small_state, f))
+    if state['reference_rows'] is not None:
+        _replace_file(os.path.join(state_folder, REFERENCE_FILE), lambda f: np.save(f, state['reference_rows']))
+
+def _seen_mask(keys, state, state_folder):
+    """
+    Anahtarların daha önce görülüp görülmediği
+
+    Anahtar dosyası sıralı parçalardan oluşur; her parçada searchsorted ile
+    aranır (parça sayısı O(log n)), dosya bellek eşlemeli okunur.
+    """
+    seen = np.zeros(len(keys), dtype=bool)
+    total = sum(state['seen_key_runs'])
+    if total == 0 or len(keys) == 0:
+        return seen
+    stored = np.memmap(os.path.join(state_folder, SEEN_KEYS_FILE), dtype=np.uint64, mode='r', shape=(total,))
+    start = 0
+    for length in state['seen_key_runs']:
+        run = stored[start:start + length]
+        positions = np.minimum(np.searchsorted(run, keys), length - 1)
+        seen |= run[positions] == keys
+        start += length
+    return seen
+
+def _append_seen_keys(new_keys, state, state_folder):
+    """
+    Yeni (sıralı, benzersiz) anahtarları anahtar dosyasına yeni bir parça olarak ekler
+
+    Son parça yeni parçadan büyük değilse ikisi searchsorted ile birleştirilir
+    (yeniden sıralama yapılmaz) ve dosyanın sonuna yeniden yazılır; böylece
+    parça sayısı logaritmik kalır, her anahtar O(log n) kez yeniden yazılır.
+    Dosya kayıtlı durumun bilmediği (yarım kalmış güncellemeden) baytları
+    içeriyorsa önce kesilir.
+    """
+    runs = state['seen_key_runs']
+    path = os.path.join(state_folder, SEEN_KEYS_FILE)
+    with open(path, 'r+b' if os.path.exists(path) else 'w+b') as f:
+        f.truncate(sum(runs) * 8)
+        run = new_keys
+        while runs and runs[-1] <= len(run):
+            length = runs.pop()
+            f.seek(sum(runs) * 8)
+            previous = np.fromfile(f, dtype=np.uint64, count=length)
+            run = np.insert(previous, np.searchsorted(previous, run), run)
+        if len(run):
+            f.seek(sum(runs) * 8)
+            f.write(run.tobytes())
+            runs.append(len(run))
+
+def _append_csv(df, path, columns, bootstrap):
+    """
+    Satırları kayıtlı çıktının sütun sırasıyla dosyaya ekler
+    """
+    df = df if bootstrap else df.reindex(columns=columns)
+    df.to_csv(path, mode='w' if bootstrap else 'a', header=bootstrap, index=False, encoding='utf-8')
+
+def _clean_delta(delta, state):
+    """
+    Sayısal metin sütunlarının çıkarılan değer frekanslarını günceller ve
+    yeni satırları birikimli medianlarla temizler
+    """
+    for col in NUMERIC_COLUMNS:
+        if col in delta.columns:
+            state['clean_counts'][col] = _add_counts(state['clean_counts'].get(col),
+                                                     extract_numbers_from_text(delta[col]).dropna())
+    medians = {col: median_from_counts(counts) for col, counts in state['clean_counts'].items()}
+
+    delta = clean_all_numeric_columns_advanced(delta, medians=medians, inplace=True)
+    delta = clean_categorical_columns(delta, inplace=True)
+    return clean_text_columns(delta, inplace=True)
+
+def _update_reference_rows(rows, state):
+    """
+    KD-tree komşu kümesine eksiksiz satırları ekler
+
+    Küme MAX_REFERENCE_ROWS satıra kadar büyür; sonrasında rezervuar
+    örneklemesiyle (Algorithm R) tüm eksiksiz satırlardan eşit olasılıklı bir
+    örneklem tutulur: i. satır (0'dan) MAX_REFERENCE_ROWS / (i + 1)
+    olasılıkla rastgele bir satırın yerine geçer.
+    """
+    reference = state['reference_rows']
+    seen = state['complete_rows_seen']
+    free = max(0, MAX_REFERENCE_ROWS - len(reference))
+    if free:
+        reference = np.vstack([reference, rows[:free]])
+    rest = rows[free:]
+    if len(rest):
+        slots = state['reference_rng'].integers(0, seen + free + np.arange(1, len(rest) + 1))
+        accepted = slots < MAX_REFERENCE_ROWS
+        reference[slots[accepted]] = rest[accepted]
+    state['reference_rows'] = reference
+    state['complete_rows_seen'] = seen + len(rows)
+
+def _impute_delta(delta, state, target_col, hasta_no):
+    """
+    Eksik değer durumunu (komşu kümesi, hedef medianı, modlar) günceller ve
+    yeni satırları doldurur
+    """
+    if state['impute_columns'] is None:
+        state['impute_columns'] = [col for col in delta.select_dtypes(include=[np.number]).columns
+                                   if col not in (target_col, hasta_no)]
+        n_columns = len(state['impute_columns'])
+        state['reference_rows'] = np.empty((0, n_columns))
+        state['column_sums'] = np.zeros(n_columns)
+        state['column_counts'] = np.zeros(n_columns)
+
+    # KD-tree komşu kümesi eksiksiz satırlardan, sütun ortalamaları birikimli toplamlardan
+    values = delta[state['impute_columns']].to_numpy(dtype=float)
+    missing = np.isnan(values)
+    _update_reference_rows(values[~missing.any(axis=1)], state)
+    state['column_sums'] += np.where(missing, 0.0, values).sum(axis=0)
+    state['column_counts'] += (~missing).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        column_means = state['column_sums'] / state['column_counts']
+
+    if target_col in delta.columns:
+        state['target_counts'] = _add_counts(state['target_counts'], delta[target_col].dropna())
+    modes = {}
+    for col in delta.select_dtypes(include=['object', 'category']).columns:
+        state['mode_counts'][col] = _add_counts(state['mode_counts'].get(col), delta[col].dropna())
+        modes[col] = _mode_from_counts(state['mode_counts'][col], delta[col].dtype)
+
+    return advanced_missing_value_handler(delta, target_col, hasta_no, inplace=True, imputation='tree',
+                                          medians={target_col: median_from_counts(state['target_counts'])},
+                                          imputer=(state['reference_rows'], column_means), modes=modes)
+
+def _treat_outliers(delta, state, target_col, hasta_no):
+    """
+    Doldurulmuş değer frekanslarından IQR sınırlarını günceller ve yeni satırlara uygular
+    """
+    for col in delta.select_dtypes(include=[np.number]).columns:
+        if col != hasta_no:
+            state['outlier_counts'][col] = _add_counts(state['outlier_counts'].get(col), delta[col])
+    outlier_info = _outlier_info_from_counts(state['outlier_counts'], state['n_rows'])
+    delta, _ = outlier_detection_and_treatment(delta, target_col, hasta_no, inplace=True, outlier_info=outlier_info)
+    state['outlier_info'] = outlier_info
+    return delta
+
+def _encode_delta(delta, state, target_col):
+    """
+    Frekans tablolarını günceller ve yeni satırları kayıtlı kodlama kararlarıyla kodlar
+
+    İlk çalıştırmada kararlar smart_encoding ile verilir. Sonraki
+    çalıştırmalarda kodlama tipi, top kategoriler ve one-hot sütunları sabit
+    kalır (çıktı şeması değişmez); yalnızca frekans eşlemeleri büyür.
+    """
+    if state['encoding_info'] is None:
+        delta, state['encoding_info'] = smart_encoding(delta, target_col, inplace=True)
+        state['frequency_counts'] = {col: pd.Series(info['frequency_map'], dtype=np.int64)
+                                     for col, info in state['encoding_info'].items()
+                                     if info['type'] == 'frequency_top'}
+        return delta
+
+    for col, info in state['encoding_info'].items():
+        if info['type'] == 'label':
+            unseen = set(delta[col].astype(str).unique()) - set(info['encoder'].classes_)
+            if unseen:
+                raise ValueError(f"{col} sütununda yeni kategori: {sorted(unseen)}; "
+                                 f"tüm geçmiş full_preprocessing_pipeline ile yeniden işlenmeli")
+        elif info['type'] == 'frequency_top':
+            state['frequency_counts'][col] = _add_counts(state['frequency_counts'][col], delta[col])
+            info['frequency_map'] = state['frequency_counts'][col].to_dict()
+
+    delta, _ = smart_encoding(delta, target_col, inplace=True, encoding_info=state['encoding_info'])
+    return delta
+
+def _scale_delta(delta, state, target_col, hasta_no, scaling_method):
+    """
+    Scaler'ı yeni satırlarla partial_fit ile günceller ve yeni satırları ölçekler
+    """
+    if state['n_updates'] == 0:
+        delta, state['scaler'] = feature_scaling(delta, target_col, hasta_no, scaling_method, inplace=True)
+        return delta
+    if state['scaler'] is not None:
+        feature_cols = _scaling_columns(delta, target_col, hasta_no)
+        state['scaler'].partial_fit(delta[feature_cols])
+        delta, _ = feature_scaling(delta, target_col, hasta_no, scaling_method, inplace=True, scaler=state['scaler'])
+    return delta
+
+def _update_item_counts(delta, state):
+    """
+    Liste sütunlarının parça sözlüklerini (multi-hot vocabulary) günceller
+    """
+    for col in LIST_COLUMNS:
+        if col in delta.columns:
+            item_counts = tokenize_multi_value_column(delta[col])['item_counts']
+            previous = state['item_counts'].get(col)
+            if previous is not None:
+                item_counts = previous.add(item_counts, fill_value=0).astype(np.int64)
+            state['item_counts'][col] = item_counts.sort_values(ascending=False, kind='stable')
+
+def _new_state(target_col, hasta_no, scaling_method, dedup_keys):
+    return {
+        'version': INCREMENTAL_VERSION,
+        'target_col': target_col,
+        'hasta_no': hasta_no,
+        'scaling_method': scaling_method,
+        'dedup_keys': None if dedup_keys is None else list(dedup_keys),
+        'n_rows': 0,
+        'n_updates': 0,
+        'seen_key_runs': [],
+        'clean_counts': {},
+        'impute_columns': None,
+        'reference_rows': None,
+        'complete_rows_seen': 0,
+        'reference_rng': np.random.default_rng(42),
+        'target_counts': None,
+        'mode_counts': {},
+        'outlier_counts': {},
+        'outlier_info': None,
+        'encoding_info': None,
+        'frequency_counts': {},
+        'scaler': None,
+        'item_counts': {},
+        'cleaned_columns': None,
+        'processed_columns': None
+    }
+
+def incremental_update(new_raw, state_folder=DEFAULT_STATE_FOLDER, target_col='TedaviSuresi', hasta_no='HastaNo',
+                       scaling_method='standard', dedup_keys=DEDUP_KEYS, profiler=None):
+    """
+    Yeni ham kayıtları (örn. günlük gelen tedavi kayıtları) yalnızca bu
+    satırları işleyerek temizlenmiş ve ön işlenmiş çıktılara ekler
+
+    state_folder'da durum yoksa new_raw tüm geçmiş olarak işlenir (ilk
+    çalıştırma) ve çıktılar baştan yazılır. Sonraki çalıştırmalarda:
+    - Daha önce alınmış bir satırın aynısı (varsayılan: tüm sütunlar; ya da
+      dedup_keys sütunları) yeniden gelirse atlanır ve uyarı yazılır. Devam
+      eden bir tedavi bölümünün yeni seansları alınır; aynı yığın içindeki
+      tekrarlar korunur.
+    - Birikimli durum yeni satırlarla güncellenir: temizleme medianları,
+      KD-tree komşu kümesi ve hedef medianı/modlar, IQR sınırları (değer
+      frekanslarından), smart_encoding frekans eşlemeleri, scaler
+      (partial_fit) ve liste sütunlarının parça sözlükleri.
+    - Yalnızca yeni satırlar güncel durumla dönüştürülüp
+      cleaned_dataset.csv ve full_preprocessed_data.csv dosyalarına eklenir.
+
+    Bir güncellemenin maliyeti geçmişin değil yeni yığının boyutuyla
+    orantılıdır: görülmüş anahtarlar sona eklenen sıralı parçalarda
+    searchsorted ile aranır (SEEN_KEYS_FILE), KD-tree komşu kümesi
+    MAX_REFERENCE_ROWS satırla sınırlıdır (aşılınca rezervuar örneklemi;
+    doldurulan değerler tüm eksiksiz satırlar yerine bu örneklemden gelir)
+    ve ayrı dosyada (REFERENCE_FILE) tutulur. STATE_FILE yalnızca frekans
+    tabloları, kodlama ve scaler gibi küçük durumu içerir.
+
+    Daha önce yazılmış satırlar yeniden dönüştürülmez; eski satırlar
+    yazıldıkları andaki durumla kodlanmış/ölçeklenmiş kalır. Kodlama
+    kararları (tip, top kategoriler, one-hot sütunları) ilk çalıştırmada
+    sabitlenir; ikili (label) bir sütunda yeni kategori gelirse ValueError
+    verilir. Sayısal imputation her zaman 'tree' yöntemiyle yapılır.
+
+    profiler (StageProfiler) verilirse aşama ölçümleri ona kaydedilir.
+    Döndürür: {'appended', 'skipped_duplicates', 'bootstrap', 'delta', 'state'}
+    """
+    state = load_incremental_state(state_folder)
+    bootstrap = state is None
+    if bootstrap:
+        state = _new_state(target_col, hasta_no, scaling_method, dedup_keys)
+    elif (state['target_col'], state['hasta_no'], state['scaling_method'], state['dedup_keys']) != \
+            (target_col, hasta_no, scaling_method, None if dedup_keys is None else list(dedup_keys)):
+        raise ValueError("Parametreler kayıtlı artımlı durumla uyuşmuyor; yeni bir state_folder kullanın")
+
+    logger.info(f"ARTIMLI GÜNCELLEME ({'ilk çalıştırma' if bootstrap else 'güncelleme ' + str(state['n_updates'])})")
+    logger.info("=" * 60)
+
+    # 1. Daha önce alınmış satırları atla
+    with profile_stage(profiler, 'dedup', new_raw) as stage:
+        keys = _key_hashes(new_raw, dedup_keys)
+        seen = _seen_mask(keys, state, state_folder)
+        delta = new_raw.loc[~seen].copy()
+        new_keys = np.unique(keys[~seen])
+        stage.output(delta)
+    skipped = int(seen.sum())
+    logger.info(f"Yeni satır: {len(delta)}, atlanan tekrar: {skipped}")
+    if skipped:
+        logger.warning(f"{skipped} satır daha önce alınmış kayıtların tekrarı, atlandı")
+
+    if len(delta) == 0:
+        return {'appended': 0, 'skipped_duplicates': skipped, 'bootstrap': bootstrap, 'delta': delta, 'state': state}
+    state['n_rows'] += len(delta)
+
+    # 2-7. Durumu güncelle ve yalnızca yeni satırları dönüştür (aşama mesajları bastırılır)
+    with quiet():
+        with profile_stage(profiler, 'cleaning', delta) as stage:
+            delta = stage.output(_clean_delta(delta, state))
+        cleaned = delta.copy()
+
+        with profile_stage(profiler, 'missing_values', delta) as stage:
+            delta = stage.output(_impute_delta(delta, state, target_col, hasta_no))
+        with profile_stage(profiler, 'outliers', delta) as stage:
+            delta = stage.output(_treat_outliers(delta, state, target_col, hasta_no))
+        with profile_stage(profiler, 'feature_engineering', delta) as stage:
+            delta = stage.output(advanced_feature_engineering(delta, inplace=True, target_col=target_col))
+        with profile_stage(profiler, 'encoding', delta) as stage:
+            delta = stage.output(_encode_delta(delta, state, target_col))
+        with profile_stage(profiler, 'scaling', delta) as stage:
+            delta = stage.output(_scale_delta(delta, state, target_col, hasta_no, scaling_method))
+        _update_item_counts(cleaned, state)
+
+    # 8. Kayıtlı çıktılara ekle ve durumu kaydet
+    with profile_stage(profiler, 'append', delta):
+        os.makedirs(state_folder, exist_ok=True)
+        if bootstrap:
+            state['cleaned_columns'] = cleaned.columns.tolist()
+            state['processed_columns'] = delta.columns.tolist()
+        _append_csv(cleaned, os.path.join(state_folder, CLEANED_FILE), state['cleaned_columns'], bootstrap)
+        _append_csv(delta, os.path.join(state_folder, PROCESSED_FILE), state['processed_columns'], bootstrap)
+        _append_seen_keys(new_keys, state, state_folder)
+        state['n_updates'] += 1
+        _save_state(state, state_folder)
+
+    logger.info(f"{len(delta)} satır {state_folder} çıktılarına eklendi (toplam {state['n_rows']} satır)")
+    return {'appended': len(delta), 'skipped_duplicates': skipped, 'bootstrap': bootstrap, 'delta': delta, 'state': state}
@@ -0,0 +1,101 @@
+import contextlib
+import logging
+import sys
+
+# Tüm modül logger'ları (src.data_loader, src.eda_functions ...) bu logger'ın altındadır
+PACKAGE_LOGGER = __name__.rsplit('.', 1)[0]
+
+# Varsayılan: eski print çıktısıyla aynı, yalnızca mesaj
+DEFAULT_FORMAT = '%(message)s'
+# Log toplayıcılar için yapılandırılmış format
+STRUCTURED_FORMAT = '%(asctime)s %(levelname)s %(name)s %(message)s'
+
+class _StdoutHandler(logging.StreamHandler):
+    """
+    Her kayıtta o anki sys.stdout'a yazan handler
+
+    Böylece Jupyter çıktısı ve contextlib.redirect_stdout, print'te olduğu
+    gibi çalışmaya devam eder.
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+def configure_logging(level='INFO', fmt=DEFAULT_FORMAT, stream=None):
+    """
+    Paket logger'ına bir çıktı handler'ı ekler (notebook/komut satırı için)
+
+    İçe aktarmada çağrılmaz; çağrılmazsa mesajlar uygulamanın (kök logger)
+    yapılandırmasına bırakılır. Çağrıldığında paket mesajları yalnızca bu
+    handler'a yazılır.
+
+    level: 'DEBUG', 'INFO', 'WARNING', ... veya 'quiet' (uyarılar ve hatalar).
+    fmt: log formatı (örn. STRUCTURED_FORMAT). stream verilmezse sys.stdout.
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    handler = _StdoutHandler() if stream is None else logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(fmt))
+    logger.addHandler(handler)
+    # Kök logger yapılandırılmışsa mesajlar iki kez yazılmasın
+    logger.propagate = False
+    set_verbosity(level)
+    return logger
+
+def set_verbosity(level):
+    """
+    Ayrıntı düzeyini değiştirir, önceki düzeyi döndürür
+
+    INFO altında (WARNING, 'quiet') yalnızca gösterim için yapılan ek
+    hesaplamalar (value_counts, nunique, örnek değerler ...) de atlanır.
+    'quiet' WARNING'dir: önbellek okuma, görselleştirme gibi uyarılar yazılmaya devam eder.
+    """
+    if isinstance(level, str):
+        level = logging.WARNING if level.lower() == 'quiet' else logging.getLevelName(level.upper())
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    previous = logger.level
+    logger.setLevel(level)
+    return previous
+
+@contextlib.contextmanager
+def verbosity(level):
+    """
+    Geçici ayrıntı düzeyi (örn. with verbosity('quiet'): ...)
+    """
+    previous = set_verbosity(level)
+    try:
+        yield
+    finally:
+        set_verbosity(previous)
+
+def get_logger(name):
+    """
+    Modül logger'ı (logger = get_logger(__name__))
+    """
+    return logging.getLogger(name)
+
+def is_verbose(logger):
+    """
+    INFO mesajları yazılacak mı; yalnızca gösterim için yapılan hesaplamalar
+    bu kontrolün arkasına alınır
+    """
+    return logger.isEnabledFor(logging.INFO)
+
+def quiet():
+    """
+    Sessiz mod bağlamı; yalnızca uyarılar ve hatalar yazılır
+    """
+    return verbosity('quiet')
+
+# Kütüphane olarak içe aktarıldığında uygulamanın log yapılandırmasına dokunulmaz
+logging.getLogger(PACKAGE_LOGGER).addHandler(logging.NullHandler())
@@ -0,0 +1,49 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .logging_functions import get_logger
+
+logger = get_logger(__name__)
+
+# 'thread': GIL'i bırakan pandas/NumPy işlemleri için
+# 'process': Python ağırlıklı metin ayrıştırma için (argümanlar pickle edilir)
+BACKENDS = ('thread', 'process')
+
+def resolve_n_jobs(n_jobs):
+    """
+    n_jobs değerini işçi sayısına çevirir (None/1: seri, -1: tüm çekirdekler)
+    """
+    cpu_count = os.cpu_count() or 1
+    if n_jobs is None:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpu_count + 1 + n_jobs)
+    return max(1, n_jobs)
+
+def parallel_map(func, items, n_jobs=1, backend='thread'):
+    """
+    func'u her öğeye uygular, sonuçları öğe sırasıyla döndürür
+
+    n_jobs=1 veya tek öğe varsa havuz kurulmadan seri çalışır. Sonuç sırası
+    işçi sayısından ve bitiş sırasından bağımsızdır (deterministik birleştirme).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"backend {BACKENDS} değerlerinden biri olmalı")
+
+    items = list(items)
+    n_workers = min(resolve_n_jobs(n_jobs), len(items))
+    if n_workers <= 1:
+        return [func(item) for item in items]
+
+    executor_class = ThreadPoolExecutor if backend == 'thread' else ProcessPoolExecutor
+    with executor_class(max_workers=n_workers) as executor:
+        return list(executor.map(func, items))
+
+def print_messages(messages):
+    """
+    İşçilerin döndürdüğü mesajları sırayla yazdırır
+
+    İşçiler doğrudan print etmez; çıktı sütun sırasıyla ve karışmadan yazılır.
+    """
+    for message in messages:
+        logger.info("%s", message)
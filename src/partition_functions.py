@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+
+# full_preprocessing_pipeline(partition_by=...) için bölümleme yöntemleri
+PARTITION_METHODS = ('Bolum', 'hash')
+
+def partition_positions(df, partition_by='Bolum', n_partitions=8, hasta_no='HastaNo'):
+    """
+    Satırları bölümlere ayırır, her bölüm için satır pozisyonlarını döndürür
+
+    partition_by='Bolum': her bölüm (klinik) ayrı bir parça
+    partition_by='hash': HastaNo'nun (süreçten bağımsız) pandas hash değerine
+    göre n_partitions parça; aynı hastanın tüm kayıtları aynı parçaya düşer.
+    Boş parçalar atlanır; pozisyonlar her parçada artan sıradadır.
+    """
+    if partition_by == 'Bolum':
+        codes, _ = pd.factorize(df['Bolum'], use_na_sentinel=False)
+    elif partition_by == 'hash':
+        hashes = pd.util.hash_pandas_object(df[hasta_no], index=False).to_numpy()
+        codes = (hashes % np.uint64(n_partitions)).astype(np.int64)
+    else:
+        raise ValueError(f"partition_by {PARTITION_METHODS} değerlerinden biri olmalı")
+
+    order = np.argsort(codes, kind='stable')
+    boundaries = np.flatnonzero(np.diff(codes[order])) + 1
+    return [positions for positions in np.split(order, boundaries) if len(positions) > 0]
+
+def value_counts_with_positions(series, positions):
+    """
+    Kısmi frekans tablosu: her değerin adedi ve ilk görüldüğü global satır pozisyonu
+
+    positions: serinin satırlarının tüm veri içindeki pozisyonları.
+    """
+    codes, uniques = pd.factorize(series)
+    valid = codes >= 0
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+    first_positions = np.full(len(uniques), np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(first_positions, codes[valid], np.asarray(positions)[valid])
+    return pd.DataFrame({'count': counts, 'first_position': first_positions},
+                        index=pd.Index(uniques, tupleize_cols=False))
+
+def merge_value_counts(partials):
+    """
+    Kısmi frekans tablolarını birleştirir
+
+    Sonuç değerleri tüm verideki ilk görülme sırasındadır; bu, pandas
+    value_counts'un eşit frekanslı değerleri sıralamasıyla aynı girdi sırasıdır.
+    """
+    combined = pd.concat(partials)
+    merged = combined.groupby(level=0, sort=False).agg({'count': 'sum', 'first_position': 'min'})
+    return merged.sort_values('first_position', kind='stable')
+
+def median_from_counts(counts):
+    """
+    Değer -> adet tablosundan Series.median ile aynı sonucu hesaplar
+    """
+    if len(counts) == 0:
+        return np.nan
+    counts = counts.sort_index()
+    cumulative = counts.to_numpy().cumsum()
+    total = cumulative[-1]
+    lower = counts.index[np.searchsorted(cumulative, (total - 1) // 2, side='right')]
+    upper = counts.index[np.searchsorted(cumulative, total // 2, side='right')]
+    return float((lower + upper) / 2)
+
+def quantile_from_counts(counts, q):
+    """
+    Değer -> adet tablosundan Series.quantile(q) ile aynı (doğrusal
+    interpolasyonlu) sonucu hesaplar
+
+    NumPy'nin 'linear' yöntemindeki indeks ve interpolasyon formülü birebir
+    uygulanır; sonuç tüm sütun sıralanarak bulunan değerle aynıdır.
+    """
+    if len(counts) == 0:
+        return np.nan
+    counts = counts.sort_index()
+    values = counts.index.to_numpy(dtype=float)
+    cumulative = counts.to_numpy().cumsum()
+    n = int(cumulative[-1])
+
+    virtual_index = np.float64((n - 1) * q)
+    previous = int(np.floor(virtual_index))
+    following = min(previous + 1, n - 1)
+    gamma = virtual_index - previous
+
+    a = values[np.searchsorted(cumulative, previous, side='right')]
+    b = values[np.searchsorted(cumulative, following, side='right')]
+    diff = b - a
+    if gamma >= 0.5:
+        return float(b - diff * (1 - gamma))
+    return float(a + diff * gamma)
+
+def partial_moments(values):
+    """
+    Sütun başına (adet, ortalama, kare sapma toplamı) kısmi momentleri
+    """
+    values = np.asarray(values, dtype=float)
+    count = (~np.isnan(values)).sum(axis=0)
+    mean = np.nanmean(values, axis=0) if len(values) else np.zeros(values.shape[1])
+    m2 = np.nansum((values - mean) ** 2, axis=0)
+    return count, mean, m2
+
+def merge_moments(partials):
+    """
+    Kısmi momentleri paralel varyans formülüyle (Chan vd.) birleştirir
+
+    Döndürür: (adet, ortalama, popülasyon varyansı)
+    """
+    count, mean, m2 = partials[0]
+    count, mean, m2 = count.astype(float), mean.copy(), m2.copy()
+    for other_count, other_mean, other_m2 in partials[1:]:
+        total = count + other_count
+        delta = other_mean - mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(total > 0, other_count / total, 0.0)
+        mean = mean + delta * weight
+        m2 = m2 + other_m2 + delta ** 2 * count * weight
+        count = total
+    with np.errstate(invalid='ignore', divide='ignore'):
+        variance = np.where(count > 0, m2 / count, 0.0)
+    return count, mean, variance
@@ -3,30 +3,280 @@ import numpy as np
 from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler, MinMaxScaler
 from sklearn.impute import SimpleImputer, KNNImputer
 from sklearn.model_selection import train_test_split
+from scipy import sparse
+from scipy.spatial import cKDTree
 import os
 import warnings
+
+from .artifact_functions import save_pipeline_artifacts
+from .cache_functions import StageCache, data_fingerprint, run_cached
+from .data_loader import (
+    OUTPUT_FORMATS,
+    clean_all_numeric_columns_advanced,
+    clean_categorical_columns,
+    clean_text_columns,
+    optimize_dtypes,
+    save_dataframe
+)
+from .logging_functions import get_logger, is_verbose, quiet
+from .parallel_functions import parallel_map
+from .partition_functions import (
+    partition_positions,
+    value_counts_with_positions,
+    merge_value_counts,
+    median_from_counts,
+    quantile_from_counts,
+    partial_moments,
+    merge_moments
+)
+from .profiling_functions import profile_stage, report_peak_rss_increase
+from .sketch_functions import build_category_sketches
+from .text_functions import LIST_COLUMNS, NULL_TOKENS, tokenize_multi_value_column
 warnings.filterwarnings('ignore')
 
-def advanced_missing_value_handler(df, target_col='TedaviSuresi',hasta_no='HastaNo'):
+logger = get_logger(__name__)
+
+# Seçilebilir sayısal imputation yöntemleri
+IMPUTATION_METHODS = ['knn', 'tree', 'group_median']
+
+# 'group_median' imputation'ın (en inceden kabaya) grup sütunları
+GROUP_COLUMNS = ('Bolum', 'TedaviAdi')
+
+# Özellik mühendisliği tanımları (PreprocessingTransformer da bunları kullanır)
+AGE_BINS = [0, 18, 30, 45, 60, 75, 100]
+AGE_LABELS = ['Çocuk', 'Genç_Yetişkin', 'Yetişkin', 'Orta_Yaş', 'Yaşlı', 'İleri_Yaş']
+ELDERLY_AGE = 65
+CHILD_AGE = 18
+TREATMENT_BINS = [0, 3, 7, 15, 30, float('inf')]
+TREATMENT_LABELS = ['Çok_Kısa', 'Kısa', 'Orta', 'Uzun', 'Çok_Uzun']
+LONG_TREATMENT_SESSIONS = 15
+HEALTH_FEATURES = ['KronikHastalik', 'Alerji', 'Tanilar']
+RISK_COLUMNS = ['Yasli_Mi', 'KronikHastalik_Var']
+
+# Aykırı değer oranı bu yüzdeye kadar olan sütunlar sınırlandırılır (hedef her durumda)
+OUTLIER_CLIP_PERCENT = 5
+
+# Model özelliklerinden çıkarılan sütun adı kalıpları
+MODEL_EXCLUDE_PATTERNS = ['HastaNo', 'Unnamed']
+
+# Bölümlenmiş ölçekleme ile tek süreçli StandardScaler arasındaki izin verilen
+# fark (np.allclose rtol/atol); parçalı momentler sklearn'ün toplama sırasını
+# yeniden üretemez, fark kayan nokta yuvarlaması (~1e-15) mertebesindedir
+PARTITION_SCALE_TOLERANCE = 1e-12
+
+def _tree_knn_impute(values, n_neighbors=5, reference=None, columns=None, trees=None):
+    """
+    KD-tree tabanlı KNN imputation (KNNImputer(keep_empty_features=True) ile
+    aynı çıktı sözleşmesi: aynı boyut, NaN kalmaz)
+
+    Komşular yalnızca eksiksiz satırlar arasından, satırın dolu sütunları
+    üzerindeki öklid mesafesine göre seçilir. Aynı eksiklik desenine sahip
+    satırlar tek sorguda işlenir; maliyet O(n log n) civarındadır. Hiç dolu
+    değeri olmayan sütunlar 0 ile doldurulur ve uyarı verilir.
+
+    reference: _tree_knn_reference ile tüm veriden hesaplanan (eksiksiz
+    satırlar, sütun ortalamaları); verilirse values yalnızca bir parçadır.
+    columns: uyarı mesajı için sütun adları.
+    trees: {eksiklik deseni: cKDTree} önbelleği; aynı reference ile tekrar
+    tekrar çağrılırken (örn. PreprocessingTransformer) her desenin ağacı bir
+    kez kurulur.
+    """
+    values = np.array(values, dtype=float)
+    if not np.isnan(values).any():
+        return values
+    
+    complete, column_means = reference if reference is not None else _tree_knn_reference(values)
+    
+    # Tamamen boş sütunlar (KNNImputer keep_empty_features=True gibi) 0 ile doldurulur
+    empty = np.isnan(column_means)
+    if empty.any():
+        names = np.asarray(columns if columns is not None else np.arange(values.shape[1]), dtype=object)[empty]
+        logger.warning(f"Hiç değeri olmayan sütunlar 0 ile dolduruldu: {list(names)}")
+        values[:, empty] = 0.0
+        column_means = np.where(empty, 0.0, column_means)
+    
+    missing = np.isnan(values)
+    incomplete_rows = np.where(missing.any(axis=1))[0]
+    if len(incomplete_rows) == 0:
+        return values
+    
+    # Eksiklik desenlerine göre grupla (tek satırda gruplama gerekmez)
+    if len(incomplete_rows) == 1:
+        patterns, pattern_ids = missing[incomplete_rows], np.zeros(1, dtype=np.intp)
+    else:
+        patterns, pattern_ids = np.unique(missing[incomplete_rows], axis=0, return_inverse=True)
+        pattern_ids = pattern_ids.ravel()
+    
+    for p, pattern in enumerate(patterns):
+        rows = incomplete_rows[pattern_ids == p]
+        observed = ~pattern
+        
+        # Hiç dolu sütun yoksa veya komşu yoksa sütun ortalaması
+        if not observed.any() or len(complete) == 0:
+            values[np.ix_(rows, pattern)] = column_means[pattern]
+            continue
+        
+        k = min(n_neighbors, len(complete))
+        tree = trees.get(observed.tobytes()) if trees is not None else None
+        if tree is None:
+            tree = cKDTree(complete[:, observed])
+            if trees is not None:
+                trees[observed.tobytes()] = tree
+        _, neighbors = tree.query(values[np.ix_(rows, observed)], k=k)
+        neighbors = neighbors.reshape(len(rows), k)
+        values[np.ix_(rows, pattern)] = complete[:, pattern][neighbors].mean(axis=1)
+    
+    return values
+
+def _tree_knn_reference(values):
+    """
+    _tree_knn_impute'un komşu kümesi: eksiksiz satırlar ve sütun ortalamaları
+
+    Tamamen boş sütunlar eksiksizlik kontrolüne girmez; komşu kümesinde 0'dır.
+    """
+    values = np.asarray(values, dtype=float)
+    missing = np.isnan(values)
+    empty = missing.all(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        column_means = np.where(empty, np.nan, np.nansum(values, axis=0) / (~missing).sum(axis=0))
+    complete = values[~missing[:, ~empty].any(axis=1)]
+    complete[:, empty] = 0.0
+    return complete, column_means
+
+def _group_keys(df, cols):
+    """
+    Grup anahtarları (nesne tipinde; category ve object sütunlar aynı eşleşir)
+    """
+    if len(cols) == 1:
+        return pd.Index(df[cols[0]].astype(object), name=cols[0])
+    return pd.MultiIndex.from_frame(df[cols].astype(object))
+
+def _group_median_impute(df, columns, group_cols, reference=None):
+    """
+    Grup bazlı median imputation
+
+    Önce tüm grup sütunlarına (örn. Bolum + TedaviAdi), sonra daha kaba
+    gruplara, en son global mediana göre doldurur.
+
+    reference: _group_median_reference ile eğitim verisinden hesaplanan grup
+    median tabloları; verilirse medianlar df'ten hesaplanmaz.
+    """
+    result = df[columns].astype(float)
+    if reference is not None:
+        levels, global_medians = reference
+        for cols, table in levels:
+            if not result.isnull().any().any():
+                break
+            group_medians = table.reindex(_group_keys(df, cols))
+            result = result.fillna(pd.DataFrame(group_medians.to_numpy(), index=result.index, columns=columns))
+        return result.fillna(global_medians)
+    
+    for level in range(len(group_cols), 0, -1):
+        if not result.isnull().any().any():
+            break
+        keys = [df[col] for col in group_cols[:level]]
+        group_medians = result.groupby(keys, dropna=False, observed=True).transform('median')
+        result = result.fillna(group_medians)
+    return result.fillna(result.median())
+
+def _group_median_reference(df, columns, group_cols):
+    """
+    _group_median_impute'un grup median tabloları (her grup seviyesi için) ve global medianlar
+
+    Her seviyenin tablosu, _group_median_impute'taki gibi bir önceki seviyede
+    doldurulmuş değerler üzerinden hesaplanır.
+    """
+    result = df[columns].astype(float)
+    levels = []
+    for level in range(len(group_cols), 0, -1):
+        cols = list(group_cols[:level])
+        table = result.groupby(_group_keys(df, cols), dropna=False).median()
+        levels.append((cols, table))
+        group_medians = table.reindex(_group_keys(df, cols))
+        result = result.fillna(pd.DataFrame(group_medians.to_numpy(), index=result.index, columns=columns))
+    return levels, result.median()
+
+def _imputation_columns(df, target_col='TedaviSuresi', hasta_no='HastaNo'):
+    """
+    Sayısal imputation sütunları (hedef ve hasta no hariç)
+    """
+    return [col for col in df.select_dtypes(include=[np.number]).columns if col not in (target_col, hasta_no)]
+
+def fit_missing_value_state(df, target_col='TedaviSuresi', hasta_no='HastaNo', imputation='knn',
+                            group_cols=GROUP_COLUMNS):
+    """
+    advanced_missing_value_handler'ın veriden öğrendiği durumu hesaplar
+
+    Döndürür: {'imputation', 'imputer', 'medians', 'modes'}. imputer, medians
+    ve modes advanced_missing_value_handler'a aynı adlı parametrelerle
+    verilir; böylece yeni kayıtlar (örn. puanlamada) eğitim durumuyla doldurulur.
+    """
+    if imputation not in IMPUTATION_METHODS:
+        raise ValueError(f"imputation {IMPUTATION_METHODS} değerlerinden biri olmalı")
+    
+    numerical_cols = _imputation_columns(df, target_col, hasta_no)
+    imputer = None
+    if numerical_cols:
+        if imputation == 'knn':
+            imputer = KNNImputer(n_neighbors=5).fit(df[numerical_cols])
+        elif imputation == 'tree':
+            imputer = _tree_knn_reference(df[numerical_cols].to_numpy(dtype=float))
+        else:
+            imputer = _group_median_reference(df, numerical_cols, [col for col in group_cols if col in df.columns])
+    
+    modes = {}
+    for col in df.select_dtypes(include=['object', 'category']).columns:
+        mode_val = df[col].mode()
+        modes[col] = mode_val.iloc[0] if len(mode_val) > 0 else 'Unknown'
+    
+    return {
+        'imputation': imputation,
+        'imputer': imputer,
+        'medians': {target_col: df[target_col].median()} if target_col in df.columns else {},
+        'modes': modes
+    }
+
+def advanced_missing_value_handler(df, target_col='TedaviSuresi',hasta_no='HastaNo', inplace=False,
+                                   imputation='knn', group_cols=GROUP_COLUMNS, medians=None,
+                                   imputer=None, modes=None):
     """
-    eksik değer işleme stratejileri
+    eksik değer işleme stratejileri (inplace=True ise kopya alınmaz)
+
+    imputation sayısal sütunların doldurma yöntemini seçer:
+    - 'knn': sklearn KNNImputer (5 komşu, O(n²) mesafe hesabı)
+    - 'tree': eksiksiz satırlar üzerinde KD-tree ile 5 komşu (büyük veri için)
+    - 'group_median': group_cols gruplarının medianı
+
+    medians: önceden hesaplanmış {sütun: median} sözlüğü (örn. parçalar
+    üzerinde oluşturulan QuantileSketch'lerden); hedef değişken bu değerle
+    doldurulur.
+
+    imputer ve modes, başka bir veriden (tüm veri, eğitim verisi) öğrenilen
+    durumdur (bkz. fit_missing_value_state): imputer 'knn' için fit edilmiş
+    KNNImputer, 'tree' için _tree_knn_reference, 'group_median' için
+    _group_median_reference sonucu; modes ise {sütun: mod} sözlüğü. Verilirse
+    df yalnızca bir parça veya yeni kayıtlar olarak işlenir.
     """
-    print("Eksik veri analizi...")
-    print("="*50)
+    logger.info("Eksik veri analizi...")
+    logger.info("="*50)
     
-    df_cleaned = df.copy()
+    if imputation not in IMPUTATION_METHODS:
+        raise ValueError(f"imputation {IMPUTATION_METHODS} değerlerinden biri olmalı")
     
-    # Eksik değer durumunu analiz et
-    missing_info = df_cleaned.isnull().sum()
-    total_rows = len(df_cleaned)
+    df_cleaned = df if inplace else df.copy()
     
-    print("Eksik Değer Durumu:")
-    print("-" * 30)
-    for col in missing_info.index:
-        missing_count = missing_info[col]
-        missing_percent = (missing_count / total_rows) * 100
-        if missing_count > 0:
-            print(f"{col}: {missing_count} (%{missing_percent:.1f})")
+    # Eksik değer durumunu analiz et (yalnızca rapor için)
+    if is_verbose(logger):
+        missing_info = df_cleaned.isnull().sum()
+        total_rows = len(df_cleaned)
+        
+        logger.info("Eksik Değer Durumu:")
+        logger.info("-" * 30)
+        for col in missing_info.index:
+            missing_count = missing_info[col]
+            missing_percent = (missing_count / total_rows) * 100
+            if missing_count > 0:
+                logger.info(f"{col}: {missing_count} (%{missing_percent:.1f})")
     
     # Sayısal değişkenler için KNN imputation
     numerical_cols = df_cleaned.select_dtypes(include=[np.number]).columns.tolist()
@@ -37,163 +287,226 @@ def advanced_missing_value_handler(df, target_col='TedaviSuresi',hasta_no='Hasta
         numerical_cols.remove(hasta_no)  
     
     if len(numerical_cols) > 0:
-        print(f"\n Sayısal sütunlar için KNN imputation: {numerical_cols}")
+        logger.info(f"\n Sayısal sütunlar için {imputation} imputation: {numerical_cols}")
         
-        # KNN Imputer (5 komşu)
-        knn_imputer = KNNImputer(n_neighbors=5)
-        df_cleaned[numerical_cols] = knn_imputer.fit_transform(df_cleaned[numerical_cols])
+        if imputation == 'knn':
+            # KNN Imputer (5 komşu)
+            if imputer is not None:
+                df_cleaned[numerical_cols] = imputer.transform(df_cleaned[numerical_cols])
+            else:
+                knn_imputer = KNNImputer(n_neighbors=5)
+                df_cleaned[numerical_cols] = knn_imputer.fit_transform(df_cleaned[numerical_cols])
+        elif imputation == 'tree':
+            df_cleaned[numerical_cols] = _tree_knn_impute(df_cleaned[numerical_cols].to_numpy(dtype=float),
+                                                          reference=imputer, columns=numerical_cols)
+        else:
+            available_groups = [col for col in group_cols if col in df_cleaned.columns]
+            df_cleaned[numerical_cols] = _group_median_impute(df_cleaned, numerical_cols, available_groups,
+                                                              reference=imputer)
         
-        print("Sayısal değişkenler KNN ile dolduruldu")
+        logger.info(f"Sayısal değişkenler {imputation} ile dolduruldu")
     
     # Hedef değişken için median imputation
     if target_col in df_cleaned.columns and df_cleaned[target_col].isnull().sum() > 0:
-        median_val = df_cleaned[target_col].median()
-        df_cleaned[target_col].fillna(median_val, inplace=True)
-        print(f"{target_col} median ile dolduruldu: {median_val}")
+        if medians is not None and target_col in medians:
+            median_val = medians[target_col]
+        else:
+            median_val = df_cleaned[target_col].median()
+        df_cleaned[target_col] = df_cleaned[target_col].fillna(median_val)
+        logger.info(f"{target_col} median ile dolduruldu: {median_val}")
     
     # Kategorik değişkenler için mode imputation
-    categorical_cols = df_cleaned.select_dtypes(include=['object']).columns
+    categorical_cols = df_cleaned.select_dtypes(include=['object', 'category']).columns
     for col in categorical_cols:
         if df_cleaned[col].isnull().sum() > 0:
-            mode_val = df_cleaned[col].mode()
-            if len(mode_val) > 0:
-                df_cleaned[col].fillna(mode_val.iloc[0], inplace=True)
+            if modes is not None and col in modes:
+                mode_val = modes[col]
             else:
-                df_cleaned[col].fillna('Unknown', inplace=True)
-            print(f"{col} mode ile dolduruldu")
+                mode_val = df_cleaned[col].mode()
+                mode_val = mode_val.iloc[0] if len(mode_val) > 0 else 'Unknown'
+            df_cleaned[col] = df_cleaned[col].fillna(mode_val)
+            logger.info(f"{col} mode ile dolduruldu")
     
     return df_cleaned
 
-def advanced_feature_engineering(df):
+def advanced_feature_engineering(df, inplace=False, target_col='TedaviSuresi'):
     """
-    özellik mühendisliği
+    özellik mühendisliği (inplace=True ise kopya alınmaz)
     """
-    print("\n ÖZELLİK MÜHENDİSLİĞİ...")
-    print("="*50)
+    logger.info("\n ÖZELLİK MÜHENDİSLİĞİ...")
+    logger.info("="*50)
     
-    df_engineered = df.copy()
+    initial_column_count = len(df.columns)
+    df_engineered = df if inplace else df.copy()
     
     # 1. Yaş bazlı özellikler
     if 'Yas' in df_engineered.columns:
-        print(" Yaş bazlı özellikler oluşturuluyor...")
+        logger.info(" Yaş bazlı özellikler oluşturuluyor...")
         
         # Yaş grupları
-        bins = [0, 18, 30, 45, 60, 75, 100]
-        labels = ['Çocuk', 'Genç_Yetişkin', 'Yetişkin', 'Orta_Yaş', 'Yaşlı', 'İleri_Yaş']
-        df_engineered['Yas_Grubu'] = pd.cut(df_engineered['Yas'], bins=bins, labels=labels, right=False)
+        df_engineered['Yas_Grubu'] = pd.cut(df_engineered['Yas'], bins=AGE_BINS, labels=AGE_LABELS, right=False)
         
         # Yaşlı mı? (65+ yaş)
-        df_engineered['Yasli_Mi'] = (df_engineered['Yas'] >= 65).astype(int)
+        df_engineered['Yasli_Mi'] = (df_engineered['Yas'] >= ELDERLY_AGE).astype(int)
         
         # Çocuk mu? (18- yaş)
-        df_engineered['Cocuk_Mu'] = (df_engineered['Yas'] < 18).astype(int)
+        df_engineered['Cocuk_Mu'] = (df_engineered['Yas'] < CHILD_AGE).astype(int)
         
-        print(f" Yaş grupları: {df_engineered['Yas_Grubu'].value_counts().to_dict()}")
+        if is_verbose(logger):
+            logger.info(f" Yaş grupları: {df_engineered['Yas_Grubu'].value_counts().to_dict()}")
     
     # 2. Tedavi süresi bazlı özellikler
-    if 'TedaviSuresi' in df_engineered.columns:
-        print("\n Tedavi süresi bazlı özellikler oluşturuluyor...")
+    if target_col in df_engineered.columns:
+        logger.info("\n Tedavi süresi bazlı özellikler oluşturuluyor...")
         
         # Tedavi kategorileri
-        tedavi_bins = [0, 3, 7, 15, 30, float('inf')]
-        tedavi_labels = ['Çok_Kısa', 'Kısa', 'Orta', 'Uzun', 'Çok_Uzun']
-        df_engineered['Tedavi_Kategori'] = pd.cut(df_engineered['TedaviSuresi'], 
-                                                bins=tedavi_bins, labels=tedavi_labels, right=False)
+        df_engineered['Tedavi_Kategori'] = pd.cut(df_engineered[target_col], 
+                                                bins=TREATMENT_BINS, labels=TREATMENT_LABELS, right=False)
         
         # Uzun tedavi mi? (15+ seans)
-        df_engineered['Uzun_Tedavi'] = (df_engineered['TedaviSuresi'] >= 15).astype(int)
+        df_engineered['Uzun_Tedavi'] = (df_engineered[target_col] >= LONG_TREATMENT_SESSIONS).astype(int)
         
-        print(f" Tedavi kategorileri: {df_engineered['Tedavi_Kategori'].value_counts().to_dict()}")
+        if is_verbose(logger):
+            logger.info(f" Tedavi kategorileri: {df_engineered['Tedavi_Kategori'].value_counts().to_dict()}")
     
     # 3. Sağlık durumu bazlı özellikler
-    health_features = ['KronikHastalik', 'Alerji', 'Tanilar']
-    
-    for col in health_features:
+    for col in HEALTH_FEATURES:
         if col in df_engineered.columns:
-            print(f"\n {col} için özellikler oluşturuluyor...")
-            
-            # Var mı yok mu?
-            df_engineered[f'{col}_Var'] = df_engineered[col].apply(
-                lambda x: 1 if pd.notna(x) and isinstance(x, str) and x.strip() and x.strip().lower() not in ['yok', 'none', 'nan'] else 0
-            )
-            
-            # Sayısı (virgülle ayrılmış)
-            df_engineered[f'{col}_Sayisi'] = df_engineered[col].apply(
-                lambda x: len([item.strip() for item in str(x).split(',') if item.strip()]) if pd.notna(x) and str(x).lower() not in ['yok', 'none', 'nan'] else 0
-            )
+            logger.info(f"\n {col} için özellikler oluşturuluyor...")
             
-            # Uzunluğu (karakter sayısı)
-            df_engineered[f'{col}_Uzunluk'] = df_engineered[col].apply(
-                lambda x: len(str(x)) if pd.notna(x) else 0
-            )
+            # Tek geçişte ayrıştır: var mı, sayısı (virgülle ayrılmış), uzunluğu (karakter sayısı)
+            features = tokenize_multi_value_column(df_engineered[col])['features']
+            df_engineered[f'{col}_Var'] = features['Var']
+            df_engineered[f'{col}_Sayisi'] = features['Sayisi']
+            df_engineered[f'{col}_Uzunluk'] = features['Uzunluk']
             
-            print(f" {col} için 3 yeni özellik oluşturuldu")
+            logger.info(f" {col} için 3 yeni özellik oluşturuldu")
     
     # 4. Kombinasyon özellikleri
-    print(f"\n Kombinasyon özellikleri oluşturuluyor...")
+    logger.info(f"\n Kombinasyon özellikleri oluşturuluyor...")
     
     # Toplam sağlık sorunu
     health_cols = [col for col in df_engineered.columns if col.endswith('_Sayisi')]
     if health_cols:
         df_engineered['Toplam_Saglik_Sorunu'] = df_engineered[health_cols].sum(axis=1)
-        print(f" Toplam sağlık sorunu özelliği oluşturuldu")
+        logger.info(f" Toplam sağlık sorunu özelliği oluşturuldu")
     
     # Yüksek riskli hasta
-    risk_conditions = []
-    if 'Yasli_Mi' in df_engineered.columns:
-        risk_conditions.append('Yasli_Mi')
-    if 'KronikHastalik_Var' in df_engineered.columns:
-        risk_conditions.append('KronikHastalik_Var')
+    risk_conditions = [col for col in RISK_COLUMNS if col in df_engineered.columns]
     
     if risk_conditions:
         df_engineered['Yuksek_Riskli'] = df_engineered[risk_conditions].sum(axis=1)
         df_engineered['Yuksek_Riskli'] = (df_engineered['Yuksek_Riskli'] >= 1).astype(int)
-        print(f" Yüksek riskli hasta özelliği oluşturuldu")
+        logger.info(f" Yüksek riskli hasta özelliği oluşturuldu")
     
-    print(f"\n Toplam {len(df_engineered.columns) - len(df.columns)} yeni özellik oluşturuldu!")
+    logger.info(f"\n Toplam {len(df_engineered.columns) - initial_column_count} yeni özellik oluşturuldu!")
     return df_engineered
 
-def smart_encoding(df, target_col='TedaviSuresi'):
+def _add_columns(df, new_columns, inplace):
+    """
+    Yeni sütunları ekler; inplace=True ise yeni DataFrame oluşturmadan atar
+    """
+    if inplace:
+        df[new_columns.columns] = new_columns
+        return df
+    return pd.concat([df, new_columns], axis=1)
+
+def _value_counts(series):
     """
-    Akıllı kategorik değişken kodlama
+    value_counts; category sütunlarda da eşit frekanslı değerlerin ilk görülme sırasını korur
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = series.cat.codes.value_counts()
+        counts = counts[counts.index >= 0]
+        counts.index = series.cat.categories[counts.index]
+        return counts
+    return series.value_counts()
+
+def smart_encoding(df, target_col='TedaviSuresi', inplace=False, encoding_info=None, approximate=False,
+                   sketches=None):
+    """
+    Akıllı kategorik değişken kodlama (inplace=True ise kopya alınmaz)
+
+    encoding_info verilirse (örn. bölümlenmiş çalıştırmada tüm veriden
+    birleştirilen) kodlama kararları yeniden hesaplanmaz; one-hot sütunları
+    encoding_info'daki sütun listesine göre hizalanır.
+
+    approximate=True ise kodlama tipi HyperLogLog benzersiz sayısından, top
+    kategoriler Space-Saving özetinden, frekanslar Count-Min tahminlerinden
+    belirlenir (CategorySketch). sketches verilirse (örn. bellek dışı veride
+    parçalar üzerinde build_category_sketches ile oluşturulup birleştirilen)
+    bunlar kullanılır.
+
+    encoding_info ile kodlamada ikili (label) sütunlarda öğrenilmemiş
+    değerler -1 olur (PreprocessingTransformer ile aynı).
     """
-    print("\n AKILLI KATEGORİK KODLAMA...")
-    print("="*40)
+    logger.info("\n AKILLI KATEGORİK KODLAMA...")
+    logger.info("="*40)
     
-    df_encoded = df.copy()
-    encoding_info = {}
+    df_encoded = df if inplace else df.copy()
+    fitted = encoding_info is not None
+    if not fitted:
+        encoding_info = {}
     
     # Kategorik sütunları tespit et
     categorical_cols = df_encoded.select_dtypes(include=['object', 'category']).columns.tolist()
+    if fitted:
+        categorical_cols = list(encoding_info)
+    elif sketches is None and approximate:
+        sketches = build_category_sketches(df_encoded, categorical_cols)
     
     for col in categorical_cols:
-        unique_count = df_encoded[col].nunique()
-        print(f"\n {col} - Benzersiz değer: {unique_count}")
+        if fitted:
+            encoding_type = encoding_info[col]['type']
+        else:
+            unique_count = df_encoded[col].nunique() if sketches is None else sketches[col].distinct_count()
+            logger.info(f"\n {col} - Benzersiz değer: {unique_count}")
+            encoding_type = 'label' if unique_count <= 2 else 'onehot' if unique_count <= 10 else 'frequency_top'
         
-        if unique_count <= 2:
+        if encoding_type == 'label':
             # Binary encoding
-            print(f"Binary Label Encoding")
-            le = LabelEncoder()
-            df_encoded[f'{col}_encoded'] = le.fit_transform(df_encoded[col].astype(str))
-            encoding_info[col] = {'type': 'label', 'encoder': le}
+            logger.info(f"Binary Label Encoding")
+            if fitted:
+                classes = pd.Index(encoding_info[col]['encoder'].classes_)
+                df_encoded[f'{col}_encoded'] = classes.get_indexer(df_encoded[col].astype(str))
+            else:
+                le = LabelEncoder()
+                df_encoded[f'{col}_encoded'] = le.fit_transform(df_encoded[col].astype(str))
+                encoding_info[col] = {'type': 'label', 'encoder': le}
             
-        elif unique_count <= 10:
+        elif encoding_type == 'onehot':
             # One-hot encoding
-            print(f"One-Hot Encoding")
-            dummies = pd.get_dummies(df_encoded[col], prefix=col, drop_first=True)
-            df_encoded = pd.concat([df_encoded, dummies], axis=1)
-            encoding_info[col] = {'type': 'onehot', 'columns': dummies.columns.tolist()}
+            logger.info(f"One-Hot Encoding")
+            if fitted:
+                dummies = pd.get_dummies(df_encoded[col], prefix=col).reindex(
+                    columns=encoding_info[col]['columns'], fill_value=False)
+            else:
+                dummies = pd.get_dummies(df_encoded[col], prefix=col, drop_first=True)
+                encoding_info[col] = {'type': 'onehot', 'columns': dummies.columns.tolist()}
+            df_encoded = _add_columns(df_encoded, dummies, inplace)
             
         else:
             # Target encoding için en sık görülen kategorileri al
-            print(f"Frequency + Top Categories Encoding")
+            logger.info(f"Frequency + Top Categories Encoding")
             
             # Frekans encoding
-            freq_map = df_encoded[col].value_counts().to_dict()
+            if fitted:
+                freq_map = encoding_info[col]['frequency_map']
+                top_categories = encoding_info[col]['top_categories']
+            elif sketches is not None:
+                freq_map = sketches[col].frequency_map(df_encoded[col])
+                top_categories = sketches[col].top(10).index.tolist()
+            else:
+                value_counts = _value_counts(df_encoded[col])
+                freq_map = value_counts.to_dict()
+                # En sık görülen 10 kategori
+                top_categories = value_counts.head(10).index.tolist()
+            
             df_encoded[f'{col}_frequency'] = df_encoded[col].map(freq_map)
+            if isinstance(df_encoded[f'{col}_frequency'].dtype, pd.CategoricalDtype):
+                # category sütunlarda map sonucu da category olur
+                df_encoded[f'{col}_frequency'] = df_encoded[f'{col}_frequency'].astype('int64')
             
-            # En sık görülen 10 kategori
-            top_categories = df_encoded[col].value_counts().head(10).index.tolist()
             df_encoded[f'{col}_is_top'] = df_encoded[col].apply(
                 lambda x: 1 if x in top_categories else 0
             )
@@ -203,29 +516,28 @@ def smart_encoding(df, target_col='TedaviSuresi'):
                 lambda x: x if x in top_categories else 'Other'
             )
             
-            dummies = pd.get_dummies(df_encoded[f'{col}_top_category'], prefix=f'{col}_top', drop_first=True)
-            df_encoded = pd.concat([df_encoded, dummies], axis=1)
-            
-            encoding_info[col] = {
-                'type': 'frequency_top',
-                'top_categories': top_categories,
-                'frequency_map': freq_map
-            }
+            if fitted:
+                dummies = pd.get_dummies(df_encoded[f'{col}_top_category'], prefix=f'{col}_top').reindex(
+                    columns=encoding_info[col]['top_columns'], fill_value=False)
+            else:
+                dummies = pd.get_dummies(df_encoded[f'{col}_top_category'], prefix=f'{col}_top', drop_first=True)
+                encoding_info[col] = {
+                    'type': 'frequency_top',
+                    'top_categories': top_categories,
+                    'frequency_map': freq_map,
+                    'top_columns': dummies.columns.tolist()
+                }
+            df_encoded = _add_columns(df_encoded, dummies, inplace)
     
-    print(f"\n {len(categorical_cols)} kategorik değişken kodlandı!")
+    logger.info(f"\n {len(categorical_cols)} kategorik değişken kodlandı!")
     return df_encoded, encoding_info
 
-def feature_scaling(df, target_col='TedaviSuresi',hasta_no='HastaNo', scaling_method='standard'):
+def _scaling_columns(df, target_col='TedaviSuresi', hasta_no='HastaNo'):
     """
-    Özellik ölçeklendirme
+    Ölçeklendirilecek sütunlar (sayısal; hedef, hasta no ve 0-1 kodlu sütunlar hariç)
     """
-    print(f"\n ÖZELLİK ÖLÇEKLENDİRME ({scaling_method.upper()})...")
-    print("="*40)
-    
-    df_scaled = df.copy()
-    
     # Sayısal sütunları al (hedef değişken ve hasta no hariç)
-    numerical_cols = df_scaled.select_dtypes(include=[np.number]).columns.tolist()
+    numerical_cols = df.select_dtypes(include=[np.number]).columns.tolist()
     
     # Hedef değişkeni çıkar
     if target_col in numerical_cols:
@@ -237,80 +549,128 @@ def feature_scaling(df, target_col='TedaviSuresi',hasta_no='HastaNo', scaling_me
         
     # Encoded sütunları (0-1 arası) çıkar
     encoded_cols = [col for col in numerical_cols if any(x in col.lower() for x in ['_encoded', '_var', '_mu', '_mi'])]
-    feature_cols = [col for col in numerical_cols if col not in encoded_cols]
+    return [col for col in numerical_cols if col not in encoded_cols]
+
+def feature_scaling(df, target_col='TedaviSuresi',hasta_no='HastaNo', scaling_method='standard', inplace=False,
+                    scaler=None):
+    """
+    Özellik ölçeklendirme (inplace=True ise kopya alınmaz)
+
+    scaler verilirse (fit edilmiş) yeniden fit edilmez, yalnızca transform uygulanır.
+    """
+    logger.info(f"\n ÖZELLİK ÖLÇEKLENDİRME ({scaling_method.upper()})...")
+    logger.info("="*40)
+    
+    df_scaled = df if inplace else df.copy()
+    feature_cols = _scaling_columns(df_scaled, target_col, hasta_no)
     
     if len(feature_cols) > 0:
-        print(f" Ölçeklendirilecek sütunlar: {feature_cols}")
+        logger.info(f" Ölçeklendirilecek sütunlar: {feature_cols}")
         
-        if scaling_method == 'standard':
-            scaler = StandardScaler()
-        elif scaling_method == 'minmax':
-            scaler = MinMaxScaler()
+        if scaler is not None:
+            df_scaled[feature_cols] = scaler.transform(df_scaled[feature_cols])
         else:
-            raise ValueError("scaling_method 'standard' veya 'minmax' olmalı")
-        
-        df_scaled[feature_cols] = scaler.fit_transform(df_scaled[feature_cols])
+            if scaling_method == 'standard':
+                scaler = StandardScaler()
+            elif scaling_method == 'minmax':
+                scaler = MinMaxScaler()
+            else:
+                raise ValueError("scaling_method 'standard' veya 'minmax' olmalı")
+            
+            df_scaled[feature_cols] = scaler.fit_transform(df_scaled[feature_cols])
         
-        print(f" {len(feature_cols)} özellik {scaling_method} scaler ile ölçeklendirildi!")
+        logger.info(f" {len(feature_cols)} özellik {scaling_method} scaler ile ölçeklendirildi!")
         
         # Ölçeklendirme istatistikleri
-        print(f"\nÖlçeklendirme Sonrası İstatistikler:")
-        print(f"Ortalama: {df_scaled[feature_cols].mean().mean():.3f}")
-        print(f"Standart sapma: {df_scaled[feature_cols].std().mean():.3f}")
+        if is_verbose(logger):
+            logger.info(f"\nÖlçeklendirme Sonrası İstatistikler:")
+            logger.info(f"Ortalama: {df_scaled[feature_cols].mean().mean():.3f}")
+            logger.info(f"Standart sapma: {df_scaled[feature_cols].std().mean():.3f}")
         
         return df_scaled, scaler
     else:
-        print("Ölçeklendirilecek sayısal özellik bulunamadı!")
+        logger.warning("Ölçeklendirilecek sayısal özellik bulunamadı!")
         return df_scaled, None
 
-def outlier_detection_and_treatment(df, target_col='TedaviSuresi',hasta_no='HastaNo', method='iqr'):
+def _outlier_bounds_vectorized(values, method, known_quartiles=None):
     """
-    Aykırı değer tespiti ve işleme
+    Tüm sayısal sütunların sınırlarını tek bir 2-D NumPy geçişinde hesaplar
+
+    known_quartiles: sütun sırasına göre (Q1, Q3) veya None listesi; verilen
+    sütunlar için kantiller yeniden hesaplanmaz.
     """
-    print(f"\n AYKIRI DEĞER TESPİTİ VE İŞLEME ({method.upper()})...")
-    print("="*50)
+    if method == 'iqr':
+        if known_quartiles is None:
+            q1, q3 = np.nanquantile(values, [0.25, 0.75], axis=0)
+        else:
+            q1 = np.array([np.nan if known is None else known[0] for known in known_quartiles])
+            q3 = np.array([np.nan if known is None else known[1] for known in known_quartiles])
+            unknown = [i for i, known in enumerate(known_quartiles) if known is None]
+            if unknown:
+                q1[unknown], q3[unknown] = np.nanquantile(values[:, unknown], [0.25, 0.75], axis=0)
+        iqr = q3 - q1
+        return q1 - 1.5 * iqr, q3 + 1.5 * iqr
+    elif method == 'zscore':
+        mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0, ddof=1)
+        return mean - 3 * std, mean + 3 * std
+    raise ValueError("method 'iqr' veya 'zscore' olmalı")
+
+def outlier_detection_and_treatment(df, target_col='TedaviSuresi',hasta_no='HastaNo', method='iqr', inplace=False,
+                                    vectorized=True, quartiles=None, n_jobs=1, outlier_info=None):
+    """
+    Aykırı değer tespiti ve işleme (inplace=True ise kopya alınmaz)
+
+    vectorized=True ise Q1/Q3 (veya ortalama/std) tüm sütunlar için tek
+    geçişte hesaplanır ve sınırlar tek bir clip(axis=1) çağrısıyla uygulanır.
+    vectorized=False eski sütun sütun yöntemidir; n_jobs > 1 ise sütun
+    istatistikleri thread havuzunda paralel hesaplanır.
+
+    quartiles: önceden hesaplanmış {sütun: (Q1, Q3)} sözlüğü (örn.
+    sketch_quartiles ile); verilen sütunlar için IQR sınırları bu değerlerden
+    hesaplanır.
+
+    outlier_info verilirse (tüm veriden hesaplanmış sınırlar ve oranlar)
+    tespit atlanır, yalnızca aynı kurallarla sınırlandırma uygulanır.
+    """
+    quartiles = quartiles or {}
+    logger.info(f"\n AYKIRI DEĞER TESPİTİ VE İŞLEME ({method.upper()})...")
+    logger.info("="*50)
     
-    df_clean = df.copy()
+    df_clean = df if inplace else df.copy()
+    if outlier_info is not None:
+        return _apply_outlier_bounds(df_clean, outlier_info, target_col), outlier_info
     outlier_info = {}
     
     # Sayısal sütunları al
     numerical_cols = df_clean.select_dtypes(include=[np.number]).columns.tolist()
     numerical_cols.remove(hasta_no)
     
-    for col in numerical_cols:
-        print(f"\n {col} analiz ediliyor...")
-        
-        if method == 'iqr':
-            Q1 = df_clean[col].quantile(0.25)
-            Q3 = df_clean[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            outliers = df_clean[(df_clean[col] < lower_bound) | (df_clean[col] > upper_bound)]
-            
-        elif method == 'zscore':
-            z_scores = np.abs((df_clean[col] - df_clean[col].mean()) / df_clean[col].std())
-            outliers = df_clean[z_scores > 3]
-            lower_bound = df_clean[col].mean() - 3 * df_clean[col].std()
-            upper_bound = df_clean[col].mean() + 3 * df_clean[col].std()
+    if vectorized:
+        return _outlier_treatment_vectorized(df_clean, numerical_cols, target_col, method, quartiles)
+    
+    # Sütun istatistikleri bağımsızdır (n_jobs > 1 ise paralel hesaplanır)
+    tasks = [(df_clean[col], method, quartiles.get(col)) for col in numerical_cols]
+    column_stats = parallel_map(_outlier_column_stats, tasks, n_jobs=n_jobs, backend='thread')
+    
+    for col, (lower_bound, upper_bound, outlier_count) in zip(numerical_cols, column_stats):
+        logger.info(f"\n {col} analiz ediliyor...")
         
-        outlier_count = len(outliers)
         outlier_percentage = (outlier_count / len(df_clean)) * 100
         
-        print(f"Aykırı değer sayısı: {outlier_count} (%{outlier_percentage:.1f})")
+        logger.info(f"Aykırı değer sayısı: {outlier_count} (%{outlier_percentage:.1f})")
         
         if outlier_count > 0:
-            if col == target_col and outlier_percentage > 5:
+            if col == target_col and outlier_percentage > OUTLIER_CLIP_PERCENT:
                 # Hedef değişken için aykırı değerleri cap'le (sınırla)
                 df_clean[col] = df_clean[col].clip(lower_bound, upper_bound)
-                print(f"Hedef değişken sınırlandırıldı: [{lower_bound:.2f}, {upper_bound:.2f}]")
-            elif outlier_percentage <= 5:
+                logger.info(f"Hedef değişken sınırlandırıldı: [{lower_bound:.2f}, {upper_bound:.2f}]")
+            elif outlier_percentage <= OUTLIER_CLIP_PERCENT:
                 # Az sayıda aykırı değeri cap'le
                 df_clean[col] = df_clean[col].clip(lower_bound, upper_bound)
-                print(f"Aykırı değerler sınırlandırıldı")
+                logger.info(f"Aykırı değerler sınırlandırıldı")
             else:
-                print(f"Çok fazla aykırı değer, dokunulmadı")
+                logger.info(f"Çok fazla aykırı değer, dokunulmadı")
         
         outlier_info[col] = {
             'outlier_count': outlier_count,
@@ -320,17 +680,184 @@ def outlier_detection_and_treatment(df, target_col='TedaviSuresi',hasta_no='Hast
     
     return df_clean, outlier_info
 
-def create_model_ready_dataset(df, target_col='TedaviSuresi', test_size=0.2):
+def _outlier_column_stats(task):
     """
-    Model-ready veri seti oluşturur
+    Tek bir sütunun aykırı değer sınırları ve sayısı (parallel_map işçisi)
+
+    task: (seri, yöntem, (Q1, Q3) veya None)
     """
-    print(f"\n MODEL-READY VERİ SETİ OLUŞTURULUYOR...")
-    print("="*50)
+    series, method, known_quartiles = task
     
-    # Hedef değişken ve özellikler
-    if target_col not in df.columns:
-        raise ValueError(f"Hedef değişken '{target_col}' bulunamadı!")
+    if method == 'iqr':
+        if known_quartiles is not None:
+            Q1, Q3 = known_quartiles
+        else:
+            Q1 = series.quantile(0.25)
+            Q3 = series.quantile(0.75)
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        
+        outlier_count = int(((series < lower_bound) | (series > upper_bound)).sum())
+        
+    elif method == 'zscore':
+        z_scores = np.abs((series - series.mean()) / series.std())
+        outlier_count = int((z_scores > 3).sum())
+        lower_bound = series.mean() - 3 * series.std()
+        upper_bound = series.mean() + 3 * series.std()
+    
+    return lower_bound, upper_bound, outlier_count
+
+def _outlier_treatment_vectorized(df_clean, numerical_cols, target_col, method, quartiles=None):
+    """
+    outlier_detection_and_treatment'ın vektörel uygulaması
+    """
+    outlier_info = {}
+    if not numerical_cols:
+        return df_clean, outlier_info
+    
+    values = df_clean[numerical_cols].to_numpy(dtype=float)
+    known_quartiles = [quartiles.get(col) for col in numerical_cols] if quartiles else None
+    lower_bounds, upper_bounds = _outlier_bounds_vectorized(values, method, known_quartiles)
     
+    # Aykırı değer sayıları (NaN karşılaştırmaları False döner)
+    outlier_counts = ((values < lower_bounds) | (values > upper_bounds)).sum(axis=0)
+    outlier_percentages = outlier_counts / len(df_clean) * 100
+    
+    # Hedef değişken her durumda, diğerleri %5'e kadar sınırlandırılır
+    is_target = np.array([col == target_col for col in numerical_cols])
+    clip_mask = (outlier_counts > 0) & ((outlier_percentages <= OUTLIER_CLIP_PERCENT) | is_target)
+    
+    for i, col in enumerate(numerical_cols):
+        logger.info(f"\n {col} analiz ediliyor...")
+        logger.info(f"Aykırı değer sayısı: {outlier_counts[i]} (%{outlier_percentages[i]:.1f})")
+        if outlier_counts[i] > 0:
+            if clip_mask[i] and is_target[i] and outlier_percentages[i] > OUTLIER_CLIP_PERCENT:
+                logger.info(f"Hedef değişken sınırlandırıldı: [{lower_bounds[i]:.2f}, {upper_bounds[i]:.2f}]")
+            elif clip_mask[i]:
+                logger.info(f"Aykırı değerler sınırlandırıldı")
+            else:
+                logger.info(f"Çok fazla aykırı değer, dokunulmadı")
+        
+        outlier_info[col] = {
+            'outlier_count': int(outlier_counts[i]),
+            'outlier_percentage': float(outlier_percentages[i]),
+            'bounds': (float(lower_bounds[i]), float(upper_bounds[i]))
+        }
+    
+    # Sınırları tek çağrıda uygula
+    clip_cols = [col for col, clip in zip(numerical_cols, clip_mask) if clip]
+    _clip_columns(df_clean, clip_cols, lower_bounds[clip_mask], upper_bounds[clip_mask])
+    
+    return df_clean, outlier_info
+
+def _clip_columns(df_clean, clip_cols, lower_bounds, upper_bounds):
+    """
+    Sütunları kendi sınırlarına tek bir clip(axis=1) çağrısıyla sınırlar
+    """
+    if clip_cols:
+        df_clean[clip_cols] = df_clean[clip_cols].clip(
+            lower=pd.Series(lower_bounds, index=clip_cols),
+            upper=pd.Series(upper_bounds, index=clip_cols),
+            axis=1
+        )
+
+def _outlier_clip_columns(outlier_info, target_col):
+    """
+    outlier_info'ya göre sınırlandırılan sütunlar (hedef her durumda, diğerleri %5'e kadar)
+    """
+    return [col for col, info in outlier_info.items()
+            if info['outlier_count'] > 0 and (col == target_col or info['outlier_percentage'] <= OUTLIER_CLIP_PERCENT)]
+
+def _apply_outlier_bounds(df_clean, outlier_info, target_col):
+    """
+    Hazır outlier_info ile sınırlandırma (hedef her durumda, diğerleri %5'e kadar)
+    """
+    clip_cols = _outlier_clip_columns(outlier_info, target_col)
+    _clip_columns(df_clean, clip_cols,
+                  np.array([outlier_info[col]['bounds'][0] for col in clip_cols]),
+                  np.array([outlier_info[col]['bounds'][1] for col in clip_cols]))
+    logger.info(f"{len(clip_cols)} sütun hazır sınırlarla sınırlandırıldı")
+    return df_clean
+
+def multi_hot_encoding(df, columns=None, min_frequency=1):
+    """
+    Virgülle ayrılmış liste sütunları için seyrek (scipy.sparse CSR) multi-hot kodlama
+
+    Her sütunun parça sözlüğü (örn. tüm tanılar) çıkarılır, min_frequency'den az
+    görülen parçalar atılır. Matris hiçbir aşamada yoğun (dense) hale getirilmez.
+    Döndürür: (CSR matris, özellik adları)
+    """
+    logger.info("\n SEYREK MULTI-HOT KODLAMA...")
+    logger.info("="*40)
+    
+    if columns is None:
+        columns = [col for col in LIST_COLUMNS if col in df.columns]
+    
+    matrices = []
+    feature_names = []
+    
+    for col in columns:
+        parsed = tokenize_multi_value_column(df[col])
+        
+        # Sözlük: yeterince sık görülen ve "yok" anlamına gelmeyen parçalar
+        item_counts = parsed['item_counts']
+        item_counts = item_counts[item_counts >= min_frequency]
+        vocabulary = [item for item in item_counts.index if item.lower() not in NULL_TOKENS]
+        item_index = {item: i for i, item in enumerate(vocabulary)}
+        
+        # Önce benzersiz değer x parça matrisi, sonra satırlara dağıtım
+        indptr = [0]
+        indices = []
+        for items in parsed['unique_items']:
+            item_ids = sorted({item_index[item] for item in items if item in item_index})
+            indices.extend(item_ids)
+            indptr.append(len(indices))
+        # NaN satırlar (kod -1) için boş son satır
+        indptr.append(len(indices))
+        
+        unique_matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.uint8), indices, indptr),
+            shape=(len(parsed['unique_items']) + 1, len(vocabulary))
+        )
+        matrices.append(unique_matrix[parsed['codes']])
+        feature_names.extend(f'{col}_item_{item}' for item in vocabulary)
+        
+        logger.info(f"{col}: {len(vocabulary)} parça (min_frequency={min_frequency})")
+    
+    if matrices:
+        matrix = sparse.hstack(matrices, format='csr')
+    else:
+        matrix = sparse.csr_matrix((len(df), 0), dtype=np.uint8)
+    
+    density = matrix.nnz / max(1, matrix.shape[0] * matrix.shape[1])
+    logger.info(f"Matris boyutu: {matrix.shape}, dolu hücre: {matrix.nnz} (yoğunluk %{density * 100:.2f})")
+    
+    return matrix, feature_names
+
+def _fill_medians(X, medians=None):
+    """
+    Sütun medianları; medians sözlüğünde olanlar yeniden hesaplanmaz
+    """
+    if not medians:
+        return X.median()
+    
+    missing_cols = [col for col in X.columns if col not in medians]
+    fill_values = pd.Series({col: medians[col] for col in X.columns if col in medians}, dtype=float)
+    if missing_cols:
+        fill_values = pd.concat([fill_values, X[missing_cols].median()])
+    return fill_values
+
+def _train_test_positions(n_rows, test_size=0.2):
+    """
+    Model-ready veri setinin train-test ayrımı (satır pozisyonları, random_state=42)
+    """
+    return train_test_split(np.arange(n_rows), test_size=test_size, random_state=42, stratify=None)
+
+def _model_feature_columns(df, target_col='TedaviSuresi'):
+    """
+    Model özellikleri: sayısal sütunlar (hedef ve MODEL_EXCLUDE_PATTERNS hariç)
+    """
     # Sadece sayısal sütunları al (model için)
     feature_columns = df.select_dtypes(include=[np.number]).columns.tolist()
     
@@ -339,12 +866,30 @@ def create_model_ready_dataset(df, target_col='TedaviSuresi', test_size=0.2):
         feature_columns.remove(target_col)
     
     # Gereksiz sütunları çıkar
-    exclude_patterns = ['HastaNo', 'Unnamed']
-    feature_columns = [col for col in feature_columns 
-                      if not any(pattern in col for pattern in exclude_patterns)]
+    return [col for col in feature_columns
+            if not any(pattern in col for pattern in MODEL_EXCLUDE_PATTERNS)]
+
+def create_model_ready_dataset(df, target_col='TedaviSuresi', test_size=0.2, medians=None):
+    """
+    Model-ready veri seti oluşturur
+
+    medians: önceden hesaplanmış {sütun: median} sözlüğü; kalan NaN'lar
+    için bu değerler kullanılır, verilmeyen sütunların medianı hesaplanır.
+
+    Liste sütunlarının seyrek multi-hot matrisleri aynı train-test ayrımıyla
+    create_multi_hot_dataset ile oluşturulur.
+    """
+    logger.info(f"\n MODEL-READY VERİ SETİ OLUŞTURULUYOR...")
+    logger.info("="*50)
+    
+    # Hedef değişken ve özellikler
+    if target_col not in df.columns:
+        raise ValueError(f"Hedef değişken '{target_col}' bulunamadı!")
+    
+    feature_columns = _model_feature_columns(df, target_col)
     
-    print(f"Özellik sayısı: {len(feature_columns)}")
-    print(f"Hedef değişken: {target_col}")
+    logger.info(f"Özellik sayısı: {len(feature_columns)}")
+    logger.info(f"Hedef değişken: {target_col}")
     
     # X ve y oluştur
     X = df[feature_columns].copy()
@@ -352,96 +897,507 @@ def create_model_ready_dataset(df, target_col='TedaviSuresi', test_size=0.2):
     
     # NaN kontrolü
     if X.isnull().sum().sum() > 0:
-        print("Özelliklerde hala NaN var, temizleniyor...")
-        X = X.fillna(X.median())
+        logger.info("Özelliklerde hala NaN var, temizleniyor...")
+        X = X.fillna(_fill_medians(X, medians))
     
     if y.isnull().sum() > 0:
-        print("Hedef değişkende NaN var, temizleniyor...")
-        y = y.fillna(y.median())
+        logger.info("Hedef değişkende NaN var, temizleniyor...")
+        if medians is not None and target_col in medians:
+            y = y.fillna(medians[target_col])
+        else:
+            y = y.fillna(y.median())
     
-    # Train-test split
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=test_size, random_state=42, stratify=None
-    )
+    # Train-test split (seyrek matris de aynı satırlarla bölünsün diye pozisyonlar üzerinden)
+    train_idx, test_idx = _train_test_positions(len(X), test_size)
+    X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+    y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
     
-    print(f"Eğitim seti: {X_train.shape}")
-    print(f"Test seti: {X_test.shape}")
+    logger.info(f"Eğitim seti: {X_train.shape}")
+    logger.info(f"Test seti: {X_test.shape}")
     
     # İstatistikler
-    print(f"\n Hedef Değişken İstatistikleri:")
-    print(f"Eğitim - Ortalama: {y_train.mean():.2f}, Std: {y_train.std():.2f}")
-    print(f"Test - Ortalama: {y_test.mean():.2f}, Std: {y_test.std():.2f}")
+    if is_verbose(logger):
+        logger.info(f"\n Hedef Değişken İstatistikleri:")
+        logger.info(f"Eğitim - Ortalama: {y_train.mean():.2f}, Std: {y_train.std():.2f}")
+        logger.info(f"Test - Ortalama: {y_test.mean():.2f}, Std: {y_test.std():.2f}")
     
     return X_train, X_test, y_train, y_test, feature_columns
 
-def full_preprocessing_pipeline(df, target_col='TedaviSuresi'):
+def create_multi_hot_dataset(df, multi_hot_columns=None, min_frequency=1, test_size=0.2):
+    """
+    Liste sütunlarının seyrek multi-hot matrisini create_model_ready_dataset
+    ile aynı train-test ayrımında böler
+
+    Döndürür: {'X_train', 'X_test', 'feature_names'} sözlüğü
+    """
+    multi_hot, multi_hot_names = multi_hot_encoding(df, multi_hot_columns, min_frequency)
+    train_idx, test_idx = _train_test_positions(len(df), test_size)
+    sparse_features = {
+        'X_train': multi_hot[train_idx],
+        'X_test': multi_hot[test_idx],
+        'feature_names': multi_hot_names
+    }
+    logger.info(f"Seyrek eğitim seti: {sparse_features['X_train'].shape}")
+    return sparse_features
+
+def _mode_from_counts(counts, dtype):
+    """
+    Birleştirilmiş frekanslardan Series.mode().iloc[0] ile aynı değeri seçer
+    """
+    if len(counts) == 0:
+        return 'Unknown'
+    # Eşit frekanslı değerlerden sıralamada ilki (Series.mode sıralı döner)
+    candidates = counts.index[counts.to_numpy() == counts.max()]
+    return pd.Series(list(candidates), dtype=dtype).sort_values().iloc[0]
+
+def _partition_missing_stats(part, positions, params):
+    """
+    1. tur: eksik değer aşamasının kısmi istatistikleri
+    """
+    stats = {
+        'numeric': part[params['numerical_cols']],
+        'target_counts': value_counts_with_positions(part[params['target_col']], positions),
+        'categorical_counts': {col: value_counts_with_positions(part[col], positions)
+                               for col in params['categorical_cols']}
+    }
+    return None, stats
+
+def _partition_impute(part, positions, params):
+    """
+    2. tur: eksik değerleri global durumla doldurur, aykırı değer istatistiklerini toplar
+    """
+    part = advanced_missing_value_handler(part, params['target_col'], params['hasta_no'], inplace=True,
+                                          imputation=params['imputation'], medians=params['medians'],
+                                          imputer=params['imputer'], modes=params['modes'])
+    outlier_cols = [col for col in part.select_dtypes(include=[np.number]).columns if col != params['hasta_no']]
+    stats = {col: value_counts_with_positions(part[col], positions) for col in outlier_cols}
+    return part, stats
+
+def _partition_features(part, positions, params):
+    """
+    3. tur: aykırı değerleri sınırlar, özellikleri türetir, kodlama istatistiklerini toplar
+    """
+    part, _ = outlier_detection_and_treatment(part, params['target_col'], params['hasta_no'], inplace=True,
+                                              outlier_info=params['outlier_info'])
+    part = advanced_feature_engineering(part, inplace=True, target_col=params['target_col'])
+    stats = {col: (value_counts_with_positions(part[col], positions), int(part[col].isna().sum()), part[col].dtype)
+             for col in part.select_dtypes(include=['object', 'category']).columns}
+    return part, stats
+
+def _partition_encode(part, positions, params):
+    """
+    4. tur: global encoding_info ile kodlar, ölçekleme momentlerini toplar
+    """
+    part, _ = smart_encoding(part, params['target_col'], encoding_info=params['encoding_info'])
+    feature_cols = _scaling_columns(part, params['target_col'], params['hasta_no'])
+    return part, (feature_cols, partial_moments(part[feature_cols].to_numpy(dtype=float)))
+
+def _partition_scale(part, positions, params):
+    """
+    5. tur: global scaler ile ölçekler
+    """
+    if params['scaler'] is not None:
+        part, _ = feature_scaling(part, params['target_col'], params['hasta_no'], inplace=True, scaler=params['scaler'])
+    return part, None
+
+PARTITION_STEPS = {
+    'missing_stats': _partition_missing_stats,
+    'impute': _partition_impute,
+    'features': _partition_features,
+    'encode': _partition_encode,
+    'scale': _partition_scale
+}
+
+def _partition_worker(task):
+    """
+    Bölümlenmiş çalıştırmanın tek bir turunu bir parça üzerinde çalıştırır (parallel_map işçisi)
+
+    Aşama fonksiyonları sessiz modda çalışır (gösterim hesaplamaları da
+    atlanır); özet ana süreçte yazdırılır.
+    """
+    step, part, positions, params = task
+    with quiet():
+        return PARTITION_STEPS[step](part, positions, params)
+
+def _outlier_info_from_counts(counts_by_col, n_rows):
+    """
+    Birleştirilmiş frekanslardan outlier_detection_and_treatment (IQR) ile aynı outlier_info
+    """
+    outlier_info = {}
+    for col, counts in counts_by_col.items():
+        q1 = quantile_from_counts(counts, 0.25)
+        q3 = quantile_from_counts(counts, 0.75)
+        iqr = q3 - q1
+        lower_bound, upper_bound = q1 - 1.5 * iqr, q3 + 1.5 * iqr
+        
+        values = counts.index.to_numpy(dtype=float)
+        outlier_count = int(counts.to_numpy()[(values < lower_bound) | (values > upper_bound)].sum())
+        outlier_info[col] = {
+            'outlier_count': outlier_count,
+            'outlier_percentage': float(outlier_count / n_rows * 100),
+            'bounds': (float(lower_bound), float(upper_bound))
+        }
+    return outlier_info
+
+def _encoding_info_from_counts(categorical_stats):
+    """
+    Birleştirilmiş frekanslardan smart_encoding ile aynı encoding_info
+
+    Kararlar, tüm verinin benzersiz değerlerinden (aynı dtype ile) oluşturulan
+    küçük bir örnek seri üzerinden aynı pandas/sklearn çağrılarıyla alınır.
+    """
+    encoding_info = {}
+    for col, (merged, null_count, dtype) in categorical_stats.items():
+        exemplar = pd.Series(list(merged.index) + ([np.nan] if null_count > 0 else []), dtype=dtype)
+        unique_count = len(merged)
+        
+        if unique_count <= 2:
+            encoding_info[col] = {'type': 'label', 'encoder': LabelEncoder().fit(exemplar.astype(str))}
+        elif unique_count <= 10:
+            dummies = pd.get_dummies(exemplar, prefix=col, drop_first=True)
+            encoding_info[col] = {'type': 'onehot', 'columns': dummies.columns.tolist()}
+        else:
+            # value_counts ile aynı girdi sırası (ilk görülme) ve aynı sıralama çağrısı
+            value_counts = pd.Series(merged['count'].to_numpy(), index=merged.index).sort_values(ascending=False, kind='stable')
+            top_categories = value_counts.head(10).index.tolist()
+            top_labels = exemplar.apply(lambda x: x if x in top_categories else 'Other')
+            dummies = pd.get_dummies(top_labels, prefix=f'{col}_top', drop_first=True)
+            encoding_info[col] = {
+                'type': 'frequency_top',
+                'top_categories': top_categories,
+                'frequency_map': value_counts.to_dict(),
+                'top_columns': dummies.columns.tolist()
+            }
+    return encoding_info
+
+def _scaler_from_moments(feature_cols, moments):
+    """
+    Birleştirilmiş momentlerden fit edilmiş StandardScaler oluşturur
+    """
+    if not feature_cols:
+        return None
+    count, mean, variance = merge_moments(moments)
+    
+    scaler = StandardScaler()
+    scaler.n_features_in_ = len(feature_cols)
+    scaler.feature_names_in_ = np.asarray(feature_cols, dtype=object)
+    scaler.n_samples_seen_ = int(count[0]) if np.all(count == count[0]) else count.astype(np.int64)
+    scaler.mean_ = mean
+    scaler.var_ = variance
+    # Sabit sütunlar sklearn'deki gibi 1 ile ölçeklenir
+    eps = np.finfo(np.float64).eps
+    constant = variance <= count * eps * variance + (count * mean * eps) ** 2
+    scaler.scale_ = np.where(constant, 1.0, np.sqrt(variance))
+    return scaler
+
+def partitioned_preprocessing(df, target_col='TedaviSuresi', hasta_no='HastaNo', imputation='tree',
+                              partition_by='Bolum', n_partitions=8, n_jobs=1):
+    """
+    Eksik değer → aykırı değer → özellik mühendisliği → kodlama → ölçekleme
+    aşamalarını bölümler (Bolum veya HastaNo hash) üzerinde çalıştırır
+
+    Her turda parçalar process havuzunda işlenir ve bir sonraki aşamanın
+    kısmi istatistikleri (frekans tabloları, ilk görülme pozisyonları,
+    momentler) döndürülür; ana süreç bunları birleştirip global durumu
+    (median/mod, IQR sınırları, encoding_info, scaler) oluşturur. Medianlar,
+    kantiller, frekanslar, kodlama kararları ve ölçeklenmeyen tüm sütunlar
+    tek süreçli sonuçla birebir aynıdır. Ölçeklenen sütunlar birebir değil,
+    PARTITION_SCALE_TOLERANCE toleransıyla aynıdır: scaler ortalama/varyansı
+    birleştirilmiş momentlerden hesaplanır ve sklearn'ün tüm sütun üzerindeki
+    toplama sırasını yeniden üretmez.
+
+    Yalnızca 'tree' imputation desteklenir: KD-tree komşu kümesi (sayısal
+    sütunlar) ana süreçte birleştirilir, sorgular parçalarda yapılır. 'knn'
+    (KNNImputer) tüm satırlar üzerinde O(n²) mesafe hesabı gerektirdiğinden
+    bölünemez; 'group_median' desteklenmez.
+
+    Deneysel: sonuçların tek süreçli çalıştırmayla eşdeğerliği testlerle
+    doğrulanmıştır, ancak çok çekirdekli ölçeklenme (n_jobs > 1 ile hızlanma)
+    henüz ölçülmemiştir; tek çekirdekte parçalama ve birleştirme ek maliyeti
+    nedeniyle tek süreçli yoldan yavaştır.
+
+    Döndürür: (işlenmiş veri, outlier_info, encoding_info, scaler, eksik değer
+    durumu); eksik değer durumu fit_missing_value_state ile aynı sözlüktür.
+    """
+    if imputation != 'tree':
+        raise ValueError("Bölümlenmiş çalıştırma yalnızca imputation='tree' destekler "
+                         "('knn' tüm veri üzerinde O(n²) çalışır, parçalara bölünemez)")
+    
+    positions_list = partition_positions(df, partition_by, n_partitions, hasta_no)
+    parts = [df.iloc[positions] for positions in positions_list]
+    order = np.argsort(np.concatenate(positions_list), kind='stable')
+    logger.info(f"{len(parts)} parça ({partition_by}), n_jobs={n_jobs}")
+    
+    def run(step, params):
+        tasks = [(step, part, positions, params) for part, positions in zip(parts, positions_list)]
+        outputs = parallel_map(_partition_worker, tasks, n_jobs=n_jobs, backend='process')
+        if outputs[0][0] is not None:
+            parts[:] = [part for part, _ in outputs]
+        return [stats for _, stats in outputs]
+    
+    def merged_counts(stats_list, key=None):
+        return merge_value_counts([stats if key is None else stats[key] for stats in stats_list])['count']
+    
+    params = {'target_col': target_col, 'hasta_no': hasta_no, 'imputation': imputation}
+    
+    # 1. Eksik değer durumu: komşu kümesi, hedef medianı, modlar
+    numerical_cols = [col for col in df.select_dtypes(include=[np.number]).columns if col not in (target_col, hasta_no)]
+    categorical_cols = df.select_dtypes(include=['object', 'category']).columns.tolist()
+    stats = run('missing_stats', {**params, 'numerical_cols': numerical_cols, 'categorical_cols': categorical_cols})
+    
+    imputer = None
+    if numerical_cols:
+        reference = pd.concat([part_stats['numeric'] for part_stats in stats]).iloc[order]
+        imputer = _tree_knn_reference(reference.to_numpy(dtype=float))
+    medians = {target_col: median_from_counts(merged_counts(stats, 'target_counts'))}
+    modes = {col: _mode_from_counts(merge_value_counts([part_stats['categorical_counts'][col] for part_stats in stats])['count'],
+                                    df[col].dtype)
+             for col in categorical_cols}
+    logger.info("Eksik değer durumu birleştirildi")
+    
+    # 2. Eksik değer işleme + aykırı değer sınırları
+    stats = run('impute', {**params, 'imputer': imputer, 'medians': medians, 'modes': modes})
+    outlier_info = _outlier_info_from_counts({col: merged_counts(stats, col) for col in stats[0]}, len(df))
+    logger.info("Aykırı değer sınırları birleştirildi")
+    
+    # 3. Aykırı değer işleme + özellik mühendisliği + kodlama kararları
+    stats = run('features', {**params, 'outlier_info': outlier_info})
+    categorical_stats = {col: (merge_value_counts([part_stats[col][0] for part_stats in stats]),
+                               sum(part_stats[col][1] for part_stats in stats),
+                               stats[0][col][2])
+                         for col in stats[0]}
+    encoding_info = _encoding_info_from_counts(categorical_stats)
+    logger.info("Kodlama kararları birleştirildi")
+    
+    # 4. Kodlama + ölçekleme momentleri
+    stats = run('encode', {**params, 'encoding_info': encoding_info})
+    scaler = _scaler_from_moments(stats[0][0], [moments for _, moments in stats])
+    logger.info("Ölçekleme momentleri birleştirildi")
+    
+    # 5. Ölçekleme ve parçaları orijinal satır sırasında birleştirme
+    run('scale', {**params, 'scaler': scaler})
+    df_processed = pd.concat(parts).iloc[order]
+    missing_value_state = {'imputation': imputation, 'imputer': imputer, 'medians': medians, 'modes': modes}
+    
+    return df_processed, outlier_info, encoding_info, scaler, missing_value_state
+
+def _missing_value_stage(df, target_col='TedaviSuresi', hasta_no='HastaNo', inplace=False, imputation='knn'):
+    """
+    Eksik değer aşaması: durumu öğrenir ve aynı durumla doldurur
+
+    Döndürür: (doldurulmuş veri, fit_missing_value_state sonucu)
+    """
+    state = fit_missing_value_state(df, target_col, hasta_no, imputation)
+    df = advanced_missing_value_handler(df, target_col, hasta_no, inplace=inplace, imputation=imputation,
+                                        imputer=state['imputer'], medians=state['medians'], modes=state['modes'])
+    return df, state
+
+def transform_with_pipeline_state(df, state, target_col='TedaviSuresi', hasta_no='HastaNo', clean_input=False):
+    """
+    Yeni kayıtları full_preprocessing_pipeline'ın öğrendiği durumla özellik
+    matrisine dönüştürür (örn. load_pipeline_artifacts ile yüklenen durum)
+
+    clean_input=True ise df ham veridir; önce kayıtlı temizleme medianlarıyla
+    veri temizleme adımları uygulanır. Hedef sütun yoksa eğitim medianıyla
+    doldurulur. Döndürür: state['feature_columns'] sırasında DataFrame.
+    """
+    df = df.copy()
+    if clean_input:
+        if state['clean_medians'] is None:
+            raise ValueError("Durumda temizleme medianları yok; pipeline clean_medians ile çalıştırılmalı")
+        df = clean_all_numeric_columns_advanced(df, medians=state['clean_medians'], inplace=True)
+        df = clean_categorical_columns(df, inplace=True)
+        df = clean_text_columns(df, inplace=True)
+    if target_col not in df.columns:
+        df[target_col] = np.nan
+    
+    missing_value_state = state['missing_value_state']
+    df = advanced_missing_value_handler(df, target_col, hasta_no, inplace=True,
+                                        imputation=missing_value_state['imputation'],
+                                        imputer=missing_value_state['imputer'],
+                                        medians=missing_value_state['medians'], modes=missing_value_state['modes'])
+    df, _ = outlier_detection_and_treatment(df, target_col, hasta_no, inplace=True, outlier_info=state['outlier_info'])
+    df = advanced_feature_engineering(df, inplace=True, target_col=target_col)
+    df, _ = smart_encoding(df, target_col, inplace=True, encoding_info=state['encoding_info'])
+    if state['scaler'] is not None:
+        df, _ = feature_scaling(df, target_col, hasta_no, inplace=True, scaler=state['scaler'])
+    
+    X = df.reindex(columns=state['feature_columns']).astype(float)
+    return X.fillna(pd.Series(state['fill_values'], dtype=float))
+
+def full_preprocessing_pipeline(df, target_col='TedaviSuresi', inplace=False, optimize_memory=False, output_format='csv',
+                                multi_hot_columns=None, min_frequency=1, artifacts_folder=None, imputation='knn',
+                                partition_by=None, n_partitions=8, n_jobs=1, profiler=None, scaling_method='standard',
+                                cache=None, clean_medians=None):
     """
     Kapsamlı veri ön işleme pipeline'ı
+
+    inplace=True ise tüm aşamalar tek bir DataFrame'i değiştirir; verilen df'in
+    sahipliği pipeline'a geçer ve aynı anda yalnızca bir tam kopya bellekte tutulur.
+    optimize_memory=True ise özellik mühendisliğinden sonra ve pipeline sonunda
+    veri tipleri optimize_dtypes ile küçültülür.
+    output_format ('csv', 'parquet', 'feather', 'npy') çıktı dosyalarının
+    formatını belirler; 'npy' seçilirse X/y bellek eşlemeli diziler olarak,
+    tam veri ise Parquet olarak kaydedilir.
+    multi_hot_columns verilirse liste sütunlarının seyrek multi-hot matrisleri
+    de üretilir ve .npz olarak kaydedilir.
+    artifacts_folder verilirse öğrenilmiş durum (eksik değer durumu, scaler,
+    encoding_info, outlier_info, feature_columns, doldurma medianları)
+    save_pipeline_artifacts ile kaydedilir; transform_with_pipeline_state
+    yeni kayıtları bu durumla dönüştürür.
+    clean_medians: df'i temizlerken kullanılan sayısal sütun medianları
+    (compute_clean_medians ile ham veriden); artifact'a yazılır, böylece ham
+    kayıtlar da (clean_input=True) dönüştürülebilir.
+    imputation sayısal eksik değer yöntemidir ('knn', 'tree', 'group_median').
+    partition_by ('Bolum' veya 'hash') verilirse 1-5. aşamalar
+    partitioned_preprocessing ile parçalar üzerinde, n_jobs süreçle çalışır;
+    bu mod deneyseldir, imputation='tree' gerektirir, optimize_memory yalnızca
+    sonda uygulanır.
+    profiler (StageProfiler) verilirse her aşamanın süre, bellek ve
+    satır/sütun ölçümleri kaydedilir; rapor sonuçta 'profile' anahtarıyla döner.
+    scaling_method: feature_scaling yöntemi ('standard' veya 'minmax').
+    cache (StageCache veya klasör yolu) verilirse 1-5. aşamaların çıktıları
+    diskte, girdi verisinin hash'i ve aşama parametreleriyle anahtarlanarak
+    saklanır; yeniden çalıştırmada yalnızca parametresi değişen aşama ve
+    sonrakiler çalışır (örn. scaling_method değişirse yalnızca ölçekleme).
+    Önbellekten gelen aşamalarda verilen df değiştirilmez.
     """
-    print(" KAPSAMLI VERİ ÖN İŞLEME PIPELINE'I...")
-    print("="*80)
+    logger.info(" KAPSAMLI VERİ ÖN İŞLEME PIPELINE'I...")
+    logger.info("="*80)
     
     # Pipeline aşamaları
     pipeline_steps = []
+    rss_increase = {}
     
-    # 1. Eksik değer işleme
-    print("EKSİK DEĞER İŞLEME")
-    df_step1 = advanced_missing_value_handler(df, target_col)
-    pipeline_steps.append(f"Eksik değerler işlendi: {df.shape} → {df_step1.shape}")
+    # Aşama önbelleği: ilk aşamanın girdi anahtarı verinin hash'idir
+    if isinstance(cache, str):
+        cache = StageCache(cache)
+    input_key = data_fingerprint(df) if cache is not None else None
     
-    # 2. Aykırı değer işleme
-    print("\n AYKIRI DEĞER İŞLEME")
-    df_step2, outlier_info = outlier_detection_and_treatment(df_step1, target_col)
-    pipeline_steps.append(f"Aykırı değerler işlendi")
+    if partition_by is not None:
+        if scaling_method != 'standard':
+            raise ValueError("Bölümlenmiş ön işleme yalnızca scaling_method='standard' destekler")
+        if imputation != 'tree':
+            raise ValueError("Bölümlenmiş ön işleme yalnızca imputation='tree' destekler")
+        # 1-5. Bölümlenmiş çalıştırma (global durum kısmi istatistiklerden birleştirilir)
+        logger.info("BÖLÜMLENMİŞ ÖN İŞLEME")
+        with profile_stage(profiler, 'partitioned', df) as partition_stage:
+            # n_jobs sonucu değiştirmez, anahtara girmez
+            (df_step5, outlier_info, encoding_info, scaler, missing_value_state), _ = run_cached(
+                cache, 'partitioned', input_key, partitioned_preprocessing,
+                df, target_col, imputation=imputation, partition_by=partition_by,
+                n_partitions=n_partitions, n_jobs=n_jobs,
+                params={'target_col': target_col, 'imputation': imputation,
+                        'partition_by': partition_by, 'n_partitions': n_partitions}
+            )
+            partition_stage.output(df_step5)
+        if optimize_memory:
+            with profile_stage(profiler, 'optimize_dtypes', df_step5) as stage:
+                df_step5 = stage.output(optimize_dtypes(df_step5, inplace=True))
+        pipeline_steps.append(f"Bölümlenmiş ön işleme ({partition_by}): {df.shape} → {df_step5.shape}")
+        rss_increase['partitioned'] = report_peak_rss_increase(partition_stage, 'bölümlenmiş ön işleme')
+    else:
+        # 1. Eksik değer işleme
+        logger.info("EKSİK DEĞER İŞLEME")
+        shape_before = df.shape
+        with profile_stage(profiler, 'missing_values', df) as stage:
+            (df_step1, missing_value_state), step_key = run_cached(cache, 'missing_values', input_key,
+                                                                   _missing_value_stage,
+                                                                   df, target_col, inplace=inplace,
+                                                                   imputation=imputation,
+                                                                   params={'target_col': target_col,
+                                                                           'imputation': imputation})
+            stage.output(df_step1)
+        pipeline_steps.append(f"Eksik değerler işlendi: {shape_before} → {df_step1.shape}")
+        rss_increase['missing_values'] = report_peak_rss_increase(stage, 'eksik değer işleme')
     
-    # 3. Özellik mühendisliği
-    print("\n ÖZELLİK MÜHENDİSLİĞİ")
-    df_step3 = advanced_feature_engineering(df_step2)
-    pipeline_steps.append(f"Özellik mühendisliği: {df_step2.shape} → {df_step3.shape}")
+        # 2. Aykırı değer işleme
+        logger.info("\n AYKIRI DEĞER İŞLEME")
+        with profile_stage(profiler, 'outliers', df_step1) as stage:
+            (df_step2, outlier_info), step_key = run_cached(cache, 'outliers', step_key,
+                                                            outlier_detection_and_treatment,
+                                                            df_step1, target_col, inplace=inplace,
+                                                            params={'target_col': target_col})
+            stage.output(df_step2)
+        pipeline_steps.append(f"Aykırı değerler işlendi")
+        rss_increase['outliers'] = report_peak_rss_increase(stage, 'aykırı değer işleme')
     
-    # 4. Kategorik kodlama
-    print("\n KATEGORİK KODLAMA")
-    df_step4, encoding_info = smart_encoding(df_step3, target_col)
-    pipeline_steps.append(f"Kategorik kodlama: {df_step3.shape} → {df_step4.shape}")
+        # 3. Özellik mühendisliği
+        logger.info("\n ÖZELLİK MÜHENDİSLİĞİ")
+        shape_before = df_step2.shape
+        with profile_stage(profiler, 'feature_engineering', df_step2) as stage:
+            df_step3, step_key = run_cached(cache, 'feature_engineering', step_key, advanced_feature_engineering,
+                                            df_step2, inplace=inplace, target_col=target_col,
+                                            params={'target_col': target_col})
+            pipeline_steps.append(f"Özellik mühendisliği: {shape_before} → {df_step3.shape}")
+            if optimize_memory:
+                df_step3 = optimize_dtypes(df_step3, inplace=inplace)
+            stage.output(df_step3)
+        rss_increase['feature_engineering'] = report_peak_rss_increase(stage, 'özellik mühendisliği')
     
-    # 5. Özellik ölçeklendirme
-    print("\n ÖZELLİK ÖLÇEKLENDİRME")
-    df_step5, scaler = feature_scaling(df_step4, target_col, 'standard')
-    pipeline_steps.append(f"Özellik ölçeklendirme tamamlandı")
+        # 4. Kategorik kodlama
+        logger.info("\n KATEGORİK KODLAMA")
+        shape_before = df_step3.shape
+        with profile_stage(profiler, 'encoding', df_step3) as stage:
+            # Tip optimizasyonu önbelleğe alınmaz, bu yüzden kodlama anahtarına girer
+            (df_step4, encoding_info), step_key = run_cached(cache, 'encoding', step_key, smart_encoding,
+                                                             df_step3, target_col, inplace=inplace,
+                                                             params={'target_col': target_col,
+                                                                     'optimize_memory': optimize_memory})
+            stage.output(df_step4)
+        pipeline_steps.append(f"Kategorik kodlama: {shape_before} → {df_step4.shape}")
+        rss_increase['encoding'] = report_peak_rss_increase(stage, 'kategorik kodlama')
+    
+        # 5. Özellik ölçeklendirme
+        logger.info("\n ÖZELLİK ÖLÇEKLENDİRME")
+        with profile_stage(profiler, 'scaling', df_step4) as stage:
+            (df_step5, scaler), step_key = run_cached(cache, 'scaling', step_key, feature_scaling,
+                                                      df_step4, target_col, scaling_method=scaling_method,
+                                                      inplace=inplace,
+                                                      params={'target_col': target_col,
+                                                              'scaling_method': scaling_method})
+            pipeline_steps.append(f"Özellik ölçeklendirme tamamlandı")
+            if optimize_memory:
+                df_step5 = optimize_dtypes(df_step5, inplace=True)
+            stage.output(df_step5)
+        rss_increase['scaling'] = report_peak_rss_increase(stage, 'özellik ölçeklendirme')
     
     # 6. Model-ready veri seti
-    print("\n MODEL-READY VERİ SETİ")
-    X_train, X_test, y_train, y_test, feature_columns = create_model_ready_dataset(df_step5, target_col)
+    logger.info("\n MODEL-READY VERİ SETİ")
+    sparse_features = None
+    with profile_stage(profiler, 'model_ready', df_step5) as stage:
+        X_train, X_test, y_train, y_test, feature_columns = create_model_ready_dataset(df_step5, target_col)
+        if multi_hot_columns is not None:
+            sparse_features = create_multi_hot_dataset(df_step5, multi_hot_columns, min_frequency)
+        stage.output(shape=(len(X_train) + len(X_test), len(feature_columns)))
     pipeline_steps.append(f"Model-ready veri seti: Train{X_train.shape}, Test{X_test.shape}")
+    rss_increase['model_ready'] = report_peak_rss_increase(stage, 'model-ready veri seti')
     
     # Sonuçları kaydet
-    results_folder = 'results'
-    os.makedirs(results_folder, exist_ok=True)
-    
-    # Tüm işlenmiş veriyi kaydet
-    df_step5.to_csv(f'{results_folder}/full_preprocessed_data.csv', index=False)
-    
-    # Model-ready veriyi kaydet
-    X_train.to_csv(f'{results_folder}/X_train.csv', index=False)
-    X_test.to_csv(f'{results_folder}/X_test.csv', index=False)
-    pd.DataFrame({'TedaviSuresi': y_train}).to_csv(f'{results_folder}/y_train.csv', index=False)
-    pd.DataFrame({'TedaviSuresi': y_test}).to_csv(f'{results_folder}/y_test.csv', index=False)
-    
-    # Pipeline özeti
-    print("\n" + "="*80)
-    print("VERİ ÖN İŞLEME PIPELINE'I TAMAMLANDI!")
-    print("="*80)
-    
-    print("\n Pipeline Adımları:")
-    for i, step in enumerate(pipeline_steps, 1):
-        print(f"{i}. {step}")
+    with profile_stage(profiler, 'save', df_step5):
+        results_folder = 'results'
+        os.makedirs(results_folder, exist_ok=True)
+        
+        # Tüm işlenmiş veriyi kaydet (karışık tipler npy'ye yazılamaz)
+        full_data_format = 'parquet' if output_format == 'npy' else output_format
+        save_dataframe(df_step5, 'full_preprocessed_data', results_folder, format=full_data_format)
+        
+        # Model-ready veriyi kaydet
+        save_dataframe(X_train, 'X_train', results_folder, format=output_format)
+        save_dataframe(X_test, 'X_test', results_folder, format=output_format)
+        save_dataframe(pd.DataFrame({'TedaviSuresi': y_train}), 'y_train', results_folder, format=output_format)
+        save_dataframe(pd.DataFrame({'TedaviSuresi': y_test}), 'y_test', results_folder, format=output_format)
+        
+        # Seyrek multi-hot özellikleri kaydet
+        if sparse_features is not None:
+            sparse.save_npz(f'{results_folder}/X_train_multi_hot.npz', sparse_features['X_train'])
+            sparse.save_npz(f'{results_folder}/X_test_multi_hot.npz', sparse_features['X_test'])
+            pd.Series(sparse_features['feature_names']).to_csv(f'{results_folder}/multi_hot_feature_list.csv', index=False, header=False)
     
-    print(f"\n Kaydedilen dosyalar:")
-    print(f"• full_preprocessed_data.csv - Tam işlenmiş veri")
-    print(f"• X_train.csv, X_test.csv - Model özellikleri")
-    print(f"• y_train.csv, y_test.csv - Hedef değişken")
+    # Puanlamada kalan NaN'lar için (create_model_ready_dataset ile aynı) medianlar
+    fill_values = df_step5[feature_columns].median().to_dict() if artifacts_folder is not None else None
     
-    return {
+    results = {
         'full_data': df_step5,
         'X_train': X_train,
         'X_test': X_test,
@@ -451,5 +1407,38 @@ def full_preprocessing_pipeline(df, target_col='TedaviSuresi'):
         'scaler': scaler,
         'encoding_info': encoding_info,
         'outlier_info': outlier_info,
-        'pipeline_steps': pipeline_steps
+        'missing_value_state': missing_value_state,
+        'fill_values': fill_values,
+        'clean_medians': clean_medians,
+        'pipeline_steps': pipeline_steps,
+        'peak_rss_increase_mb': rss_increase,
+        'sparse_features': sparse_features
     }
+    
+    # Öğrenilmiş durumu kaydet
+    if artifacts_folder is not None:
+        with profile_stage(profiler, 'artifacts'):
+            save_pipeline_artifacts(results, artifacts_folder)
+    
+    results['profile'] = profiler.report() if profiler is not None else None
+    
+    # Pipeline özeti
+    logger.info("\n" + "="*80)
+    logger.info("VERİ ÖN İŞLEME PIPELINE'I TAMAMLANDI!")
+    logger.info("="*80)
+    
+    logger.info("\n Pipeline Adımları:")
+    for i, step in enumerate(pipeline_steps, 1):
+        logger.info(f"{i}. {step}")
+    
+    logger.info(f"\n Kaydedilen dosyalar:")
+    extension = OUTPUT_FORMATS[output_format]
+    logger.info(f"• full_preprocessed_data{OUTPUT_FORMATS[full_data_format]} - Tam işlenmiş veri")
+    logger.info(f"• X_train{extension}, X_test{extension} - Model özellikleri")
+    logger.info(f"• y_train{extension}, y_test{extension} - Hedef değişken")
+    if sparse_features is not None:
+        logger.info(f"• X_train_multi_hot.npz, X_test_multi_hot.npz - Seyrek multi-hot özellikler")
+    if artifacts_folder is not None:
+        logger.info(f"• {artifacts_folder} - Pipeline artifact'ı (durum + şema)")
+    
+    return results
@@ -0,0 +1,356 @@
+import pandas as pd
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+from .data_loader import (
+    CATEGORICAL_COLUMNS,
+    EMPTY_LIST_VALUE,
+    TEXT_COLUMNS,
+    UNKNOWN_CATEGORY,
+    _extract_number,
+    clean_all_numeric_columns_advanced,
+    clean_categorical_columns,
+    clean_text_columns,
+    compute_clean_medians
+)
+from .preprocessing_functions import (
+    AGE_BINS,
+    AGE_LABELS,
+    CHILD_AGE,
+    ELDERLY_AGE,
+    GROUP_COLUMNS,
+    HEALTH_FEATURES,
+    LONG_TREATMENT_SESSIONS,
+    RISK_COLUMNS,
+    TREATMENT_BINS,
+    TREATMENT_LABELS,
+    _group_median_impute,
+    _imputation_columns,
+    _model_feature_columns,
+    _outlier_clip_columns,
+    _tree_knn_impute,
+    advanced_missing_value_handler,
+    fit_missing_value_state,
+    outlier_detection_and_treatment,
+    advanced_feature_engineering,
+    smart_encoding,
+    feature_scaling
+)
+from .text_functions import parse_multi_value
+
+# Bu boyuttan küçük yığınlarda nesne sütunları doğrudan döngüyle işlenir
+SMALL_BATCH_SIZE = 64
+
+def _is_missing(value):
+    return not isinstance(value, str) and pd.isna(value)
+
+def _map_values(values, func):
+    """
+    Nesne dizisindeki her değere func uygular
+
+    Küçük yığınlarda doğrudan döngü, büyük yığınlarda her benzersiz değer için
+    tek çağrı (pd.factorize) kullanılır.
+    """
+    if len(values) <= SMALL_BATCH_SIZE:
+        return np.array([func(value) for value in values])
+
+    codes, uniques = pd.factorize(values)
+    # -1 kodu (NaN) listenin son elemanına düşer
+    mapped = [func(value) for value in uniques] + [func(np.nan)]
+    return np.array(mapped)[codes]
+
+def _cut(values, bins, labels):
+    """
+    pd.cut(..., right=False) ile aynı etiketleri nesne dizisi olarak döndürür
+    """
+    positions = np.searchsorted(bins, values, side='right') - 1
+    valid = (values >= bins[0]) & (values < bins[-1])
+    label_array = np.array(labels, dtype=object)
+    return np.where(valid, label_array[np.clip(positions, 0, len(labels) - 1)], np.nan)
+
+class PreprocessingTransformer(BaseEstimator, TransformerMixin):
+    """
+    full_preprocessing_pipeline'ın fit/transform sürümü
+
+    fit, pipeline aşamalarını eğitim verisi üzerinde çalıştırır ve öğrenilen
+    durumu (eksik değer durumu, aykırı değer sınırları, encoding_info, scaler,
+    doldurma medianları) saklar. transform yalnızca NumPy işlemleriyle
+    çalışır; tek bir hasta kaydı (dict), kayıt listesi veya DataFrame kabul
+    eder ve feature_columns_ sırasında özellik matrisi döndürür.
+
+    Referans yol transform_with_pipeline_state'tir (aşama fonksiyonlarını
+    DataFrame üzerinde çağırır). Buradaki _clean/_impute/_engineer/_encode/
+    _scale adımları aynı sonucu düşük gecikmeyle üretmek için o aşamaların
+    NumPy karşılıklarıdır; bir aşama değişirse buradaki karşılığı da
+    değişmeli ve tests/test_transformer.py ile karşılaştırılmalıdır.
+
+    imputation: sayısal eksik değer yöntemi (bkz. fit_missing_value_state);
+    full_preprocessing_pipeline ile aynı seçilmelidir. 'tree' puanlamada
+    eğitim satırı sayısından bağımsıza yakın sürede çalışır (KD-tree'ler
+    eksiklik deseni başına bir kez kurulur); 'knn' her eksik satır için tüm
+    eğitim satırlarına mesafe hesaplar.
+    clean_input=True ise girdi ham veridir ve önce veri temizleme adımları
+    (sayı çıkarma, kategorik/metin doldurma) uygulanır.
+    """
+
+    def __init__(self, target_col='TedaviSuresi', hasta_no='HastaNo', scaling_method='standard', clean_input=False,
+                 imputation='knn'):
+        self.target_col = target_col
+        self.hasta_no = hasta_no
+        self.scaling_method = scaling_method
+        self.clean_input = clean_input
+        self.imputation = imputation
+
+    def fit(self, X, y=None):
+        """
+        Pipeline aşamalarını X üzerinde çalıştırarak durumu öğrenir
+        """
+        df = X
+        target_col = self.target_col
+
+        # 0. Veri temizleme (isteğe bağlı)
+        self.clean_medians_ = {}
+        if self.clean_input:
+            self.clean_medians_ = compute_clean_medians(df)
+            df = clean_all_numeric_columns_advanced(df, medians=self.clean_medians_)
+            df = clean_categorical_columns(df, inplace=True)
+            df = clean_text_columns(df, inplace=True)
+        self.categorical_clean_columns_ = [col for col in CATEGORICAL_COLUMNS if col in df.columns]
+        self.text_clean_columns_ = [col for col in TEXT_COLUMNS if col in df.columns]
+
+        # 1. Eksik değer durumu (bir kez öğrenilir, eğitim verisi de bu durumla doldurulur)
+        self.missing_value_state_ = fit_missing_value_state(df, target_col, self.hasta_no, self.imputation)
+        self.impute_columns_ = _imputation_columns(df, target_col, self.hasta_no)
+        self.imputer_ = self.missing_value_state_['imputer']
+        self.target_median_ = self.missing_value_state_['medians'].get(target_col, np.nan)
+        self.modes_ = self.missing_value_state_['modes']
+        self.group_columns_ = [col for col in GROUP_COLUMNS if col in df.columns]
+        self._trees = {}
+
+        df1 = advanced_missing_value_handler(df, target_col, self.hasta_no, imputation=self.imputation,
+                                             imputer=self.imputer_, medians=self.missing_value_state_['medians'],
+                                             modes=self.modes_)
+
+        # 2. Aykırı değer sınırları (yalnızca pipeline'ın kırptığı sütunlar)
+        df2, outlier_info = outlier_detection_and_treatment(df1, target_col, self.hasta_no)
+        self.clip_bounds_ = {col: outlier_info[col]['bounds'] for col in _outlier_clip_columns(outlier_info, target_col)}
+
+        # 3. Özellik mühendisliği
+        df3 = advanced_feature_engineering(df2, inplace=True, target_col=target_col)
+        self.engineered_columns_ = [col for col in df3.columns if col not in df1.columns]
+        self.health_sum_columns_ = [col for col in df3.columns if col.endswith('_Sayisi')]
+        self.risk_columns_ = [col for col in RISK_COLUMNS if col in df3.columns]
+
+        # 4. Kategorik kodlama
+        df4, self.encoding_info_ = smart_encoding(df3, target_col, inplace=True)
+
+        # 5. Ölçeklendirme
+        df5, self.scaler_ = feature_scaling(df4, target_col, self.hasta_no, self.scaling_method, inplace=True)
+        self.scaled_columns_ = list(self.scaler_.feature_names_in_) if self.scaler_ is not None else []
+
+        # 6. Model özellikleri (create_model_ready_dataset ile aynı seçim)
+        self.feature_columns_ = _model_feature_columns(df5, target_col)
+        self.fill_values_ = df5[self.feature_columns_].median().to_numpy(dtype=float)
+
+        # transform için hazır arama tabloları
+        self.label_maps_ = {col: {label: i for i, label in enumerate(info['encoder'].classes_)}
+                            for col, info in self.encoding_info_.items() if info['type'] == 'label'}
+        # Özelliklere veya ölçeklendirmeye girmeyen sütunlar (örn. bool dummy'ler) hesaplanmaz
+        self.required_columns_ = set(self.feature_columns_) | set(self.scaled_columns_)
+
+        return self
+
+    def get_feature_names_out(self, input_features=None):
+        return np.array(self.feature_columns_, dtype=object)
+
+    def transform(self, X):
+        """
+        Öğrenilen durumla X'i özellik matrisine (n_satır x n_özellik) dönüştürür
+        """
+        columns, n_rows = self._to_columns(X)
+
+        if self.clean_input:
+            self._clean(columns, n_rows)
+        self._impute(columns, n_rows)
+
+        for col, (lower, upper) in self.clip_bounds_.items():
+            columns[col] = np.clip(self._float_column(columns, col, n_rows), lower, upper)
+
+        self._engineer(columns, n_rows)
+        self._encode(columns, n_rows)
+        self._scale(columns, n_rows)
+
+        result = np.column_stack([self._float_column(columns, col, n_rows) for col in self.feature_columns_])
+        missing = np.isnan(result)
+        if missing.any():
+            result[missing] = np.broadcast_to(self.fill_values_, result.shape)[missing]
+        return result
+
+    def transform_frame(self, X):
+        """
+        transform sonucunu özellik adlarıyla DataFrame olarak döndürür
+        """
+        index = X.index if isinstance(X, pd.DataFrame) else None
+        return pd.DataFrame(self.transform(X), columns=self.feature_columns_, index=index)
+
+    # Yardımcı adımlar
+
+    @staticmethod
+    def _to_columns(X):
+        if isinstance(X, pd.DataFrame):
+            if len(X) <= SMALL_BATCH_SIZE:
+                # Küçük yığınlarda tek dönüşüm, sütun başına pandas yükünden ucuzdur
+                values = X.to_numpy(dtype=object)
+                return {col: values[:, j] for j, col in enumerate(X.columns)}, len(X)
+            columns = {}
+            for col in X.columns:
+                values = X[col]
+                if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+                    values = values.astype(object)
+                columns[col] = values.to_numpy()
+            return columns, len(X)
+
+        records = [X] if isinstance(X, dict) else list(X)
+        keys = {}
+        for record in records:
+            keys.update(dict.fromkeys(record))
+        columns = {key: np.array([record.get(key, np.nan) for record in records], dtype=object) for key in keys}
+        return columns, len(records)
+
+    @staticmethod
+    def _float_column(columns, col, n_rows):
+        if col not in columns:
+            return np.full(n_rows, np.nan)
+        values = columns[col]
+        if values.dtype == bool:
+            return values.astype(float)
+        return np.asarray(values, dtype=float)
+
+    @staticmethod
+    def _object_column(columns, col, n_rows):
+        if col not in columns:
+            return np.full(n_rows, np.nan, dtype=object)
+        return np.asarray(columns[col], dtype=object)
+
+    def _clean(self, columns, n_rows):
+        for col, median_val in self.clean_medians_.items():
+            values = _map_values(self._object_column(columns, col, n_rows), _extract_number).astype(float)
+            values[np.isnan(values)] = median_val if not pd.isna(median_val) else 0
+            columns[col] = values
+
+        for col in self.categorical_clean_columns_:
+            columns[col] = _map_values(self._object_column(columns, col, n_rows),
+                                       lambda v: UNKNOWN_CATEGORY if _is_missing(v) else str(v)).astype(object)
+
+        for col in self.text_clean_columns_:
+            values = _map_values(self._object_column(columns, col, n_rows),
+                                 lambda v: EMPTY_LIST_VALUE if _is_missing(v) else str(v).strip()).astype(object)
+            columns[col] = values
+            columns[f'{col}_Count'] = _map_values(values, lambda v: parse_multi_value(v)[0]).astype(np.int64)
+
+    def _impute(self, columns, n_rows):
+        if self.imputer_ is not None:
+            matrix = np.column_stack([self._float_column(columns, col, n_rows) for col in self.impute_columns_])
+            # Imputer yalnızca eksik değer varsa çalışır; eksiksiz satırlar değişmez
+            if np.isnan(matrix).any():
+                matrix = self._impute_matrix(matrix, columns, n_rows)
+            for j, col in enumerate(self.impute_columns_):
+                columns[col] = matrix[:, j]
+
+        target = self._float_column(columns, self.target_col, n_rows).copy()
+        target[np.isnan(target)] = self.target_median_
+        columns[self.target_col] = target
+
+        for col, mode_val in self.modes_.items():
+            values = self._object_column(columns, col, n_rows)
+            missing = _map_values(values, _is_missing).astype(bool)
+            if missing.any():
+                values = values.copy()
+                values[missing] = mode_val
+            columns[col] = values
+
+    def _impute_matrix(self, matrix, columns, n_rows):
+        if self.imputation == 'tree':
+            # KD-tree'ler eğitim komşu kümesinden desen başına bir kez kurulur (fit'te sıfırlanır)
+            return _tree_knn_impute(matrix, reference=self.imputer_, columns=self.impute_columns_, trees=self._trees)
+        if self.imputation == 'knn':
+            return self.imputer_.transform(pd.DataFrame(matrix, columns=self.impute_columns_))
+        frame = pd.DataFrame(matrix, columns=self.impute_columns_)
+        for col in self.group_columns_:
+            frame[col] = self._object_column(columns, col, n_rows)
+        return _group_median_impute(frame, self.impute_columns_, self.group_columns_,
+                                    reference=self.imputer_).to_numpy(dtype=float)
+
+    def _engineer(self, columns, n_rows):
+        engineered = self.engineered_columns_
+
+        if 'Yas_Grubu' in engineered:
+            age = self._float_column(columns, 'Yas', n_rows)
+            columns['Yas_Grubu'] = _cut(age, AGE_BINS, AGE_LABELS)
+            columns['Yasli_Mi'] = (age >= ELDERLY_AGE).astype(np.int64)
+            columns['Cocuk_Mu'] = (age < CHILD_AGE).astype(np.int64)
+
+        if 'Tedavi_Kategori' in engineered:
+            target = self._float_column(columns, self.target_col, n_rows)
+            columns['Tedavi_Kategori'] = _cut(target, TREATMENT_BINS, TREATMENT_LABELS)
+            columns['Uzun_Tedavi'] = (target >= LONG_TREATMENT_SESSIONS).astype(np.int64)
+
+        for col in HEALTH_FEATURES:
+            if f'{col}_Var' in engineered:
+                parsed = _map_values(self._object_column(columns, col, n_rows), lambda v: parse_multi_value(v)[1:4])
+                parsed = parsed.reshape(n_rows, 3).astype(np.int64)
+                columns[f'{col}_Var'] = parsed[:, 0]
+                columns[f'{col}_Sayisi'] = parsed[:, 1]
+                columns[f'{col}_Uzunluk'] = parsed[:, 2]
+
+        if 'Toplam_Saglik_Sorunu' in engineered:
+            columns['Toplam_Saglik_Sorunu'] = sum(self._float_column(columns, col, n_rows) for col in self.health_sum_columns_)
+
+        if 'Yuksek_Riskli' in engineered:
+            risk = sum(self._float_column(columns, col, n_rows) for col in self.risk_columns_)
+            columns['Yuksek_Riskli'] = (risk >= 1).astype(np.int64)
+
+    def _encode(self, columns, n_rows):
+        for col, info in self.encoding_info_.items():
+            values = self._object_column(columns, col, n_rows)
+
+            if info['type'] == 'label':
+                classes = self.label_maps_[col]
+                # Eğitimde görülmeyen değerler -1
+                columns[f'{col}_encoded'] = _map_values(values, lambda v: classes.get(str(v), -1)).astype(np.int64)
+
+            elif info['type'] == 'onehot':
+                dummies = [dummy for dummy in info['columns'] if dummy in self.required_columns_]
+                if dummies:
+                    labels = _map_values(values, lambda v: None if _is_missing(v) else str(v))
+                    prefix_length = len(col) + 1
+                    for dummy in dummies:
+                        columns[dummy] = labels == dummy[prefix_length:]
+
+            else:
+                frequency_map = info['frequency_map']
+                top_categories = set(info['top_categories'])
+                columns[f'{col}_frequency'] = _map_values(values, lambda v: frequency_map.get(v, np.nan)).astype(float)
+                columns[f'{col}_is_top'] = _map_values(values, lambda v: v in top_categories).astype(np.int64)
+                dummies = [dummy for dummy in info['top_columns'] if dummy in self.required_columns_]
+                if dummies:
+                    top_labels = _map_values(values, lambda v: str(v) if v in top_categories else 'Other')
+                    for dummy in dummies:
+                        columns[dummy] = top_labels == dummy[len(col) + len('_top_'):]
+
+    def _scale(self, columns, n_rows):
+        if self.scaler_ is None:
+            return
+
+        matrix = np.column_stack([self._float_column(columns, col, n_rows) for col in self.scaled_columns_])
+        # sklearn transform ile aynı işlemler, doğrulama yükü olmadan
+        if isinstance(self.scaler_, StandardScaler):
+            matrix = (matrix - self.scaler_.mean_) / self.scaler_.scale_
+        elif isinstance(self.scaler_, MinMaxScaler):
+            matrix = matrix * self.scaler_.scale_ + self.scaler_.min_
+        else:
+            matrix = self.scaler_.transform(matrix)
+
+        for j, col in enumerate(self.scaled_columns_):
+            columns[col] = matrix[:, j]
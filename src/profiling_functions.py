@@ -0,0 +1,189 @@
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+from .logging_functions import get_logger
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = get_logger(__name__)
+
+def peak_rss_mb():
+    """
+    Sürecin şimdiye kadarki en yüksek bellek kullanımını (peak RSS) MB olarak döndürür
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS byte cinsinden döndürür
+    if sys.platform == 'darwin':
+        return peak / 1024**2
+    return peak / 1024
+
+def report_peak_rss_increase(record, stage):
+    """
+    Aşamanın süreç peak RSS'ini ne kadar yükselttiğini yazdırır ve döndürür
+
+    record: profile_stage bloğunun kaydı. 0, aşamanın önceki tepenin altında
+    kaldığı anlamına gelir; süreç ömrü boyunca tepe değeri hiç düşmez.
+    """
+    increase = record.peak_rss_increase_mb
+    if increase is not None:
+        logger.info(f"Peak RSS artışı ({stage}): {increase:.1f} MB")
+    return increase
+
+def _frame_shape(data):
+    """
+    DataFrame/dizi (veya sonuç tuple'ındaki ilk DataFrame) için (satır, sütun)
+    """
+    if isinstance(data, tuple):
+        data = next((item for item in data if hasattr(item, 'shape')), None)
+    shape = getattr(data, 'shape', None)
+    if shape is None:
+        return None, None
+    return shape[0], (shape[1] if len(shape) > 1 else 1)
+
+class _StageRecord:
+    """
+    Tek bir aşamanın ölçümü; stage() bloğu içinde output() ile çıktı verilir
+    """
+
+    def __init__(self, name, data_in):
+        self.name = name
+        self.rows_in, self.cols_in = _frame_shape(data_in)
+        self.rows_out, self.cols_out = None, None
+        self.peak_rss_increase_mb = None
+
+    def output(self, data_out=None, shape=None):
+        """
+        Aşama çıktısını kaydeder ve aynen döndürür (shape ile boyut doğrudan da verilebilir)
+        """
+        self.rows_out, self.cols_out = shape if shape is not None else _frame_shape(data_out)
+        return data_out
+
+class StageProfiler:
+    """
+    Pipeline aşamaları için süre ve bellek profilleyici
+
+    Her aşama için duvar saati süresi, CPU süresi (süreç toplamı; işçi
+    süreçler hariç), bellek, isteğe bağlı tracemalloc tepe değeri ve
+    giriş/çıkış satır-sütun sayıları kaydedilir.
+
+    Bellek alanları:
+        process_peak_rss_mb: aşama sonunda sürecin ömür boyu peak RSS'i
+            (ru_maxrss); önceki aşamaları da kapsar, aşamaya özgü değildir.
+        peak_rss_increase_mb: aşamanın süreç tepe değerini ne kadar
+            yükselttiği; 0 ise aşama önceki tepenin altında kalmıştır.
+        traced_peak_mb: aşamaya özgü tepe ayırma (yalnızca trace_memory=True).
+
+    trace_memory=True ise aşama içindeki en yüksek Python/NumPy ayırması
+    tracemalloc ile ölçülür; bu ayırmaları yavaşlattığından varsayılan kapalıdır.
+
+    Kullanım:
+        profiler = StageProfiler()
+        with profiler.stage('temizleme', df) as stage:
+            df_clean = stage.output(clean(df))
+        profiler.report(); profiler.to_json('results/profile.json')
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.stages = []
+
+    @contextlib.contextmanager
+    def stage(self, name, data_in=None):
+        record = _StageRecord(name, data_in)
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+
+        rss_start = peak_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield record
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            traced_peak = None
+            if self.trace_memory:
+                traced_peak = tracemalloc.get_traced_memory()[1] / 1024**2
+                if started_tracing:
+                    tracemalloc.stop()
+
+            process_peak = peak_rss_mb()
+            record.peak_rss_increase_mb = process_peak - rss_start if process_peak is not None else None
+            self.stages.append({
+                'stage': name,
+                'wall_seconds': wall,
+                'cpu_seconds': cpu,
+                'process_peak_rss_mb': process_peak,
+                'peak_rss_increase_mb': record.peak_rss_increase_mb,
+                'traced_peak_mb': traced_peak,
+                'rows_in': record.rows_in,
+                'cols_in': record.cols_in,
+                'rows_out': record.rows_out,
+                'cols_out': record.cols_out
+            })
+            logger.debug(f"{name}: {wall:.3f} sn (CPU {cpu:.3f} sn)")
+
+    def report(self):
+        """
+        Yapılandırılmış rapor: aşama kayıtları, toplamlar ve en yavaş aşama
+        """
+        total_wall = sum(stage['wall_seconds'] for stage in self.stages)
+        slowest = max(self.stages, key=lambda stage: stage['wall_seconds'], default=None)
+        return {
+            'stages': [dict(stage) for stage in self.stages],
+            'total_wall_seconds': total_wall,
+            'total_cpu_seconds': sum(stage['cpu_seconds'] for stage in self.stages),
+            'slowest_stage': slowest['stage'] if slowest is not None else None,
+            'trace_memory': self.trace_memory
+        }
+
+    def to_dataframe(self):
+        """
+        Aşama kayıtları tablo olarak (her satır bir aşama)
+        """
+        return pd.DataFrame(self.stages)
+
+    def to_json(self, path):
+        """
+        Raporu JSON olarak kaydeder, dosya yolunu döndürür
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, ensure_ascii=False, indent=2)
+        return path
+
+@contextlib.contextmanager
+def _rss_stage(name):
+    record = _StageRecord(name, None)
+    rss_start = peak_rss_mb()
+    try:
+        yield record
+    finally:
+        if rss_start is not None:
+            record.peak_rss_increase_mb = peak_rss_mb() - rss_start
+
+def profile_stage(profiler, name, data_in=None):
+    """
+    profiler verilmişse onun stage() bloğunu, yoksa yalnızca peak RSS artışını ölçen bir blok döndürür
+    """
+    if profiler is None:
+        return _rss_stage(name)
+    return profiler.stage(name, data_in)
@@ -0,0 +1,413 @@
+import copy
+import math
+
+import numpy as np
+import pandas as pd
+
+class QuantileSketch:
+    """
+    Birleştirilebilir (mergeable) KLL tarzı kantil sketch'i
+
+    Veri parça parça update ile eklenir, farklı parçalar/işçiler üzerinde
+    oluşturulan sketch'ler merge ile birleştirilir. Bellek kullanımı satır
+    sayısından bağımsız olarak yaklaşık O(k) kalır.
+
+    epsilon: hedeflenen normalize sıra (rank) hatası; k = ceil(2.5 / epsilon).
+    Örn. epsilon=0.01 ile median, gerçek medianın %1 sıra uzaklığı içindedir
+    (yüksek olasılıkla). Hiç sıkıştırma yapılmadıysa sonuçlar kesindir ve
+    pandas'ın doğrusal interpolasyonlu quantile'ı ile aynıdır.
+    """
+
+    def __init__(self, epsilon=0.01, random_state=None):
+        self.epsilon = epsilon
+        self.k = max(8, math.ceil(2.5 / epsilon))
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(random_state)
+
+    def _capacity(self, level):
+        # Üst seviyeler k, alt seviyeler geometrik olarak daha küçük kapasiteye sahip
+        depth = len(self.levels) - 1 - level
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                # Tek sayıda eleman varsa biri bu seviyede kalır
+                keep = items[:1] if len(items) % 2 else items[:0]
+                pairs = items[len(keep):]
+                promoted = pairs[self._rng.integers(0, 2)::2]
+
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values):
+        """
+        Yeni değerleri ekler (NaN değerler atlanır)
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """
+        Başka bir sketch'i bu sketch'e ekler
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+        return self
+
+    @property
+    def is_exact(self):
+        return len(self.levels) == 1
+
+    def quantile(self, q):
+        """
+        q kantilini (veya kantil listesini) döndürür
+        """
+        if self.n == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+        if self.is_exact:
+            return np.quantile(self.levels[0], q)
+
+        # Her seviyedeki eleman 2^seviye ağırlık taşır
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level_items), 2 ** level, dtype=float)
+                                  for level, level_items in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+
+        ranks = np.asarray(q, dtype=float) * cumulative[-1]
+        positions = np.clip(np.searchsorted(cumulative, ranks, side='left'), 0, len(items) - 1)
+        return items[positions]
+
+    def median(self):
+        return float(self.quantile(0.5))
+
+    def quartiles(self):
+        """
+        (Q1, median, Q3) döndürür
+        """
+        return tuple(float(value) for value in self.quantile([0.25, 0.5, 0.75]))
+
+    def __len__(self):
+        return self.n
+
+def build_quantile_sketches(data, columns=None, epsilon=0.01, random_state=42):
+    """
+    DataFrame veya DataFrame parçaları (örn. read_csv(chunksize=...)) üzerinden
+    sütun başına QuantileSketch oluşturur
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    sketches = {}
+    for chunk in chunks:
+        selected = columns if columns is not None else chunk.select_dtypes(include=[np.number]).columns
+        for col in selected:
+            if col not in chunk.columns:
+                continue
+            if col not in sketches:
+                sketches[col] = QuantileSketch(epsilon=epsilon, random_state=random_state)
+            sketches[col].update(pd.to_numeric(chunk[col], errors='coerce').to_numpy(dtype=float))
+    return sketches
+
+def merge_quantile_sketches(sketch_dicts):
+    """
+    Farklı parçalardan/işçilerden gelen {sütun: sketch} sözlüklerini birleştirir
+
+    Girdi sketch'leri değiştirilmez; birleştirme kopyalar üzerinde yapılır.
+    """
+    merged = {}
+    for sketches in sketch_dicts:
+        for col, sketch in sketches.items():
+            if col in merged:
+                merged[col].merge(sketch)
+            else:
+                merged[col] = copy.deepcopy(sketch)
+    return merged
+
+def sketch_medians(sketches):
+    """
+    {sütun: median} sözlüğü (clean_all_numeric_columns_advanced, create_model_ready_dataset için)
+    """
+    return {col: sketch.median() for col, sketch in sketches.items()}
+
+def sketch_quartiles(sketches):
+    """
+    {sütun: (Q1, Q3)} sözlüğü (outlier_detection_and_treatment, target_analysis için)
+    """
+    result = {}
+    for col, sketch in sketches.items():
+        q1, _, q3 = sketch.quartiles()
+        result[col] = (q1, q3)
+    return result
+
+def _hash_values(values, dropna=True):
+    """
+    Değerlerin süreçten bağımsız 64-bit hash'leri (pandas hash_pandas_object)
+
+    Aynı değer farklı parçalarda/işçilerde aynı hash'i alır; sketch'ler bu
+    sayede birleştirilebilir. dropna=True ise NaN değerler atlanır.
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if dropna:
+        series = series.dropna()
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+def _bit_length(values):
+    """
+    uint64 dizisindeki her değerin bit uzunluğu (0 için 0)
+
+    32 bitlik yarılar float64'e kayıpsız çevrilir; frexp'in üssü bit uzunluğudur.
+    """
+    high = np.frexp((values >> np.uint64(32)).astype(float))[1]
+    low = np.frexp((values & np.uint64(0xFFFFFFFF)).astype(float))[1]
+    return np.where(high > 0, high + 32, low)
+
+class HyperLogLog:
+    """
+    Birleştirilebilir benzersiz değer sayacı (HyperLogLog)
+
+    2^precision adet 1 baytlık register tutulur (precision=12: 4 KB); bellek
+    satır ve benzersiz değer sayısından bağımsızdır. Göreli standart hata
+    yaklaşık 1.04 / sqrt(2^precision) (precision=12: %1.6). Küçük
+    kardinalitelerde (örn. <= 10) doğrusal sayım düzeltmesiyle sonuç
+    pratikte kesindir. NaN değerler sayılmaz (nunique ile aynı).
+    """
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, values):
+        hashes = _hash_values(values)
+        if len(hashes) == 0:
+            return self
+        # İlk precision bit register'ı, kalan bitlerdeki baştaki sıfırlar sırayı belirler
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - _bit_length(rest) + 1
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Farklı precision değerine sahip HyperLogLog'lar birleştirilemez")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    @property
+    def relative_error(self):
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def count(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(int)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros > 0:
+            # Küçük kardinalite düzeltmesi (doğrusal sayım)
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+class CountMinSketch:
+    """
+    Birleştirilebilir frekans tahmincisi (Count-Min)
+
+    depth × width sayaç tablosu; her değer her satırda bir sayaca eklenir,
+    tahmin satırların en küçüğüdür. Tahmin gerçek frekanstan küçük olmaz;
+    fazlası en fazla e / width × toplam adet olur (1 - e^-depth olasılıkla).
+    Birleştirilecek sketch'ler aynı width, depth ve random_state ile
+    oluşturulmalıdır.
+    """
+
+    def __init__(self, width=2048, depth=4, random_state=42):
+        self.width = width
+        self.depth = depth
+        self.random_state = random_state
+        rng = np.random.default_rng(random_state)
+        # Tek sayılı çarpanlar: satır başına farklı hash fonksiyonu
+        self.multipliers = rng.integers(1, 2 ** 63, size=depth, dtype=np.uint64) | np.uint64(1)
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+
+    def _indices(self, hashes):
+        return [((hashes * multiplier) >> np.uint64(32)) % np.uint64(self.width) for multiplier in self.multipliers]
+
+    def update(self, values):
+        hashes = _hash_values(values)
+        for row, indices in enumerate(self._indices(hashes)):
+            self.table[row] += np.bincount(indices.astype(np.intp), minlength=self.width)
+        self.total += len(hashes)
+        return self
+
+    def merge(self, other):
+        if (other.width, other.depth, other.random_state) != (self.width, self.depth, self.random_state):
+            raise ValueError("Farklı parametrelerle oluşturulan CountMinSketch'ler birleştirilemez")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def estimate(self, values):
+        """
+        Her değerin tahmini frekansı (values ile aynı sırada)
+        """
+        hashes = _hash_values(values, dropna=False)
+        estimates = [self.table[row, indices.astype(np.intp)] for row, indices in enumerate(self._indices(hashes))]
+        return np.min(estimates, axis=0) if estimates else np.zeros(len(hashes), dtype=np.int64)
+
+class SpaceSaving:
+    """
+    Birleştirilebilir en sık değerler (heavy hitters) özeti (Space-Saving)
+
+    En fazla capacity değer için tahmini adet ve hata payı tutulur. Her
+    parça önce tam sayılır, sonra özetle birleştirilir; birleştirmede özette
+    olmayan bir değerin adedi için threshold üst sınırı kullanılır. Tahmin
+    gerçek adetten küçük olmaz, gerçek adet en az (tahmin - hata) kadardır;
+    adedi threshold'dan büyük her değer özettedir.
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        # Özette olmayan herhangi bir değerin adedi için üst sınır
+        self.threshold = 0
+        self.n = 0
+
+    def update(self, values):
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        counts = series.value_counts()
+        counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+        chunk = SpaceSaving(self.capacity)
+        chunk.counts = counts.iloc[:self.capacity].astype(np.int64)
+        chunk.errors = pd.Series(0, index=chunk.counts.index, dtype=np.int64)
+        chunk.threshold = int(counts.iloc[self.capacity]) if len(counts) > self.capacity else 0
+        chunk.n = int(counts.sum())
+        return self.merge(chunk)
+
+    def merge(self, other):
+        index = self.counts.index.union(other.counts.index, sort=False)
+        counts = (self.counts.reindex(index).fillna(self.threshold)
+                  + other.counts.reindex(index).fillna(other.threshold)).astype(np.int64)
+        errors = (self.errors.reindex(index).fillna(self.threshold)
+                  + other.errors.reindex(index).fillna(other.threshold)).astype(np.int64)
+
+        counts = counts.sort_values(ascending=False, kind='stable')
+        dropped = int(counts.iloc[self.capacity]) if len(counts) > self.capacity else 0
+        self.threshold = max(self.threshold + other.threshold, dropped)
+        self.counts = counts.iloc[:self.capacity].rename('count')
+        self.errors = errors.reindex(self.counts.index)
+        self.n += other.n
+        return self
+
+    def top(self, n=10):
+        """
+        Tahmini adede göre azalan ilk n değer (value_counts().head(n) karşılığı)
+        """
+        return self.counts.head(n)
+
+class CategorySketch:
+    """
+    Kategorik sütun özeti: benzersiz sayısı (HyperLogLog), frekanslar
+    (Count-Min) ve en sık değerler (Space-Saving)
+
+    Bellek kullanımı satır sayısından bağımsızdır; parçalar üzerinde
+    oluşturulan sketch'ler merge ile birleştirilir.
+    """
+
+    def __init__(self, precision=12, width=2048, depth=4, capacity=64, random_state=42):
+        self.distinct = HyperLogLog(precision)
+        self.frequencies = CountMinSketch(width, depth, random_state)
+        self.heavy_hitters = SpaceSaving(capacity)
+        self.n = 0
+        self.null_count = 0
+
+    def update(self, values):
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        self.n += len(series)
+        self.null_count += int(series.isna().sum())
+        self.distinct.update(series)
+        self.frequencies.update(series)
+        self.heavy_hitters.update(series)
+        return self
+
+    def merge(self, other):
+        self.distinct.merge(other.distinct)
+        self.frequencies.merge(other.frequencies)
+        self.heavy_hitters.merge(other.heavy_hitters)
+        self.n += other.n
+        self.null_count += other.null_count
+        return self
+
+    def distinct_count(self):
+        return self.distinct.count()
+
+    def top(self, n=10):
+        """
+        En sık n değer; Space-Saving adayları iki üst sınırın (Space-Saving
+        ve Count-Min tahmini) küçüğüne göre sıralanır
+        """
+        candidates = self.heavy_hitters.counts
+        estimates = np.minimum(candidates.to_numpy(), self.frequencies.estimate(candidates.index.to_series()))
+        refined = pd.Series(estimates, index=candidates.index, name='count')
+        return refined.sort_values(ascending=False, kind='stable').head(n)
+
+    def frequency_map(self, values):
+        """
+        values'taki her benzersiz değerin tahmini frekansı (azalan sırada sözlük)
+        """
+        series = values if isinstance(values, pd.Series) else pd.Series(values)
+        uniques = pd.Series(series.dropna().unique()).astype(series.dtype)
+        estimates = pd.Series(self.frequencies.estimate(uniques), index=uniques.to_numpy())
+        return estimates.sort_values(ascending=False, kind='stable').to_dict()
+
+def build_category_sketches(data, columns=None, **sketch_params):
+    """
+    DataFrame veya DataFrame parçaları (örn. read_csv(chunksize=...)) üzerinden
+    sütun başına CategorySketch oluşturur (varsayılan: object/category sütunlar)
+    """
+    chunks = [data] if isinstance(data, pd.DataFrame) else data
+    sketches = {}
+    for chunk in chunks:
+        selected = columns if columns is not None else chunk.select_dtypes(include=['object', 'category']).columns
+        for col in selected:
+            if col not in chunk.columns:
+                continue
+            if col not in sketches:
+                sketches[col] = CategorySketch(**sketch_params)
+            sketches[col].update(chunk[col])
+    return sketches
+
+def merge_category_sketches(sketch_dicts):
+    """
+    Farklı parçalardan/işçilerden gelen {sütun: CategorySketch} sözlüklerini birleştirir
+
+    Girdi sketch'leri değiştirilmez; birleştirme kopyalar üzerinde yapılır.
+    """
+    merged = {}
+    for sketches in sketch_dicts:
+        for col, sketch in sketches.items():
+            if col in merged:
+                merged[col].merge(sketch)
+            else:
+                merged[col] = copy.deepcopy(sketch)
+    return merged
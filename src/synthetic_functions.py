@@ -0,0 +1,242 @@
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+from .logging_functions import get_logger
+
+logger = get_logger(__name__)
+
+# Orijinal veri setinin satır sayısı (kardinalite ölçeklemesi için referans)
+BASE_ROWS = 2235
+
+# İlk hasta numarası ve hasta başına ortalama kayıt sayısı (orijinal veride ~5.5)
+FIRST_HASTA_NO = 145134
+VISITS_PER_PATIENT = 5.5
+
+# Hasta düzeyinde sabit olan sütunlar (aynı hastanın tüm kayıtlarında aynı)
+PATIENT_COLUMNS = ['Yas', 'Cinsiyet', 'KanGrubu', 'Uyruk', 'KronikHastalik', 'Alerji']
+
+COLUMN_ORDER = ['HastaNo', 'Yas', 'Cinsiyet', 'KanGrubu', 'Uyruk', 'KronikHastalik', 'Bolum', 'Alerji',
+                'Tanilar', 'TedaviAdi', 'TedaviSuresi', 'UygulamaYerleri', 'UygulamaSuresi']
+
+# Şablon verilmediğinde kullanılan dağılımlar (orijinal verideki frekans ve eksik oranlarına yakın)
+# Kategorik sütunlar: (değerler, ağırlıklar, eksik oranı)
+DEFAULT_CATEGORIES = {
+    'Cinsiyet': (['Kadın', 'Erkek'], [1274, 792], 0.076),
+    'KanGrubu': (['0 Rh+', 'A Rh+', 'B Rh+', 'AB Rh+', 'B Rh-', 'A Rh-', '0 Rh-', 'AB Rh-'],
+                 [579, 540, 206, 80, 68, 53, 26, 8], 0.302),
+    'Uyruk': (['Türkiye', 'Tokelau', 'Arnavutluk', 'Azerbaycan', 'Libya'], [2173, 27, 13, 12, 10], 0.0),
+    'Bolum': (['Fiziksel Tıp Ve Rehabilitasyon,Solunum Merkezi', 'Ortopedi Ve Travmatoloji', 'İç Hastalıkları',
+               'Nöroloji', 'Kardiyoloji', 'Göğüs Hastalıkları', 'Genel Cerrahi', 'Kalp Ve Damar Cerrahisi',
+               'Laboratuvar', 'Tıbbi Onkoloji'],
+              [2045, 88, 32, 17, 11, 8, 7, 7, 5, 3], 0.005),
+    'TedaviAdi': (['Dorsalji -Boyun+trapez', 'İV DİSK BOZUKLUĞU-BEL', 'Dorsalji 1', 'Dorsalji-Bel',
+                   'Gonartroz-Meniskopati', 'SAĞ OMUZ İMPİNGEMENT', 'SOL OMUZ İMPİNGEMENT', 'Boyun-Trapez',
+                   'Koksartroz', 'Alt ekstremite atrofi'],
+                  [231, 200, 140, 120, 95, 70, 60, 50, 40, 30], 0.0),
+    'TedaviSuresi': ([f'{n} Seans' for n in (15, 10, 20, 2, 17, 4, 5, 3, 1, 30, 25, 7)],
+                     [1670, 175, 113, 45, 36, 35, 30, 25, 20, 15, 10, 5], 0.0),
+    'UygulamaSuresi': ([f'{n} Dakika' for n in (20, 5, 10, 15, 30, 45, 3, 8, 25, 40)],
+                       [1535, 360, 221, 89, 11, 10, 3, 2, 2, 2], 0.0)
+}
+
+# Liste sütunları: (parçalar, ağırlıklar, en fazla parça sayısı, eksik oranı)
+DEFAULT_LISTS = {
+    'KronikHastalik': (['Myastenia gravis', 'Aritmi', 'Fascioscapulohumeral Distrofi', 'Hipertiroidizm',
+                        'Limb-Girdle Musküler Distrofi', 'Astım', 'Kalp yetmezliği', 'Hipertansiyon',
+                        'Diyabet', 'Kolesterol', 'Duchenne Musküler Distrofi', 'Becker Musküler Distrofi'],
+                       [38, 36, 36, 34, 34, 30, 33, 30, 28, 26, 20, 18], 4, 0.273),
+    'Alerji': (['Polen', 'POLEN', 'Toz', 'ARVELES', 'CORASPIN', 'Sucuk', 'NOVALGIN', 'Yer Fıstığı',
+                'Volteren', 'Gripin'],
+               [198, 134, 119, 102, 102, 91, 90, 50, 40, 30], 2, 0.422),
+    'Tanilar': (['DORSALJİ, DİĞER, LUMBOSAKRAL BÖLGE', 'Omuzun darbe sendromu',
+                 'İntervertebral disk bozuklukları, tanımlanmamış', 'DORSALJİ, DİĞER, SERVİKOTORASİK BÖLGE',
+                 'Eklem ağrısı', 'DORSALJİ, DİĞER, SERVİKAL BÖLGE', 'Gonartroz, tanımlanmamış',
+                 'Lumbago', 'Servikal disk bozuklukları', 'Tortikollis'],
+                [149, 128, 116, 96, 51, 49, 45, 40, 35, 30], 3, 0.034),
+    'UygulamaYerleri': (['Bel', 'Boyun', 'Diz', 'Sol Omuz Bölgesi', 'Sağ Omuz Bölgesi', 'Sol El Bilek Bölgesi',
+                         'Sırt', 'Sağ Diz', 'Sol Diz', 'Ayak Bileği'],
+                        [528, 363, 177, 137, 127, 83, 60, 50, 45, 30], 2, 0.099)
+}
+
+def _normalize(weights):
+    weights = np.asarray(weights, dtype=float)
+    return weights / weights.sum()
+
+def _extra_value_count(n_values, n_rows):
+    """
+    Satır sayısı arttıkça eklenecek yeni değer sayısı (kardinalite ~ sqrt(n) büyür)
+    """
+    return max(0, int(n_values * (math.sqrt(n_rows / BASE_ROWS) - 1)))
+
+def _list_combinations(rng, tokens, token_probs, max_items, n_combinations):
+    """
+    Parçalardan virgülle birleştirilmiş benzersiz değerler üretir (örn. 'Aritmi, Astım')
+    """
+    sizes = 1 + np.minimum(rng.geometric(0.6, n_combinations) - 1, max_items - 1)
+    combinations = {}
+    for size in sizes:
+        picked = rng.choice(len(tokens), size=min(size, len(tokens)), replace=False, p=token_probs)
+        combinations[', '.join(tokens[i] for i in picked)] = None
+    return list(combinations)
+
+def _grow_pool(rng, values, probs, n_extra, tail_mass, make_values):
+    """
+    Değer havuzuna n_extra yeni değer ekler; yeni değerler toplam tail_mass
+    olasılığı Zipf benzeri azalan ağırlıklarla paylaşır
+    """
+    if n_extra <= 0:
+        return values, probs
+    existing = set(values)
+    new_values = [value for value in make_values(n_extra) if value not in existing]
+    if not new_values:
+        return values, probs
+    tail = _normalize(1 / np.arange(1, len(new_values) + 1)) * tail_mass
+    return list(values) + new_values, np.concatenate([probs * (1 - tail_mass), tail])
+
+def _default_pools(rng, n_rows, grow_cardinality, tail_mass):
+    """
+    Yerleşik dağılımlardan sütun başına (değerler, olasılıklar, eksik oranı) havuzları
+    """
+    pools = {}
+    for col, (values, weights, missing_rate) in DEFAULT_CATEGORIES.items():
+        probs = _normalize(weights)
+        if grow_cardinality and col == 'TedaviAdi':
+            n_extra = _extra_value_count(244, n_rows)
+            values, probs = _grow_pool(rng, values, probs, n_extra, tail_mass,
+                                       lambda n: [f'{values[i % len(values)]} {i // len(values) + 2}'
+                                                  for i in range(n)])
+        pools[col] = (values, probs, missing_rate)
+
+    for col, (tokens, weights, max_items, missing_rate) in DEFAULT_LISTS.items():
+        token_probs = _normalize(weights)
+        # Önce orijinale yakın sayıda kombinasyon, büyüyen veride yenileri eklenir
+        values = _list_combinations(rng, tokens, token_probs, max_items, 4 * len(tokens))
+        probs = _normalize(1 / np.arange(1, len(values) + 1))
+        if grow_cardinality:
+            n_extra = _extra_value_count(len(values), n_rows)
+            values, probs = _grow_pool(rng, values, probs, n_extra, tail_mass,
+                                       lambda n: _list_combinations(rng, tokens, token_probs, max_items + 1, n))
+        pools[col] = (values, probs, missing_rate)
+    return pools
+
+def _template_pools(template, rng, n_rows, grow_cardinality, tail_mass):
+    """
+    Şablon veriden (örn. orijinal Excel) sütun başına ampirik değer havuzları
+    """
+    pools = {}
+    for col in COLUMN_ORDER:
+        if col == 'HastaNo' or col not in template.columns:
+            continue
+        series = template[col]
+        counts = series.value_counts()
+        values, probs = list(counts.index), _normalize(counts.to_numpy())
+        # Yalnızca serbest metin sütunlarında (TedaviAdi, listeler) yeni değerler türetilir
+        if grow_cardinality and (col == 'TedaviAdi' or col in DEFAULT_LISTS) and len(values) > 10:
+            n_extra = _extra_value_count(len(values), n_rows)
+            if col in DEFAULT_LISTS:
+                tokens = pd.Series([item.strip() for value in values for item in str(value).split(',')]).value_counts()
+                token_list, token_probs = list(tokens.index), _normalize(tokens.to_numpy())
+                max_items = DEFAULT_LISTS[col][2]
+                make_values = lambda n, t=token_list, p=token_probs, m=max_items: _list_combinations(rng, t, p, m + 1, n)
+            else:
+                make_values = lambda n, v=values: [f'{v[i % len(v)]} {i // len(v) + 2}' for i in range(n)]
+            values, probs = _grow_pool(rng, values, probs, n_extra, tail_mass, make_values)
+        pools[col] = (values, probs, float(series.isna().mean()))
+    return pools
+
+def _build_pools(rng, n_rows, template, grow_cardinality, tail_mass):
+    """
+    Şablon verilmişse ampirik, verilmemişse yerleşik değer havuzlarını kurar
+    """
+    if template is not None:
+        return _template_pools(template, rng, n_rows, grow_cardinality, tail_mass)
+    return _default_pools(rng, n_rows, grow_cardinality, tail_mass)
+
+def _sample_column(rng, pool, size):
+    """
+    Havuzdan size adet değer çeker; eksik oranı kadarı NaN olur
+    """
+    values, probs, missing_rate = pool
+    choices = np.empty(len(values) + 1, dtype=object)
+    choices[:-1] = values
+    choices[-1] = np.nan
+    codes = rng.choice(len(values), size=size, p=probs)
+    if missing_rate > 0:
+        codes[rng.random(size) < missing_rate] = len(values)
+    return choices[codes]
+
+def generate_synthetic_dataset(n_rows=100_000, template=None, random_state=42, grow_cardinality=True,
+                               tail_mass=0.1, first_hasta_no=FIRST_HASTA_NO, pools=None):
+    """
+    Orijinal şemayı taklit eden sentetik veri seti üretir (benchmark ve ölçek testleri için)
+
+    Sütunlar ve tipler load_data çıktısıyla aynıdır: TedaviSuresi "15 Seans",
+    UygulamaSuresi "20 Dakika" gibi metin, liste sütunları virgülle ayrılmış
+    değerler içerir. Kayıtlar hastalara gruplanır (hasta başına ortalama ~5.5
+    kayıt); Yas, Cinsiyet, KanGrubu, Uyruk, KronikHastalik ve Alerji bir
+    hastanın tüm kayıtlarında aynıdır.
+
+    template: verilirse (örn. orijinal veri) değer frekansları ve eksik oranları
+    bu veriden alınır; verilmezse yerleşik dağılımlar kullanılır.
+    grow_cardinality=True ise TedaviAdi ve liste sütunlarının benzersiz değer
+    sayısı satır sayısıyla ~sqrt(n) büyür; yeni değerler toplam tail_mass
+    olasılık taşır. Aynı random_state ile aynı veri üretilir.
+    pools: verilirse (_build_pools çıktısı) havuzlar yeniden kurulmaz, yalnızca
+    satırlar random_state ile bu havuzlardan çekilir; template ve
+    grow_cardinality bu durumda kullanılmaz.
+    """
+    rng = np.random.default_rng(random_state)
+    if pools is None:
+        pools = _build_pools(rng, n_rows, template, grow_cardinality, tail_mass)
+
+    # Hastalar ve hasta başına kayıt sayıları
+    visits = 1 + rng.poisson(VISITS_PER_PATIENT - 1, size=n_rows)
+    n_patients = int(np.searchsorted(np.cumsum(visits), n_rows)) + 1
+    visits = visits[:n_patients]
+    visits[-1] -= visits.sum() - n_rows
+    patient_of_row = np.repeat(np.arange(n_patients), visits)
+
+    data = {'HastaNo': first_hasta_no + patient_of_row}
+    for col in COLUMN_ORDER[1:]:
+        if col == 'Yas' and col not in pools:
+            ages = np.clip(np.rint(rng.normal(47.3, 15.2, n_patients)), 2, 92).astype(np.int64)
+            data[col] = ages[patient_of_row]
+        elif col in PATIENT_COLUMNS:
+            data[col] = _sample_column(rng, pools[col], n_patients)[patient_of_row]
+        else:
+            data[col] = _sample_column(rng, pools[col], n_rows)
+
+    df = pd.DataFrame(data, columns=COLUMN_ORDER)
+    if 'Yas' in pools:
+        df['Yas'] = df['Yas'].astype(np.int64)
+    return df
+
+def write_synthetic_csv(path, n_rows, chunksize=1_000_000, template=None, random_state=42, grow_cardinality=True):
+    """
+    Sentetik veriyi parça parça CSV'ye yazar (bellekte tutulamayacak ölçekler için)
+
+    Değer havuzları toplam n_rows için bir kez kurulur (kardinalite tüm veriye
+    göre büyür, parçalar aynı değer kümesini paylaşır); her parça yalnızca
+    satır çekimi için farklı bir tohum kullanır. Hasta numaraları parçalar
+    arasında çakışmaz. full_data_cleaning_pipeline_chunked ile kullanılabilir.
+    """
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+    written = 0
+    next_hasta_no = FIRST_HASTA_NO
+    pool_seed, *seeds = np.random.SeedSequence(random_state).spawn(math.ceil(n_rows / chunksize) + 1)
+    pools = _build_pools(np.random.default_rng(pool_seed), n_rows, template, grow_cardinality, tail_mass=0.1)
+    for i, seed in enumerate(seeds):
+        size = min(chunksize, n_rows - written)
+        chunk = generate_synthetic_dataset(size, random_state=seed, first_hasta_no=next_hasta_no, pools=pools)
+        chunk.to_csv(path, mode='w' if i == 0 else 'a', header=i == 0, index=False, encoding='utf-8')
+        written += size
+        next_hasta_no = int(chunk['HastaNo'].iloc[-1]) + 1
+
+    logger.info(f"{written:,} satırlık sentetik veri {path} olarak kaydedildi")
+    return path
@@ -0,0 +1,91 @@
+import pandas as pd
+import numpy as np
+
+# Virgülle ayrılmış liste sütunları
+LIST_COLUMNS = ['KronikHastalik', 'Alerji', 'Tanilar', 'UygulamaYerleri']
+
+# "Değer yok" anlamına gelen ifadeler (küçük harf)
+NULL_TOKENS = ('yok', 'none', 'nan')
+
+def split_items(text):
+    """
+    Virgülle ayrılmış metni boş olmayan, kırpılmış parçalara ayırır
+    """
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+def parse_multi_value(value):
+    """
+    Tek bir liste değerini ayrıştırır
+
+    Döndürür: (Count, Var, Sayisi, Uzunluk, parçalar). Boş (NaN) değerler için
+    tüm sayılar 0'dır.
+    """
+    if not isinstance(value, str) and pd.isna(value):
+        return 0, 0, 0, 0, []
+
+    text = str(value)
+    items = split_items(text)
+    stripped = text.strip()
+
+    # Temizlenmiş sütunda 'Yok' boş liste anlamına gelir
+    count = len(items) if text and text != 'Yok' else 0
+    var = 1 if isinstance(value, str) and stripped and stripped.lower() not in NULL_TOKENS else 0
+    sayisi = len(items) if text.lower() not in NULL_TOKENS else 0
+    return count, var, sayisi, len(text), (items if isinstance(value, str) else [])
+
+def tokenize_multi_value_column(series):
+    """
+    Liste sütununu tek geçişte ayrıştırır
+
+    Her benzersiz değer yalnızca bir kez parçalanır; satır bazlı özellikler ve
+    parça frekansları bu ayrıştırmadan türetilir. Döndürülen sözlük:
+    - features: satır bazında Count, Var, Sayisi, Uzunluk sütunları
+    - item_counts: parça frekansları (azalan)
+    - total_items: toplam parça sayısı
+    - avg_item_length: ortalama parça uzunluğu
+    - non_null_count: boş olmayan satır sayısı
+    - codes, unique_items: satır -> benzersiz değer kodu (NaN = -1) ve her
+      benzersiz değerin parça listesi (yeniden ayrıştırmadan kodlama için)
+    """
+    codes, uniques = pd.factorize(series)
+
+    n_uniques = len(uniques)
+    count = np.zeros(n_uniques + 1, dtype=np.int64)
+    var = np.zeros(n_uniques + 1, dtype=np.int64)
+    sayisi = np.zeros(n_uniques + 1, dtype=np.int64)
+    uzunluk = np.zeros(n_uniques + 1, dtype=np.int64)
+
+    # Her benzersiz değerin satır sayısı (parça frekansları için ağırlık)
+    occurrences = np.bincount(codes[codes >= 0], minlength=n_uniques)
+    item_counts = {}
+    item_length_total = 0
+    unique_items = []
+
+    for i, value in enumerate(uniques):
+        count[i], var[i], sayisi[i], uzunluk[i], items = parse_multi_value(value)
+        unique_items.append(items)
+
+        for item in items:
+            item_counts[item] = item_counts.get(item, 0) + occurrences[i]
+            item_length_total += len(item) * occurrences[i]
+
+    # NaN satırlar (kod -1) son elemana, yani 0 değerlerine düşer
+    features = pd.DataFrame({
+        'Count': count[codes],
+        'Var': var[codes],
+        'Sayisi': sayisi[codes],
+        'Uzunluk': uzunluk[codes]
+    }, index=series.index)
+
+    item_counts = pd.Series(item_counts, dtype=np.int64).sort_values(ascending=False, kind='stable')
+    total_items = int(item_counts.sum())
+
+    return {
+        'features': features,
+        'item_counts': item_counts,
+        'total_items': total_items,
+        'avg_item_length': item_length_total / total_items if total_items > 0 else np.nan,
+        'non_null_count': int((codes >= 0).sum()),
+        'codes': codes,
+        'unique_items': unique_items
+    }
@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+# Testler depo kökünden çalıştırılmasa da src paketi içe aktarılabilsin
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_loader import (  # noqa: E402
+    clean_all_numeric_columns_advanced,
+    clean_categorical_columns,
+    clean_text_columns
+)
+from src.logging_functions import configure_logging  # noqa: E402
+from src.synthetic_functions import generate_synthetic_dataset  # noqa: E402
+
+@pytest.fixture(autouse=True)
+def _quiet_logs():
+    """
+    Aşama mesajları test çıktısını doldurmasın
+    """
+    configure_logging('WARNING')
+
+@pytest.fixture
+def work_dir(tmp_path, monkeypatch):
+    """
+    Pipeline'ların results/ çıktıları geçici klasöre yazılsın
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+@pytest.fixture(scope='session')
+def raw_data():
+    """
+    Orijinal veri setine benzer, tekrarlanabilir ham veri (eksik değerli)
+    """
+    return generate_synthetic_dataset(3000, random_state=7)
+
+@pytest.fixture(scope='session')
+def clean_data(raw_data):
+    """
+    raw_data'nın temizlenmiş hali (full_data_cleaning_pipeline aşamaları, dosya yazmadan)
+    """
+    df = clean_all_numeric_columns_advanced(raw_data)
+    df = clean_categorical_columns(df, inplace=True)
+    return clean_text_columns(df, inplace=True)
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.artifact_functions import load_pipeline_artifacts
+from src.data_loader import compute_clean_medians
+from src.preprocessing_functions import full_preprocessing_pipeline, transform_with_pipeline_state
+
+def _model_ready_features(results, index):
+    return pd.concat([results['X_train'], results['X_test']]).loc[index]
+
+@pytest.mark.parametrize('imputation', ['knn', 'tree', 'group_median'])
+def test_artifact_round_trip_reproduces_pipeline_features(raw_data, clean_data, work_dir, imputation):
+    results = full_preprocessing_pipeline(clean_data, imputation=imputation, artifacts_folder='artifacts',
+                                          clean_medians=compute_clean_medians(raw_data))
+    state = load_pipeline_artifacts('artifacts')
+    expected = _model_ready_features(results, clean_data.index)
+
+    # Temizlenmiş ve ham kayıtlar aynı özellik matrisine dönüşür
+    for df, clean_input in [(clean_data, False), (raw_data, True)]:
+        actual = transform_with_pipeline_state(df, state, clean_input=clean_input)
+        assert list(actual.columns) == results['feature_columns']
+        np.testing.assert_array_equal(actual.to_numpy(), expected.to_numpy(dtype=float))
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from src.cache_functions import StageCache
+from src.preprocessing_functions import full_preprocessing_pipeline
+
+CACHED_STAGES = ['missing_values', 'outliers', 'feature_engineering', 'encoding', 'scaling']
+
+def test_cache_hit_matches_fresh_run(clean_data, work_dir):
+    cache = StageCache(str(work_dir / 'cache'))
+    fresh = full_preprocessing_pipeline(clean_data, imputation='tree')
+    full_preprocessing_pipeline(clean_data, imputation='tree', cache=cache)
+    assert cache.misses == CACHED_STAGES
+
+    cached = full_preprocessing_pipeline(clean_data, imputation='tree', cache=cache)
+    assert cache.hits == CACHED_STAGES
+    pd.testing.assert_frame_equal(cached['full_data'], fresh['full_data'])
+    pd.testing.assert_frame_equal(cached['X_train'], fresh['X_train'])
+
+    # Yalnızca ölçekleme parametresi değişince önceki aşamalar önbellekten gelir
+    full_preprocessing_pipeline(clean_data, imputation='tree', cache=cache, scaling_method='minmax')
+    assert cache.hits == CACHED_STAGES + CACHED_STAGES[:-1]
+    assert cache.misses == CACHED_STAGES + ['scaling']
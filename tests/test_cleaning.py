@@ -0,0 +1,14 @@
+import pandas as pd
+import pytest
+
+from src.data_loader import full_data_cleaning_pipeline, full_data_cleaning_pipeline_chunked
+
+@pytest.mark.parametrize('chunksize', [700, 10_000])
+def test_chunked_cleaning_matches_in_memory(raw_data, work_dir, chunksize):
+    raw_data.to_csv('raw.csv', index=False, encoding='utf-8')
+    full_data_cleaning_pipeline(pd.read_csv('raw.csv', encoding='utf-8'))
+    result = full_data_cleaning_pipeline_chunked('raw.csv', output_file='chunked.csv', chunksize=chunksize)
+
+    assert result['rows'] == len(raw_data)
+    expected = pd.read_csv('results/cleaned_dataset.csv', encoding='utf-8')
+    pd.testing.assert_frame_equal(pd.read_csv(result['output_path'], encoding='utf-8'), expected)
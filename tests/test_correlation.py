@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda_functions import blocked_correlation
+
+def _frame(n_rows=20_000, seed=0):
+    rng = np.random.default_rng(seed)
+    a = rng.normal(5, 2, n_rows)
+    return pd.DataFrame({
+        'a': a,
+        'b': 0.5 * a + rng.normal(0, 1, n_rows),
+        'c': rng.exponential(3, n_rows) + 100,
+        'sabit': np.full(n_rows, 3.0)
+    })
+
+def _assert_matches_pandas(df, **kwargs):
+    expected = df.corr()
+    result = blocked_correlation(df, **kwargs)
+    pd.testing.assert_index_equal(result.columns, expected.columns)
+    np.testing.assert_array_equal(result.isna().to_numpy(), expected.isna().to_numpy())
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-5, equal_nan=True)
+
+def test_matches_pandas_without_missing_values():
+    _assert_matches_pandas(_frame(), block_rows=7_000)
+
+@pytest.mark.parametrize('block_rows', [7_000, 65_536])
+def test_matches_pandas_pairwise_with_missing_values(block_rows):
+    df = _frame()
+    rng = np.random.default_rng(1)
+    for rate, col in zip([0.1, 0.2, 0.3], ['a', 'b', 'c']):
+        df.loc[rng.random(len(df)) < rate, col] = np.nan
+    # Değere bağlı eksiklik: ortalamayla doldurma burada belirgin şekilde sapar
+    df.loc[df['a'] > 6, 'b'] = np.nan
+    _assert_matches_pandas(df, block_rows=block_rows)
+
+def test_pairs_without_enough_common_observations_are_nan():
+    df = pd.DataFrame({'x': [1, 2, np.nan, 4], 'y': [np.nan, 1, 1, np.nan], 'z': [1, np.nan, np.nan, 2.0]})
+    _assert_matches_pandas(df)
@@ -0,0 +1,21 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_loader import NUMERIC_COLUMNS, extract_numbers_from_text
+
+@pytest.mark.parametrize('col', list(NUMERIC_COLUMNS))
+def test_vectorized_matches_apply_on_raw_columns(raw_data, col):
+    series = raw_data[col]
+    expected = extract_numbers_from_text(series, method='apply')
+    pd.testing.assert_series_equal(extract_numbers_from_text(series), expected, check_dtype=False)
+
+def test_vectorized_matches_apply_on_edge_cases():
+    series = pd.Series([' 15 Seans', '20 Dakika', '2.5 saat', 'Seans yok', '', None, np.nan, 7, 3.5,
+                        '15 Seans', '10.', 'a1b2'], dtype=object)
+    expected = extract_numbers_from_text(series, method='apply')
+    pd.testing.assert_series_equal(extract_numbers_from_text(series), expected, check_dtype=False)
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        extract_numbers_from_text(pd.Series(['1 Seans']), method='regex')
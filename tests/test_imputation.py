@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from sklearn.impute import KNNImputer
+
+from src.preprocessing_functions import _tree_knn_impute, _tree_knn_reference
+
+def _random_values(n_rows=300, n_cols=4, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(n_rows, n_cols))
+
+def test_tree_matches_knn_imputer_single_missing_column():
+    # Tek sütunda eksiklik: KNNImputer'ın komşu adayları da eksiksiz satırlardır
+    values = _random_values()
+    values[np.random.default_rng(1).random(len(values)) < 0.2, 2] = np.nan
+
+    expected = KNNImputer(n_neighbors=5).fit_transform(values)
+    np.testing.assert_allclose(_tree_knn_impute(values), expected, rtol=1e-12)
+
+def test_tree_matches_knn_imputer_on_fully_missing_rows():
+    values = _random_values()
+    values[[3, 50, 120]] = np.nan
+
+    expected = KNNImputer(n_neighbors=5).fit_transform(values)
+    np.testing.assert_allclose(_tree_knn_impute(values), expected, rtol=1e-12)
+
+def test_tree_output_contract_on_missing_heavy_rows():
+    values = _random_values(n_rows=500, n_cols=6, seed=2)
+    mask = np.random.default_rng(3).random(values.shape) < 0.6
+    mask[:100] = False
+    values[mask] = np.nan
+
+    imputed = _tree_knn_impute(values)
+    expected = KNNImputer(n_neighbors=5).fit_transform(values)
+
+    assert imputed.shape == expected.shape
+    assert not np.isnan(imputed).any()
+    np.testing.assert_array_equal(imputed[~mask], values[~mask])
+    # Doldurulan değerler gözlenen aralıkta kalır
+    assert (imputed >= np.nanmin(values, axis=0)).all() and (imputed <= np.nanmax(values, axis=0)).all()
+
+def test_tree_fills_all_nan_column_like_keep_empty_features():
+    values = _random_values()
+    values[np.random.default_rng(4).random(len(values)) < 0.2, 0] = np.nan
+    values[:, 3] = np.nan
+
+    expected = KNNImputer(n_neighbors=5, keep_empty_features=True).fit_transform(values)
+    imputed = _tree_knn_impute(values)
+
+    assert not np.isnan(imputed).any()
+    np.testing.assert_allclose(imputed, expected, rtol=1e-12)
+
+def test_tree_reference_imputes_chunks_like_full_data():
+    values = _random_values(n_rows=400)
+    values[np.random.default_rng(5).random(values.shape) < 0.1] = np.nan
+
+    reference = _tree_knn_reference(values)
+    chunks = [_tree_knn_impute(chunk, reference=reference) for chunk in np.array_split(values, 4)]
+    np.testing.assert_array_equal(np.vstack(chunks), _tree_knn_impute(values))
+
+@pytest.mark.parametrize('imputation', ['knn', 'tree', 'group_median'])
+def test_missing_value_handler_leaves_no_numeric_nan(raw_data, imputation, work_dir):
+    from src.data_loader import full_data_cleaning_pipeline
+    from src.preprocessing_functions import advanced_missing_value_handler
+
+    clean = full_data_cleaning_pipeline(raw_data.head(1000), inplace=False)
+    imputed = advanced_missing_value_handler(clean, imputation=imputation)
+    assert not imputed.select_dtypes(include=[np.number]).isna().any().any()
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from src import incremental_functions
+from src.incremental_functions import SEEN_KEYS_FILE, incremental_update, load_incremental_state
+
+def test_new_sessions_of_known_episode_are_appended(raw_data, work_dir):
+    first, second = raw_data.iloc[:2000], raw_data.iloc[2000:]
+    incremental_update(first, state_folder='state')
+
+    # Devam eden bölümün yeni seansı: anahtar (HastaNo, TedaviAdi) aynı, satır farklı
+    new_session = first.iloc[[0]].copy()
+    new_session['UygulamaSuresi'] = '99 Dakika'
+    batch = pd.concat([second, first.iloc[:10], new_session], ignore_index=True)
+
+    result = incremental_update(batch, state_folder='state')
+
+    assert result['skipped_duplicates'] == 10
+    assert result['appended'] == len(second) + 1
+    processed = pd.read_csv(work_dir / 'state' / 'full_preprocessed_data.csv')
+    assert len(processed) == len(raw_data) + 1
+
+def test_seen_keys_match_a_full_rescan_across_updates(raw_data, work_dir):
+    batches = [raw_data.iloc[start:start + 300] for start in range(0, 3000, 300)]
+    for batch in batches:
+        incremental_update(batch, state_folder='state')
+
+    state = load_incremental_state('state')
+    assert len(state['seen_key_runs']) <= 4
+    stored = np.fromfile(work_dir / 'state' / SEEN_KEYS_FILE, dtype=np.uint64)
+    expected = np.unique(pd.util.hash_pandas_object(raw_data[sorted(raw_data.columns)], index=False).to_numpy())
+    np.testing.assert_array_equal(np.sort(stored), expected)
+
+    # Farklı parçalara düşmüş eski satırlar yeniden gelince atlanır
+    resent = pd.concat([batches[0].iloc[:5], batches[-1].iloc[:5]])
+    result = incremental_update(resent, state_folder='state')
+    assert result['skipped_duplicates'] == 10
+    assert result['appended'] == 0
+
+def test_reference_rows_are_capped(raw_data, work_dir, monkeypatch):
+    monkeypatch.setattr(incremental_functions, 'MAX_REFERENCE_ROWS', 500)
+    incremental_update(raw_data.iloc[:1000], state_folder='state')
+    result = incremental_update(raw_data.iloc[1000:], state_folder='state')
+
+    state = load_incremental_state('state')
+    assert state['reference_rows'].shape == (500, len(state['impute_columns']))
+    assert state['complete_rows_seen'] > 500
+    assert not np.isnan(result['delta'][state['impute_columns']].to_numpy(dtype=float)).any()
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing_functions import multi_hot_encoding
+from src.text_functions import LIST_COLUMNS, NULL_TOKENS, split_items
+
+def _dense_multi_hot(df, columns, min_frequency):
+    """
+    Referans: satır satır ayrıştırılıp pandas ile yoğun kurulan multi-hot tablo
+    """
+    frames = []
+    for col in columns:
+        items = df[col].map(lambda value: split_items(value) if isinstance(value, str) else []).explode().dropna()
+        counts = items.value_counts()
+        vocabulary = [item for item in counts.index
+                      if counts[item] >= min_frequency and item.lower() not in NULL_TOKENS]
+        items = items[items.isin(vocabulary)]
+        dense = pd.crosstab(items.index, items).clip(upper=1)
+        dense = dense.reindex(index=df.index, columns=vocabulary, fill_value=0)
+        frames.append(dense.add_prefix(f'{col}_item_'))
+    return pd.concat(frames, axis=1)
+
+@pytest.mark.parametrize('min_frequency', [1, 20])
+def test_sparse_matches_dense(raw_data, min_frequency):
+    matrix, feature_names = multi_hot_encoding(raw_data, min_frequency=min_frequency)
+    expected = _dense_multi_hot(raw_data, LIST_COLUMNS, min_frequency)
+
+    assert sorted(feature_names) == sorted(expected.columns)
+    actual = pd.DataFrame(matrix.toarray(), index=raw_data.index, columns=feature_names)
+    np.testing.assert_array_equal(actual[expected.columns].to_numpy(), expected.to_numpy())
@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from src.preprocessing_functions import advanced_missing_value_handler, outlier_detection_and_treatment
+
+@pytest.fixture(scope='module')
+def imputed_data(clean_data):
+    return advanced_missing_value_handler(clean_data, imputation='tree')
+
+@pytest.mark.parametrize('method', ['iqr', 'zscore'])
+@pytest.mark.parametrize('data', ['clean_data', 'imputed_data'])
+def test_vectorized_matches_per_column_bounds(request, data, method):
+    df = request.getfixturevalue(data)
+    expected, expected_info = outlier_detection_and_treatment(df, method=method, vectorized=False)
+    actual, info = outlier_detection_and_treatment(df, method=method)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert info == expected_info
+
+def test_vectorized_matches_per_column_with_given_quartiles(imputed_data):
+    quartiles = {'Yas': (30.0, 60.0)}
+    expected, expected_info = outlier_detection_and_treatment(imputed_data, vectorized=False, quartiles=quartiles)
+    actual, info = outlier_detection_and_treatment(imputed_data, quartiles=quartiles)
+
+    pd.testing.assert_frame_equal(actual, expected)
+    assert info == expected_info
+    assert info['Yas']['bounds'] == (-15.0, 105.0)
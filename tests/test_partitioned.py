@@ -0,0 +1,20 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.benchmark_functions import _single_process_preprocessing
+from src.preprocessing_functions import PARTITION_SCALE_TOLERANCE, partitioned_preprocessing
+
+@pytest.mark.parametrize('partition_by', ['Bolum', 'hash'])
+def test_partitioned_matches_single_process(clean_data, partition_by):
+    expected, expected_outliers, expected_encoding, scaler = _single_process_preprocessing(clean_data,
+                                                                                           imputation='tree')
+    actual, outlier_info, encoding_info, _, _ = partitioned_preprocessing(clean_data, partition_by=partition_by,
+                                                                          n_partitions=4)
+
+    scaled = list(scaler.feature_names_in_)
+    pd.testing.assert_frame_equal(actual.drop(columns=scaled), expected.drop(columns=scaled))
+    np.testing.assert_allclose(actual[scaled].to_numpy(dtype=float), expected[scaled].to_numpy(dtype=float),
+                               rtol=PARTITION_SCALE_TOLERANCE, atol=PARTITION_SCALE_TOLERANCE)
+    assert outlier_info == expected_outliers
+    assert repr(encoding_info) == repr(expected_encoding)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+from src.sketch_functions import (
+    build_category_sketches,
+    build_quantile_sketches,
+    merge_category_sketches,
+    merge_quantile_sketches
+)
+
+def test_merge_quantile_sketches_keeps_inputs():
+    rng = np.random.default_rng(0)
+    parts = [pd.DataFrame({'x': rng.normal(size=500)}) for _ in range(3)]
+    sketch_dicts = [build_quantile_sketches(part) for part in parts]
+    sizes = [sketches['x'].n for sketches in sketch_dicts]
+
+    merged = merge_quantile_sketches(sketch_dicts)
+
+    assert [sketches['x'].n for sketches in sketch_dicts] == sizes
+    assert merged['x'] is not sketch_dicts[0]['x']
+    assert merged['x'].n == 1500
+
+def test_exact_quantile_sketch_matches_pandas():
+    # k kapasitesini aşmayan veride sıkıştırma olmaz, sonuç kesindir
+    values = pd.Series(np.random.default_rng(1).integers(0, 50, 200), dtype=float)
+    merged = merge_quantile_sketches([build_quantile_sketches(values.iloc[start:start + 50].to_frame('x'))
+                                      for start in range(0, 200, 50)])
+    assert merged['x'].is_exact
+    assert merged['x'].median() == values.median()
+
+def test_merge_category_sketches_keeps_inputs():
+    rng = np.random.default_rng(2)
+    parts = [pd.DataFrame({'c': rng.choice(list('abcdefghij'), 300)}) for _ in range(3)]
+    sketch_dicts = [build_category_sketches(part) for part in parts]
+    before = [(sketches['c'].n, sketches['c'].frequencies.table.copy(), sketches['c'].top(5).to_dict())
+              for sketches in sketch_dicts]
+
+    merged = merge_category_sketches(sketch_dicts)
+
+    for sketches, (n, table, top) in zip(sketch_dicts, before):
+        assert sketches['c'].n == n
+        np.testing.assert_array_equal(sketches['c'].frequencies.table, table)
+        assert sketches['c'].top(5).to_dict() == top
+    assert merged['c'].n == 900
+
+def test_merged_category_sketch_matches_exact_counts():
+    rng = np.random.default_rng(3)
+    values = pd.Series(rng.choice(list('abcdefghij'), 1200, p=np.linspace(2, 0.2, 10) / 11))
+    merged = merge_category_sketches([build_category_sketches(values.iloc[start:start + 300].to_frame('c'))
+                                      for start in range(0, 1200, 300)])
+    exact = values.value_counts()
+
+    assert merged['c'].distinct_count() == values.nunique()
+    assert merged['c'].top(3).index.tolist() == exact.head(3).index.tolist()
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.preprocessing_functions import full_preprocessing_pipeline, transform_with_pipeline_state
+from src.preprocessing_transformer import SMALL_BATCH_SIZE, PreprocessingTransformer
+
+@pytest.fixture(scope='module', params=['knn', 'tree', 'group_median'])
+def fitted(request, clean_data, tmp_path_factory, monkeypatch_module):
+    monkeypatch_module.chdir(tmp_path_factory.mktemp('pipeline'))
+    results = full_preprocessing_pipeline(clean_data, imputation=request.param, artifacts_folder='artifacts')
+    transformer = PreprocessingTransformer(imputation=request.param).fit(clean_data)
+    expected = pd.concat([results['X_train'], results['X_test']]).loc[clean_data.index]
+    return results, transformer, expected
+
+@pytest.fixture(scope='module')
+def monkeypatch_module():
+    with pytest.MonkeyPatch.context() as patch:
+        yield patch
+
+def test_transformer_matches_pipeline_features(fitted, clean_data):
+    results, transformer, expected = fitted
+    actual = transformer.transform_frame(clean_data)
+
+    assert list(actual.columns) == results['feature_columns']
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9)
+
+@pytest.mark.parametrize('batch_size', [1, 7, SMALL_BATCH_SIZE, SMALL_BATCH_SIZE + 1])
+def test_micro_batches_match_full_batch(fitted, clean_data, batch_size):
+    _, transformer, expected = fitted
+    rows = clean_data.iloc[:300]
+    actual = np.vstack([transformer.transform(rows.iloc[start:start + batch_size])
+                        for start in range(0, len(rows), batch_size)])
+
+    np.testing.assert_allclose(actual, expected.iloc[:300].to_numpy(dtype=float), rtol=1e-9, atol=1e-9)
+
+def test_records_match_frame(fitted, clean_data):
+    _, transformer, expected = fitted
+    rows = clean_data.iloc[:20]
+    records = rows.to_dict(orient='records')
+
+    np.testing.assert_allclose(transformer.transform(records), expected.iloc[:20].to_numpy(dtype=float),
+                               rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(transformer.transform(records[0]), expected.iloc[:1].to_numpy(dtype=float),
+                               rtol=1e-9, atol=1e-9)
+
+def test_unseen_categories_match_reference_path(fitted, clean_data):
+    results, transformer, _ = fitted
+    rows = clean_data.iloc[:10].copy()
+    for col in results['encoding_info']:
+        if col in rows.columns:
+            rows[col] = rows[col].astype(object)
+            rows.iloc[::2, rows.columns.get_loc(col)] = f'Yeni_{col}'
+
+    expected = transform_with_pipeline_state(rows, results)
+    actual = transformer.transform_frame(rows)
+
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9)
+
+def test_unseen_binary_label_is_minus_one_in_both_paths(clean_data, work_dir):
+    # İki değerli Cinsiyet label kodlanır; eğitimde olmayan 'Bilinmiyor' -1 olmalı
+    df = clean_data.copy()
+    df['Cinsiyet'] = df['Cinsiyet'].where(df['Cinsiyet'] != 'Bilinmiyor', 'Kadın')
+    results = full_preprocessing_pipeline(df, imputation='tree', artifacts_folder='artifacts')
+    assert results['encoding_info']['Cinsiyet']['type'] == 'label'
+    transformer = PreprocessingTransformer(imputation='tree').fit(df)
+
+    rows = clean_data.iloc[:10].copy()
+    rows['Cinsiyet'] = 'Bilinmiyor'
+    expected = transform_with_pipeline_state(rows, results)
+    actual = transformer.transform_frame(rows)
+
+    assert (expected['Cinsiyet_encoded'] == -1).all()
+    np.testing.assert_allclose(actual.to_numpy(), expected.to_numpy(dtype=float), rtol=1e-9, atol=1e-9)